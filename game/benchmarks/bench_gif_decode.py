@@ -0,0 +1,52 @@
+# bench_gif_decode.py
+# Compare the original PIL decode/rotate/tobytes upload with the NumPy array path.
+# Run from the game directory: python benchmarks/bench_gif_decode.py
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from kivy.core.window import Window  # Creates the GL context needed for uploads
+from components.gif_loader import GifLoader
+
+GIFS = ['assets/gifs/boss.gif', 'assets/gifs/portal.gif']
+ROUNDS = 10
+
+def best_of(func, rounds=ROUNDS):
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times), sum(times) / len(times)
+
+def pil_decode(path):
+    return GifLoader.decode_gif_frames(path)
+
+def pil_upload(frames):
+    return GifLoader.create_textures(frames)
+
+def array_decode(path):
+    return GifLoader.decode_gif_array(path)
+
+def array_upload(frames):
+    return GifLoader.create_textures(frames)
+
+def main():
+    print(f"{'gif':<24}{'stage':<10}{'pil best/mean ms':>20}{'numpy best/mean ms':>22}")
+    for path in GIFS:
+        pil_frames = pil_decode(path)
+        array_frames = array_decode(path)
+        rows = [
+            ('decode', best_of(lambda: pil_decode(path)), best_of(lambda: array_decode(path))),
+            ('upload', best_of(lambda: pil_upload(pil_frames)), best_of(lambda: array_upload(array_frames))),
+            ('total', best_of(lambda: pil_upload(pil_decode(path))), best_of(lambda: array_upload(array_decode(path)))),
+        ]
+        for stage, (pil_best, pil_mean), (np_best, np_mean) in rows:
+            print(f"{os.path.basename(path):<24}{stage:<10}"
+                  f"{pil_best * 1000:>10.2f}/{pil_mean * 1000:<9.2f}"
+                  f"{np_best * 1000:>12.2f}/{np_mean * 1000:<9.2f}")
+
+if __name__ == '__main__':
+    main()
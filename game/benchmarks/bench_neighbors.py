@@ -0,0 +1,66 @@
+# bench_neighbors.py
+# Enemy separation at 10, 100 and 500 enemies: World.separate_enemies and its grid neighbor query
+# against checking every pair, which is what each enemy's AI tick used to do.
+# Run from the game directory: python benchmarks/bench_neighbors.py
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from components.world import World
+from components.bodies import EnemyBody, FlyingEnemyBody
+
+COUNTS = (10, 100, 500)
+TICKS = 200
+
+def all_pairs(enemies, radius):
+    """Every unordered pair closer than radius, checked one by one."""
+    pairs = set()
+    for i, enemy in enumerate(enemies):
+        for j in range(i + 1, len(enemies)):
+            other = enemies[j]
+            if math.hypot(other.x - enemy.x, other.y - enemy.y) < radius:
+                pairs.add((i, j))
+    return pairs
+
+def populate(count):
+    world = World(seed=1)
+    rng = random.Random(2)
+    for enemy in world.enemies[:]:
+        world.remove_enemy(enemy)
+    for i in range(count):
+        enemy_class = FlyingEnemyBody if i % 3 == 0 else EnemyBody
+        world.add_enemy(enemy_class(rng.uniform(0, world.width - 80), rng.uniform(0, world.height - 80),
+                                    80, 80, rng=rng))
+    return world
+
+def main():
+    for count in COUNTS:
+        world = populate(count)
+        radius = world.SEPARATION * 80
+        start = time.perf_counter()
+        for _ in range(TICKS):
+            world.separate_enemies()
+        grid_time = (time.perf_counter() - start) / TICKS
+
+        world = populate(count)
+        enemies = world.enemies
+        start = time.perf_counter()
+        for _ in range(TICKS):
+            pairs = all_pairs(enemies, radius)
+        pairs_time = (time.perf_counter() - start) / TICKS
+
+        i, j = world.enemy_grid.neighbors(*(world.physics.x[[e.row for e in enemies]],
+                                            world.physics.y[[e.row for e in enemies]]), radius)
+        found = set(zip(i.tolist(), j.tolist()))
+        stats = world.enemy_grid.stats()
+        print(f"{count:>4} enemies: separate_enemies {grid_time * 1e3:7.3f} ms, all-pairs search alone "
+              f"{pairs_time * 1e3:8.3f} ms; {len(found)} neighbor pairs "
+              f"({'same' if found == pairs else 'DIFFERENT'} as all-pairs), "
+              f"{stats['last_candidate_pairs']} grid candidates of {count * (count - 1) // 2} pairs")
+
+if __name__ == '__main__':
+    main()
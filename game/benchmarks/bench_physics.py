@@ -0,0 +1,39 @@
+# bench_physics.py
+# Time World's vectorized physics pass (gravity, movement, bounds, platform landing)
+# with growing enemy counts. Run from the game directory: python benchmarks/bench_physics.py
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from components.world import World
+from components.bodies import EnemyBody, FlyingEnemyBody
+
+COUNTS = (1, 10, 100, 500)
+TICKS = 2000
+DT = 1.0 / 60.0
+
+def main():
+    for count in COUNTS:
+        world = World(seed=1)
+        rng = random.Random(2)
+        for enemy in world.enemies[:]:
+            world.remove_enemy(enemy)
+        for i in range(count):
+            enemy_class = FlyingEnemyBody if i % 3 == 0 else EnemyBody
+            world.add_enemy(enemy_class(rng.uniform(0, world.width - 80), rng.uniform(0, world.height - 80),
+                                        80, 80, rng=rng))
+        start = time.perf_counter()
+        for _ in range(TICKS):
+            world.physics.snap()
+            world.update_physics(DT)
+        elapsed = (time.perf_counter() - start) / TICKS
+        stats = world.physics.stats()
+        print(f"{count:>4} enemies: {elapsed * 1e6:8.1f} us/tick ({elapsed / DT * 100:.2f}% of a 60 Hz tick), "
+              f"{stats['contact_hits']} contact hits, {stats['index_queries']} index queries "
+              f"returning {stats['index_candidates']} candidates")
+
+if __name__ == '__main__':
+    main()
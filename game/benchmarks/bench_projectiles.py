@@ -0,0 +1,48 @@
+# bench_projectiles.py
+# Bullet-hell load on the World's projectile arrays: keep N enemy shots alive in rings
+# around the window center while the player fires into them, and time the attacks pass
+# and the Mesh vertex build per tick.
+# Run from the game directory: python benchmarks/bench_projectiles.py
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from components.world import World
+
+COUNTS = (100, 1000, 5000)
+TICKS = 600
+DT = 1.0 / 60.0
+
+def main():
+    for count in COUNTS:
+        world = World(seed=1, initial_player_hp=10 ** 9)
+        shots = world.projectiles
+        center = (world.width / 2, world.height / 2)
+        vertices = np.zeros((count * 2, 4, 4), dtype=np.float32)
+        attacks_time = vertex_time = 0.0
+        for tick in range(TICKS):
+            # Top the rings back up to count live shots
+            missing = count - shots.count
+            for i in range(missing):
+                angle = 2 * math.pi * (tick * 7 + i) / max(missing, 1)
+                world.add_enemy_projectile(center, (center[0] + math.cos(angle), center[1] + math.sin(angle)))
+            world.shoot(center)
+            shots.snap()
+            start = time.perf_counter()
+            world.update_attacks(DT)
+            attacks_time += time.perf_counter() - start
+            start = time.perf_counter()
+            shots.quad_vertices(0.5, out=vertices[:shots.count])
+            vertex_time += time.perf_counter() - start
+        print(f"{count:>5} shots: attacks {attacks_time / TICKS * 1e3:6.3f} ms/tick, "
+              f"mesh vertices {vertex_time / TICKS * 1e3:6.3f} ms/frame "
+              f"({shots.spawned} spawned, {shots.removed} removed)")
+        print(world.broadphase_report())
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+# bench_rects.py
+# Count hitbox rect objects created per World tick under the bench_world script.
+# Run from the game directory: python benchmarks/bench_rects.py [ticks] [--baseline]
+# --baseline builds a new Rect for every hitbox query, as the per-call dicts did before
+# rects were reused, so both figures come from the same tree.
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from components import hitbox
+from components.bodies import Body
+from components.physics import PhysicsStore
+from components.world import World
+from bench_world import scripted_input, DT
+
+TICKS = 5000
+
+class RectCounter:
+    """Counts Rect objects built, by wrapping the class for the duration of the run."""
+
+    def __init__(self):
+        self.created = 0
+        self.calls = 0
+        original_init = hitbox.Rect.__init__
+        original_get_rect = hitbox.Hitbox.get_rect
+        counter = self
+
+        def counting_init(rect, *args, **kwargs):
+            counter.created += 1
+            original_init(rect, *args, **kwargs)
+
+        def counting_get_rect(box, parent_x, parent_y, out=None):
+            counter.calls += 1
+            return original_get_rect(box, parent_x, parent_y, out)
+
+        hitbox.Rect.__init__ = counting_init
+        hitbox.Hitbox.get_rect = counting_get_rect
+
+def allocate_per_call():
+    """Make every hitbox query build a fresh Rect: no out argument, no per-body cache, no scratch rect."""
+    original_get_rect = hitbox.Hitbox.get_rect
+    hitbox.Hitbox.get_rect = lambda box, parent_x, parent_y, out=None: original_get_rect(box, parent_x, parent_y)
+    Body.get_hitbox_rect = lambda body: body.hitbox.get_rect(body.x, body.y)
+    PhysicsStore.scratch = property(lambda store: hitbox.Rect(), lambda store, value: None)
+
+def main():
+    args = [arg for arg in sys.argv[1:] if arg != '--baseline']
+    baseline = '--baseline' in sys.argv[1:]
+    ticks = int(args[0]) if args else TICKS
+    if baseline:
+        allocate_per_call()
+    world = World(seed=1, initial_player_hp=10 ** 6)
+    counter = RectCounter()
+    for tick in range(ticks):
+        scripted_input(world, tick)
+        world.step(DT)
+        world.drain_events()
+        if not world.active:
+            world.reset()
+    print(f"{ticks} ticks{' (baseline)' if baseline else ''}: {counter.created / ticks:.2f} Rect objects and "
+          f"{counter.calls / ticks:.2f} Hitbox.get_rect refreshes per tick")
+
+if __name__ == '__main__':
+    main()
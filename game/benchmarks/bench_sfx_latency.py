@@ -0,0 +1,62 @@
+# bench_sfx_latency.py
+# Measure how long Sound.play() blocks for each effect as MusicManager resolves it,
+# with the transcode cache bypassed (the original MP3s) and with it in use (cached WAVs).
+# Run from the game directory: python benchmarks/bench_sfx_latency.py [--no-cache]
+# --no-cache measures only the bypassed path, e.g. for a before figure on a machine with ffmpeg.
+import os
+import sys
+import time
+
+os.environ['KIVY_NO_ARGS'] = '1'
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from kivy.core.audio import SoundLoader
+from components.music_manager import MusicManager
+
+ROUNDS = 20
+EFFECTS = ['shoot_sound', 'jump_sound', 'spawn_sound']
+
+def play_latency(sound, rounds=ROUNDS):
+    times = []
+    for _ in range(rounds):
+        sound.stop()
+        start = time.perf_counter()
+        sound.play()
+        times.append(time.perf_counter() - start)
+    sound.stop()
+    return sum(times) / len(times), max(times)
+
+def measure(name, cached):
+    """Mean and max play() latency of name as the game would load it, or None if it does not load."""
+    MusicManager.audio_cache.enabled = cached
+    try:
+        sound = SoundLoader.load(MusicManager.resolve_file(name))
+    finally:
+        MusicManager.audio_cache.enabled = True
+    if sound is None:
+        return None
+    try:
+        return play_latency(sound)
+    finally:
+        sound.unload()
+
+def main():
+    modes = [('cache bypassed', False)]
+    if '--no-cache' not in sys.argv[1:]:
+        modes.append(('cached', True))
+        if not MusicManager.audio_cache.ffmpeg:
+            print("ffmpeg not found: the cached column plays the same compressed files")
+    print(f"{'effect':<16}" + ''.join(f"{label + ' mean/max ms':>30}" for label, _ in modes))
+    for name in EFFECTS:
+        columns = []
+        for _, cached in modes:
+            result = measure(name, cached)
+            if result is None:
+                columns.append(f"{'n/a':>30}")
+            else:
+                mean, worst = result
+                columns.append(f"{mean * 1000:>22.3f}/{worst * 1000:<7.3f}")
+        print(f"{name:<16}" + ''.join(columns))
+
+if __name__ == '__main__':
+    main()
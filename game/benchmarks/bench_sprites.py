@@ -0,0 +1,66 @@
+# bench_sprites.py
+# Render Game frames with hitbox debug drawing on and count canvas instruction churn and bindings.
+# Run from the game directory: python benchmarks/bench_sprites.py [frames]
+# Uses Kivy's mock GL backend, so no window or GPU is needed.
+import os
+import sys
+import time
+
+os.environ.setdefault('KIVY_GL_BACKEND', 'mock')
+os.environ['KIVY_NO_ARGS'] = '1'
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from kivy.lang import Builder
+from kivy.core.window import Window
+from kivy.graphics import InstructionGroup
+
+FRAMES = 600
+
+def instructions(canvas):
+    """Every instruction under canvas (and its before/after canvases), depth first."""
+    found = []
+    stack = [canvas]
+    for attr in ('before', 'after'):
+        if getattr(canvas, attr, None) is not None:
+            stack.append(getattr(canvas, attr))
+    while stack:
+        group = stack.pop()
+        for instruction in group.children:
+            found.append(instruction)
+            if isinstance(instruction, InstructionGroup):
+                stack.append(instruction)
+    return found
+
+def snapshot(game):
+    """Body -> (ids of the instructions drawing its sprite, pos/size observers on the sprite)."""
+    return {body: ({id(instruction) for instruction in instructions(sprite.canvas)},
+                   len(sprite.get_property_observers('pos')) + len(sprite.get_property_observers('size')))
+            for body, sprite in game.sprites.items()}
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else FRAMES
+    Builder.load_file('dino.kv')
+    from components.game import Game
+    game = Game(seed=1, initial_player_hp=10 ** 6)
+    Window.add_widget(game)
+    game.debug_hitbox = True
+    game.update_hitbox_visibility()
+    for _ in range(10):
+        game.update(1 / 60)
+    before = snapshot(game)
+    start = time.perf_counter()
+    for _ in range(frames):
+        game.update(1 / 60)
+    elapsed = time.perf_counter() - start
+    after = snapshot(game)
+    kept = [body for body in before if body in after]
+    created = sum(len(after[body][0] - before[body][0]) for body in kept)
+    observers_before = sum(before[body][1] for body in kept)
+    observers_after = sum(after[body][1] for body in kept)
+    print(f"{frames} frames in {elapsed:.2f}s ({elapsed / frames * 1000:.3f} ms/frame), {len(kept)} sprites throughout")
+    print(f"instructions created on those sprites: {created} ({created / frames:.2f} per frame)")
+    print(f"pos/size observers on those sprites: {observers_before} -> {observers_after}")
+    game.dispose()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+# bench_startup.py
+# Import main.py the way a launch does and check the menu path against the startup budget.
+# Run from the game directory: python benchmarks/bench_startup.py
+# Exits non-zero when imports exceed the budget or a gameplay module loads eagerly.
+import os
+import subprocess
+import sys
+
+GAME_DIR = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, GAME_DIR)
+
+from components.startup import GAMEPLAY_MODULES, StartupReport
+
+TOP = 10
+
+def import_times():
+    """Return {module: cumulative import seconds} from python -X importtime."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import main'],
+                            cwd=GAME_DIR, capture_output=True, text=True,
+                            env=dict(os.environ, KIVY_NO_ARGS='1'))
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = [part.strip() for part in line[len('import time:'):].split('|')]
+        times[name] = int(cumulative) / 1e6
+    return times
+
+def main():
+    times = import_times()
+    total = times.get('main', 0.0)
+    print(f"import main: {total:.3f}s (budget {StartupReport.BUDGET:.2f}s to first frame)")
+    print(f"{'module':<40}{'cumulative s':>14}")
+    for name, seconds in sorted(times.items(), key=lambda item: item[1], reverse=True)[:TOP]:
+        print(f"{name:<40}{seconds:>14.3f}")
+    eager = [name for name in GAMEPLAY_MODULES if name in times]
+    if eager:
+        print(f"gameplay modules imported by main: {', '.join(eager)}")
+    return 0 if total <= StartupReport.BUDGET and not eager else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,45 @@
+# bench_world.py
+# Run the World simulation headless (no Kivy) with scripted input and report ticks per second.
+# Run from the game directory: python benchmarks/bench_world.py [ticks]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from components.world import World
+
+TICKS = 20000
+DT = 1.0 / 60.0
+
+def scripted_input(world, tick):
+    """Walk back and forth, jump and shoot at the nearest enemy on a fixed rhythm."""
+    if tick % 120 == 0:
+        world.walk(1 if (tick // 120) % 2 == 0 else -1)
+    if tick % 45 == 0:
+        world.jump()
+    targets = world.enemies or ([world.boss] if world.boss else [])
+    if tick % 10 == 0 and targets and world.player:
+        target = min(targets, key=lambda enemy: abs(enemy.x - world.player.x))
+        world.shoot((target.center_x, target.center_y))
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else TICKS
+    world = World(seed=1, initial_player_hp=10 ** 6)
+    start = time.perf_counter()
+    for tick in range(ticks):
+        scripted_input(world, tick)
+        world.step(DT)
+        world.drain_events()
+        if not world.active:
+            world.reset()
+    elapsed = time.perf_counter() - start
+    print(f"{ticks} ticks in {elapsed:.2f}s: {ticks / elapsed:.0f} ticks/s "
+          f"({ticks * DT / elapsed:.0f}x real time), stage {world.stage_number}, score {world.score}")
+    print(f"kivy imported: {'kivy' in sys.modules}")
+    print(world.systems.report())
+    print(world.broadphase_report())
+    print(f"enemy pool: {world.enemy_pool.stats()}")
+
+if __name__ == '__main__':
+    main()
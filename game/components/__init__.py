@@ -1,7 +1,22 @@
-from .attack import Attack, ProjectileAttack, EnemyProjectile
-from .player import Player, Character
-from .dino import Dino
-from .enemy import Enemy
-from .obstacle import Obstacle
-from .platform import Platform
-from .powerup import SpeedPowerUp, ShieldPowerUp, AmmoPowerUp, HealthPowerUp, ScorePowerUp
\ No newline at end of file
+# Components are imported on first attribute access so that importing one
+# submodule (e.g. components.gif_loader for the menu) does not load gameplay.
+import importlib
+
+_EXPORTS = {
+    'ProjectileLayer': '.attack',
+    'Player': '.player', 'Character': '.player',
+    'Dino': '.dino',
+    'Enemy': '.enemy',
+    'Obstacle': '.obstacle',
+    'Platform': '.platform',
+    'World': '.world',
+    'SpeedPowerUp': '.powerup', 'ShieldPowerUp': '.powerup', 'AmmoPowerUp': '.powerup',
+    'HealthPowerUp': '.powerup', 'ScorePowerUp': '.powerup',
+}
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+
+__all__ = list(_EXPORTS)
@@ -0,0 +1,187 @@
+# asset_cache.py
+import numpy as np
+import hashlib
+import os
+import shutil
+import struct
+import subprocess
+import time
+from typing import Optional
+
+# Header: magic, version, source mtime (ns), source size, source sha1, frame count, width, height
+HEADER = struct.Struct('<4sHqq20sIII')
+MAGIC = b'GIFB'
+VERSION = 2
+
+class BakedGifCache:
+    """On-disk cache of decoded, pre-oriented RGBA GIF frames.
+
+    Each baked file holds a small header followed by the raw RGBA pixels of
+    every frame, so loading is a single read viewed as a NumPy array.
+    Files are validated against the source mtime and size, falling back to a
+    sha1 of the source when only the timestamp changed (e.g. after a checkout).
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.dirname(__file__), '..', '.cache', 'gifs')
+        self.cache_dir = os.path.normpath(cache_dir)
+        self.enabled = True
+        self.decode_time = 0.0
+        self.read_time = 0.0
+        self.decodes = 0
+        self.reads = 0
+
+    def cache_path(self, source_path: str) -> str:
+        name = os.path.normpath(source_path).replace(os.sep, '_').replace('.', '_')
+        return os.path.join(self.cache_dir, name + '.bin')
+
+    @staticmethod
+    def source_hash(source_path: str) -> bytes:
+        with open(source_path, 'rb') as f:
+            return hashlib.sha1(f.read()).digest()
+
+    def read(self, source_path: str) -> Optional[np.ndarray]:
+        """Return the baked frames for source_path, or None if missing or stale."""
+        if not self.enabled:
+            return None
+        path = self.cache_path(source_path)
+        if not os.path.exists(path):
+            return None
+        start = time.perf_counter()
+        try:
+            # Read into a writable buffer; Texture.blit_buffer rejects read-only views
+            data = bytearray(os.path.getsize(path))
+            with open(path, 'rb') as f:
+                f.readinto(data)
+            magic, version, mtime_ns, size, digest, frame_count, width, height = HEADER.unpack_from(data, 0)
+            if magic != MAGIC or version != VERSION:
+                return None
+            stat = os.stat(source_path)
+            if (mtime_ns, size) != (stat.st_mtime_ns, stat.st_size):
+                if size != stat.st_size or digest != self.source_hash(source_path):
+                    return None
+                # Same content under a new timestamp; refresh the header in place
+                with open(path, 'r+b') as f:
+                    f.write(HEADER.pack(MAGIC, VERSION, stat.st_mtime_ns, size, digest,
+                                        frame_count, width, height))
+            # A view over the file bytes; no per-frame copies
+            frames = np.frombuffer(data, dtype=np.uint8, count=frame_count * height * width * 4,
+                                   offset=HEADER.size).reshape(frame_count, height, width, 4)
+            self.reads += 1
+            return frames
+        except (OSError, struct.error, ValueError) as e:
+            print(f"BakedGifCache: ignoring unreadable cache for {source_path}: {e}")
+            return None
+        finally:
+            self.read_time += time.perf_counter() - start
+
+    def write(self, source_path: str, frames: np.ndarray):
+        """Bake frames for source_path; failures only cost the next load a decode."""
+        if not self.enabled:
+            return
+        path = self.cache_path(source_path)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            stat = os.stat(source_path)
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                frame_count, height, width, _ = frames.shape
+                f.write(HEADER.pack(MAGIC, VERSION, stat.st_mtime_ns, stat.st_size,
+                                    self.source_hash(source_path), frame_count, width, height))
+                f.write(memoryview(np.ascontiguousarray(frames)).cast('B'))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"BakedGifCache: could not write {path}: {e}")
+
+    def add_decode_time(self, seconds: float):
+        self.decode_time += seconds
+        self.decodes += 1
+
+    def stats(self):
+        return {
+            'decodes': self.decodes,
+            'decode_time': self.decode_time,
+            'cache_reads': self.reads,
+            'cache_read_time': self.read_time,
+        }
+
+class AudioTranscodeCache:
+    """Cache of short sound effects transcoded to 16-bit PCM WAV.
+
+    Compressed effects pay a decode on some audio providers each time they
+    play; WAV copies start immediately. Transcoding uses ffmpeg when it is on
+    PATH, otherwise the original file is used unchanged. A cached WAV is valid
+    while it is newer than its source.
+    """
+    ffmpeg_warned = False  # The missing-ffmpeg message is printed once per process
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.dirname(__file__), '..', '.cache', 'audio')
+        self.cache_dir = os.path.normpath(cache_dir)
+        self.ffmpeg = shutil.which('ffmpeg')
+        self.enabled = True
+        self.transcodes = 0
+        self.transcode_time = 0.0
+
+    def cache_path(self, source_path: str) -> str:
+        # The whole path, extension included, so same-named sources never share a WAV
+        name = os.path.normpath(source_path).replace(os.sep, '_').replace('.', '_')
+        return os.path.join(self.cache_dir, name + '.wav')
+
+    def resolve(self, source_path: str) -> str:
+        """Return the path to load for source_path, transcoding it first if needed."""
+        if not self.enabled:
+            return source_path
+        path = self.cache_path(source_path)
+        try:
+            if os.path.getmtime(path) >= os.path.getmtime(source_path):
+                return path
+        except OSError:
+            pass
+        if not self.ffmpeg:
+            if not AudioTranscodeCache.ffmpeg_warned:
+                AudioTranscodeCache.ffmpeg_warned = True
+                print("AudioTranscodeCache: ffmpeg not found, sound effects stay compressed")
+            return source_path
+        if not os.path.exists(source_path):
+            return source_path
+        start = time.perf_counter()
+        tmp_path = path + '.tmp.wav'
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            subprocess.run([self.ffmpeg, '-v', 'error', '-y', '-i', source_path,
+                            '-acodec', 'pcm_s16le', '-ar', '44100', tmp_path],
+                           check=True, timeout=30)
+            os.replace(tmp_path, path)
+        except (OSError, subprocess.SubprocessError) as e:
+            print(f"AudioTranscodeCache: keeping {source_path} compressed: {e}")
+            return source_path
+        finally:
+            self.transcode_time += time.perf_counter() - start
+        self.transcodes += 1
+        return path
+
+def bake_all(gif_dir: Optional[str] = None):
+    """Bake every GIF under gif_dir and transcode the sound effects ahead of the first launch."""
+    from .gif_loader import GifLoader
+    if gif_dir is None:
+        gif_dir = os.path.join('assets', 'gifs')
+    for name in sorted(os.listdir(gif_dir)):
+        if not name.endswith('.gif'):
+            continue
+        GifLoader.load_gif_array(os.path.join(gif_dir, name))
+    stats = GifLoader.baked_cache.stats()
+    print(f"Baked GIFs: {stats['decodes']} decoded in {stats['decode_time']:.3f}s, "
+          f"{stats['cache_reads']} already current ({stats['cache_read_time']:.3f}s)")
+
+    from .music_manager import MusicManager
+    audio_cache = MusicManager.audio_cache
+    for name in MusicManager.EFFECT_VOLUMES:
+        MusicManager.resolve_file(name)
+    print(f"Transcoded effects: {audio_cache.transcodes} in {audio_cache.transcode_time:.3f}s"
+          + ('' if audio_cache.ffmpeg else ' (ffmpeg not found, effects stay compressed)'))
+
+if __name__ == '__main__':
+    bake_all()
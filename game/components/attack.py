@@ -1,60 +1,48 @@
 from kivy.uix.widget import Widget
-from kivy.properties import NumericProperty, ReferenceListProperty, ObjectProperty
-from kivy.vector import Vector
-import math
-from .hitbox import Hitbox
+from kivy.graphics import Color, Mesh
+import numpy as np
 
-class Attack(Widget):
-    velocity_x = NumericProperty(0)
-    velocity_y = NumericProperty(0)
-    velocity = ReferenceListProperty(velocity_x, velocity_y)
-    attack_rotation = NumericProperty(0)
-    hitbox = ObjectProperty(None)
+class ProjectileLayer(Widget):
+    """Draws every shot in a ProjectileStore as one yellow Mesh of rotated quads.
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.hitbox = Hitbox(offset_x=0, offset_y=0, width=self.size[0], height=self.size[1])
-        # Removed canvas drawing here; rely on game.kv for visuals
-        self.bind(pos=self.update_hitbox)  # Optional: Update hitbox position if needed
-
-    def move(self):
-        """Move the attack based on velocity."""
-        self.pos = Vector(*self.velocity) + self.pos
-
-    def get_hitbox_rect(self):
-        """Return the hitbox rectangle for collision detection."""
-        return self.hitbox.get_rect(self.x, self.y)
-
-    def update_hitbox(self, *args):
-        """Update hitbox position (optional, for consistency)."""
-        pass  # No graphical update needed here; hitbox is already tied to pos via get_hitbox_rect
+    Vertex and index buffers are reused between frames and handed to the
+    Mesh directly, so a frame costs a few array operations however many
+    shots are live.
+    """
+    MAX_SHOTS = 65536 // 4  # Mesh indices are 16-bit
 
-class ProjectileAttack(Attack):
-    def __init__(self, start_pos: tuple, target_pos: tuple, speed: float = 10, **kwargs):
+    def __init__(self, projectiles, **kwargs):
         super().__init__(**kwargs)
-        self.size = (10, 3)
-        self.pos = start_pos
-        self.hitbox = Hitbox(offset_x=0, offset_y=0, width=20, height=20)  # เพิ่มขนาดชั่วคราว
-        
-        dx, dy = target_pos[0] - start_pos[0], target_pos[1] - start_pos[1]
-        distance = max(math.sqrt(dx**2 + dy**2), 0.1)
-        self.velocity_x = (dx / distance) * speed
-        self.velocity_y = (dy / distance) * speed
-        self.attack_rotation = math.degrees(math.atan2(dy, dx))
-
-class EnemyProjectile(Attack):
-    def __init__(self, start_pos: tuple, target_pos: tuple, speed: float = 5, **kwargs):
-        super().__init__(**kwargs)
-        self.size = (8, 8)
-        self.pos = start_pos
-        self.hitbox = Hitbox(offset_x=0, offset_y=0, width=20, height=20)  # เพิ่มขนาดชั่วคราว
-        
-        dx, dy = target_pos[0] - start_pos[0], target_pos[1] - start_pos[1]
-        distance = max(math.sqrt(dx**2 + dy**2), 0.1)
-        self.velocity_x = (dx / distance) * speed
-        self.velocity_y = (dy / distance) * speed
-        self.attack_rotation = math.degrees(math.atan2(dy, dx))
-
-    def move(self):
-        """Move the projectile based on velocity."""
-        super().move()
\ No newline at end of file
+        self.projectiles = projectiles
+        self.vertices = np.zeros((0, 4, 4), dtype=np.float32)
+        self.indices = np.zeros(0, dtype=np.uint16)
+        self.drawn = -1
+        with self.canvas:
+            Color(1, 1, 0, 1)
+            self.mesh = Mesh(mode='triangles')
+        self.sync()
+
+    def reserve(self, count):
+        """Grow the vertex and index buffers to hold at least count shots."""
+        if count <= len(self.vertices):
+            return
+        capacity = min(max(count, 2 * len(self.vertices), 64), self.MAX_SHOTS)
+        self.vertices = np.zeros((capacity, 4, 4), dtype=np.float32)
+        # Two triangles per quad: corners 0-1-2 and 0-2-3
+        quad = np.array([0, 1, 2, 0, 2, 3], dtype=np.uint16)
+        self.indices = (quad + 4 * np.arange(capacity, dtype=np.uint16)[:, None]).ravel()
+
+    def sync(self, alpha=1.0):
+        count = min(self.projectiles.count, self.MAX_SHOTS)
+        if count == 0:
+            if self.drawn:
+                self.mesh.vertices = []
+                self.mesh.indices = []
+                self.drawn = 0
+            return
+        self.reserve(count)
+        self.projectiles.quad_vertices(alpha, out=self.vertices[:count])
+        self.mesh.vertices = memoryview(self.vertices[:count].reshape(-1))
+        if count != self.drawn:
+            self.mesh.indices = memoryview(self.indices[:count * 6])
+            self.drawn = count
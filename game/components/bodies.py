@@ -0,0 +1,486 @@
+# bodies.py
+"""Plain-Python game entities simulated by World; widgets only draw them."""
+import math
+from .hitbox import Hitbox, Rect
+from .physics import PhysicsStore, GRAVITY, FLYING, BOUNCE, LANDS, column
+
+class Body:
+    """Axis-aligned entity with a velocity and a hitbox, in window pixels."""
+
+    def __init__(self, x=0, y=0, width=80, height=80, hitbox=None):
+        # World-space hitbox, refreshed by get_hitbox_rect when the body has moved
+        self.rect = Rect()
+        self.rect_x = self.rect_y = None
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.velocity_x = 0
+        self.velocity_y = 0
+        self.hitbox = hitbox if hitbox else Hitbox(offset_x=0, offset_y=0, width=width, height=height)
+        # Position at the start of the current tick, for render interpolation
+        self.prev_x = x
+        self.prev_y = y
+
+    @property
+    def pos(self):
+        return (self.x, self.y)
+
+    @pos.setter
+    def pos(self, value):
+        self.x, self.y = value
+
+    @property
+    def size(self):
+        return (self.width, self.height)
+
+    @size.setter
+    def size(self, value):
+        self.width, self.height = value
+
+    @property
+    def center_x(self):
+        return self.x + self.width / 2
+
+    @property
+    def center_y(self):
+        return self.y + self.height / 2
+
+    def snap(self):
+        """Forget the previous position so a jump (spawn, teleport) is not interpolated."""
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def lerp_pos(self, alpha):
+        """Position alpha of the way from the previous tick to the current one."""
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
+
+    def get_hitbox_rect(self):
+        """The hitbox in world space. The same Rect is updated in place, so use it before the body moves."""
+        x, y = self.x, self.y
+        if x != self.rect_x or y != self.rect_y:
+            self.hitbox.get_rect(x, y, out=self.rect)
+            self.rect_x, self.rect_y = x, y
+        return self.rect
+
+class CharacterBody(Body):
+    """Body with health that faces the way it last moved horizontally.
+
+    Position, velocity, size and hitbox live in a PhysicsStore row, which
+    World moves into its own store when the body joins; World.physics then
+    moves every character at once according to the class flags.
+    """
+    flags = GRAVITY | LANDS
+
+    x = column('x')
+    y = column('y')
+    velocity_y = column('vy')
+    width = column('w')
+    height = column('h')
+    prev_x = column('prev_x')
+    prev_y = column('prev_y')
+    facing_right = column('facing')
+
+    def __init__(self, x=0, y=0, width=80, height=80, health=100):
+        PhysicsStore.single(self)
+        self.store.flags[0] = self.flags
+        super().__init__(x, y, width, height,
+                         Hitbox(offset_x=10, offset_y=0, width=width - 20, height=height))
+        self.health = health
+        self.max_health = health
+        self.facing_right = True
+
+    @property
+    def velocity_x(self):
+        return self.store.vx.item(self.row)
+
+    @velocity_x.setter
+    def velocity_x(self, value):
+        store, row = self.store, self.row
+        if value != store.vx[row]:
+            store.facing[row] = value >= 0
+        store.vx[row] = value
+
+    @property
+    def hitbox(self):
+        return self._hitbox
+
+    @hitbox.setter
+    def hitbox(self, hitbox):
+        self._hitbox = hitbox
+        self.rect_x = None
+        store, row = self.store, self.row
+        store.hx[row] = hitbox.offset_x
+        store.hy[row] = hitbox.offset_y
+        store.hw[row] = hitbox.width
+        store.hh[row] = hitbox.height
+
+    def respawn(self, x, y, width, height):
+        """Reuse this body as if just built at (x, y): full health, at rest and standing on nothing."""
+        self.pos = (x, y)
+        self.size = (width, height)
+        self.snap()
+        self.velocity_x = 0
+        self.velocity_y = 0
+        self.facing_right = True
+        hitbox = self.hitbox
+        hitbox.offset_x, hitbox.offset_y, hitbox.width, hitbox.height = 10, 0, width - 20, height
+        self.hitbox = hitbox
+        self.health = self.max_health
+        self.store.grounded[self.row] = False
+        self.store.contact[self.row] = -1
+
+    def take_damage(self, damage):
+        self.health = max(0, self.health - damage)
+
+class PlayerBody(CharacterBody):
+    """Stops at the window edges; World.physics moves it."""
+
+class EnemyBody(CharacterBody):
+    """Walking enemy (turtle) that chases the player when it sees them."""
+    flags = GRAVITY | LANDS | BOUNCE
+    attack_range = 500
+    attack_cooldown = 1.0
+    move_speed = 3.0
+    vision_range = 500
+
+    def __init__(self, x=0, y=0, width=80, height=80, health=500, rng=None):
+        super().__init__(x, y, width, height, health=health)
+        self.rng = rng
+        self.reset_ai()
+
+    def reset_ai(self):
+        self.last_attack_time = 0
+        self.wander_target = None
+        self.wander_timer = 0
+        self.wander_duration = self.rng.uniform(2.0, 5.0)
+        self.last_jump_time = 0
+        self.next_jump_interval = self.rng.uniform(2.0, 3.0)
+
+    def respawn(self, x, y, width, height):
+        super().respawn(x, y, width, height)
+        self.reset_ai()
+
+    def update_ai(self, world, dt):
+        target = world.player
+        if not target:
+            return
+
+        dx = target.center_x - self.center_x
+        dy = target.center_y - self.center_y
+        distance = math.hypot(dx, dy) or 0.001
+
+        player_in_vision = distance <= self.vision_range and (
+            (self.facing_right and dx > 0) or (not self.facing_right and dx < 0)
+        )
+
+        if player_in_vision:
+            self.chase_player(world, dx, dy, distance)
+        else:
+            self.wander(world, dt)
+
+        if distance <= self.attack_range and (world.time - self.last_attack_time >= self.attack_cooldown):
+            self.attack(world)
+            self.last_attack_time = world.time
+
+        if self.velocity_x > 0:
+            self.facing_right = True
+        elif self.velocity_x < 0:
+            self.facing_right = False
+
+    def chase_player(self, world, dx, dy, distance):
+        if abs(dx) > 5:
+            self.velocity_x = dx / distance * self.move_speed
+        else:
+            self.velocity_x = 0
+
+        if dy > 50 and abs(self.velocity_y) < 0.01 and (world.time - self.last_jump_time > 1.0):
+            self.velocity_y = 5
+            self.last_jump_time = world.time
+
+    def wander(self, world, dt):
+        self.wander_timer += dt
+
+        if self.wander_target is None or self.wander_timer >= self.wander_duration:
+            self.wander_target = (
+                self.rng.uniform(0, world.width - self.width),
+                self.rng.uniform(0, world.height - self.height)
+            )
+            self.wander_timer = 0
+            self.wander_duration = self.rng.uniform(2.0, 5.0)
+
+        target_x, _ = self.wander_target
+        dx = target_x - self.center_x
+        distance = abs(dx) or 0.001
+
+        if distance < 10:
+            self.velocity_x = 0
+        else:
+            self.velocity_x = dx / distance * self.move_speed * 0.7
+
+        if (world.time - self.last_jump_time >= self.next_jump_interval) and abs(self.velocity_y) < 0.01:
+            self.velocity_y = 5
+            self.last_jump_time = world.time
+            self.next_jump_interval = self.rng.uniform(2.0, 3.0)
+
+    def jump_apart(self, world):
+        """Hop away from a crowding neighbor; World.separate_enemies calls this."""
+        if abs(self.velocity_y) < 0.01:
+            self.velocity_y = 5
+            self.last_jump_time = world.time
+            self.next_jump_interval = self.rng.uniform(2.0, 3.0)
+
+    def take_damage(self, damage):
+        self.health -= damage
+
+    def attack(self, world):
+        """Turtles do not shoot attacks."""
+        pass
+
+class FlyingEnemyBody(EnemyBody):
+    """Enemy that flies along a sine wave and passes through platforms."""
+    flags = FLYING | BOUNCE
+    attack_range = 150
+    move_speed = 2.0
+    vision_range = 300
+    fly_amplitude = 50
+    fly_frequency = 1.0
+
+    def __init__(self, x=0, y=0, width=80, height=80, health=300, rng=None):
+        super().__init__(x, y, width, height, health=health, rng=rng)
+        self.base_y = self.y  # Base Y position for oscillation
+        self.time = 0
+
+    def respawn(self, x, y, width, height):
+        super().respawn(x, y, width, height)
+        self.base_y = self.y
+        self.time = 0
+
+    def update_flying(self, world, dt):
+        """Oscillate around base_y, staying inside the world."""
+        self.time += dt
+        desired_y = self.base_y + math.sin(self.time * self.fly_frequency) * self.fly_amplitude
+        self.y = max(0, min(desired_y, world.height - self.height))
+
+    def update_ai(self, world, dt):
+        target = world.player
+        if not target:
+            return
+
+        dx = target.center_x - self.center_x
+        distance = abs(dx) or 0.001
+
+        player_in_vision = distance <= self.vision_range and (
+            (self.facing_right and dx > 0) or (not self.facing_right and dx < 0)
+        )
+
+        if player_in_vision:
+            self.chase_player(world, dx, distance)
+        else:
+            self.wander(world, dt)
+
+        if distance <= self.attack_range and (world.time - self.last_attack_time >= self.attack_cooldown):
+            self.attack(world)
+            self.last_attack_time = world.time
+
+        if self.velocity_x > 0:
+            self.facing_right = True
+        elif self.velocity_x < 0:
+            self.facing_right = False
+
+    def chase_player(self, world, dx, distance):
+        """Chase horizontally and drift the flight line towards the player."""
+        if abs(dx) > 5:
+            self.velocity_x = dx / distance * self.move_speed
+        else:
+            self.velocity_x = 0
+        target = world.player
+        self.base_y = target.y + target.height / 2 - self.height / 2
+
+    def wander(self, world, dt):
+        self.wander_timer += dt
+        if self.wander_target is None or self.wander_timer >= self.wander_duration:
+            self.wander_target = (self.rng.uniform(0, world.width - self.width), self.y)
+            self.wander_timer = 0
+            self.wander_duration = self.rng.uniform(2.0, 5.0)
+
+        target_x, _ = self.wander_target
+        dx = target_x - self.center_x
+        distance = abs(dx) or 0.001
+
+        if distance < 10:
+            self.velocity_x = 0
+        else:
+            self.velocity_x = dx / distance * self.move_speed * 0.7
+
+    def attack(self, world):
+        """Flying enemies shoot at the player."""
+        target = world.player
+        world.add_enemy_projectile((self.center_x, self.center_y), (target.center_x, target.center_y))
+
+class BossBody(EnemyBody):
+    attack_cooldown = 1.0
+    move_speed = 2.0
+    vision_range = 300
+    attack_range = 100
+
+    def __init__(self, x=0, y=0, width=240, height=240, health=150, rng=None):
+        super().__init__(x, y, width, height, health=health, rng=rng)
+        self.hitbox = Hitbox(offset_x=30, offset_y=0, width=180, height=240)
+        self.is_enraged = False
+        # Timers for attacks
+        self.last_summon_time = 0
+        self.last_dash_time = 0
+        self.last_aoe_time = 0
+        self.last_teleport_time = 0
+        self.last_ground_slam_time = 0
+        # Cooldowns for attacks
+        self.dash_cooldown = 5.0
+        self.summon_cooldown = 15.0
+        self.aoe_cooldown = 10.0
+        self.teleport_cooldown = 10.0
+        self.ground_slam_cooldown = 5.0
+        self.enrage_threshold = 2  # Enter enrage mode at HP <= 2
+        self.aoe_warning = None  # (x, y, width, height) of a pending AoE
+        self.wander_duration = rng.uniform(5.0, 15.0)  # Longer idling than regular enemies
+
+    def update_ai(self, world, dt):
+        """Boss AI runs from World.step through update(), not the shared enemy AI pass."""
+        pass
+
+    def update(self, world, dt):
+        """Chase the player (the boss always sees them) and run the boss attacks."""
+        target = world.player
+        if not target:
+            return
+
+        dx = target.center_x - self.center_x
+        dy = target.center_y - self.center_y
+        distance = math.hypot(dx, dy) or 0.001
+
+        if self.health <= self.enrage_threshold and not self.is_enraged:
+            self.enter_enrage_mode(world)
+
+        self.chase_player(world, dx, dy, distance)
+
+        if self.velocity_x > 0:
+            self.facing_right = True
+        elif self.velocity_x < 0:
+            self.facing_right = False
+
+        self.update_attacks(world, world.time, distance)
+
+    def update_attacks(self, world, current_time, distance):
+        """Handle boss-specific attacks with emphasis on shooting."""
+        if current_time - self.last_attack_time >= self.attack_cooldown:
+            self.enhanced_shoot(world)
+            self.last_attack_time = current_time
+
+        if current_time - self.last_dash_time >= self.dash_cooldown and distance <= self.attack_range:
+            self.dash_attack(world)
+            self.last_dash_time = current_time
+
+        if current_time - self.last_summon_time >= self.summon_cooldown:
+            self.summon_minions(world)
+            self.last_summon_time = current_time
+
+        if current_time - self.last_aoe_time >= self.aoe_cooldown:
+            self.aoe_attack(world)
+            self.last_aoe_time = current_time
+
+        if current_time - self.last_teleport_time >= self.teleport_cooldown:
+            self.teleport(world)
+            self.last_teleport_time = current_time
+
+        if current_time - self.last_ground_slam_time >= self.ground_slam_cooldown and distance <= self.attack_range:
+            self.ground_slam(world)
+            self.last_ground_slam_time = current_time
+
+    def dash_attack(self, world):
+        world.emit('boss_dash')
+        self.velocity_x = self.velocity_x * 3 if self.velocity_x != 0 else (3 if self.facing_right else -3)
+        world.schedule(0.5, self.reset_dash)
+        if Hitbox.collide(self.get_hitbox_rect(), world.player.get_hitbox_rect()):
+            world.player.take_damage(2)
+            world.emit('boss_dash_hit')
+
+    def reset_dash(self):
+        self.velocity_x = 0
+
+    def summon_minions(self, world):
+        """Summon two minions near the boss, each a walking or a flying enemy."""
+        world.emit('boss_summon')
+        for _ in range(2):
+            enemy_class = self.rng.choice([EnemyBody, FlyingEnemyBody])
+            spawn_x = self.rng.uniform(self.x - 100, self.x + 100)
+            spawn_y = self.rng.uniform(0, world.height - 80)
+            spawn_x = max(0, min(spawn_x, world.width - 80))
+            spawn_y = max(0, min(spawn_y, world.height - 80))
+            world.add_enemy(world.enemy_pool.acquire(enemy_class, spawn_x, spawn_y))
+
+    def enhanced_shoot(self, world):
+        """Shoot three projectiles in a spread towards the player."""
+        world.emit('boss_shoot')
+        target_pos = (world.player.x, world.player.y)
+        start_pos = (self.center_x, self.center_y)
+        dx, dy = target_pos[0] - start_pos[0], target_pos[1] - start_pos[1]
+        distance = max(math.hypot(dx, dy), 0.1)
+        base_angle = math.degrees(math.atan2(dy, dx))
+        for angle in (-30, 0, 30):
+            adjusted = math.radians(base_angle + angle)
+            world.add_enemy_projectile(start_pos, (start_pos[0] + distance * math.cos(adjusted),
+                                                   start_pos[1] + distance * math.sin(adjusted)))
+
+    def aoe_attack(self, world):
+        """Mark a 600x600 area around the boss and hit it a second later."""
+        world.emit('boss_aoe_warning')
+        self.aoe_warning = (self.x - 270, self.y - 270, 600, 600)
+        world.schedule(1.0, lambda: self.execute_aoe(world))
+
+    def execute_aoe(self, world):
+        world.emit('boss_aoe')
+        self.aoe_warning = None
+        aoe_rect = Rect(self.x - 270, self.y - 270, 600, 600)
+        if Hitbox.collide(aoe_rect, world.player.get_hitbox_rect()):
+            world.player.take_damage(3)
+            world.emit('boss_aoe_hit')
+
+    def teleport(self, world):
+        world.emit('teleport')
+        self.x = self.rng.uniform(0, world.width - self.width)
+        self.y = self.rng.uniform(0, world.height - self.height)
+        self.snap()
+
+    def ground_slam(self, world):
+        world.emit('boss_slam_jump')
+        self.velocity_y = 8
+        world.schedule(0.5, lambda: self.execute_ground_slam(world))
+
+    def execute_ground_slam(self, world):
+        world.emit('boss_slam')
+        self.velocity_y = -10
+        slam_rect = Rect(self.x - 135, self.y - 135, 450, 450)
+        if Hitbox.collide(slam_rect, world.player.get_hitbox_rect()):
+            world.player.take_damage(2)
+            world.emit('boss_slam_hit')
+
+    def enter_enrage_mode(self, world):
+        """Double speed and halve every cooldown when health is low."""
+        world.emit('boss_enrage')
+        self.is_enraged = True
+        self.move_speed *= 2
+        self.attack_cooldown *= 0.5
+        self.dash_cooldown *= 0.5
+        self.summon_cooldown *= 0.5
+        self.aoe_cooldown *= 0.5
+        self.teleport_cooldown *= 0.5
+        self.ground_slam_cooldown *= 0.5
+        self.aoe_attack(world)
+
+class PlatformBody(Body):
+    pass
+
+class PortalBody(Body):
+    def __init__(self, x, y, width=80, height=240):
+        super().__init__(x, y, width, height)
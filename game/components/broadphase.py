@@ -0,0 +1,131 @@
+# broadphase.py
+"""Uniform-grid spatial hash that turns box-vs-box collision checks into candidate pairs.
+
+Boxes are given as NumPy arrays (x, y, width, height). build() files one set
+of boxes under every grid cell they cover; pairs() looks another set up in
+the same cells and returns only the pairs that really overlap. Boxes that
+share no cell are never compared.
+"""
+import math
+import time
+import numpy as np
+
+class SpatialHash:
+    """Grid of cell_size pixel cells over boxes rebuilt every tick.
+
+    Counts every query so World can report how many candidate pairs the
+    grid produced, how many really overlapped and how long it took.
+    """
+
+    KEY_STRIDE = 1 << 20  # Cell keys are cx * KEY_STRIDE + cy
+    DIRECT_BELOW = 24  # neighbors() compares every pair directly for fewer points than this
+
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.keys = np.zeros(0, dtype=np.int64)
+        self.items = np.zeros(0, dtype=np.intp)
+        self.boxes = (np.zeros(0),) * 4
+        self.queries = 0
+        self.candidates = 0
+        self.hits = 0
+        self.time = 0.0
+        self.last_candidates = 0
+        self.last_hits = 0
+
+    def cells(self, x, y, width, height):
+        """Cell keys covered by each box, with the index of the box each key belongs to."""
+        size = self.cell_size
+        cx0 = np.floor(x / size).astype(np.int64)
+        cy0 = np.floor(y / size).astype(np.int64)
+        nx = np.floor((x + width) / size).astype(np.int64) - cx0 + 1
+        ny = np.floor((y + height) / size).astype(np.int64) - cy0 + 1
+        per_box = nx * ny
+        owner = np.repeat(np.arange(len(x)), per_box)
+        # Position of each key within its box's run of cells
+        k = np.arange(len(owner)) - np.repeat(np.cumsum(per_box) - per_box, per_box)
+        cx = cx0[owner] + k % nx[owner]
+        cy = cy0[owner] + k // nx[owner]
+        return cx * self.KEY_STRIDE + cy, owner
+
+    def build(self, x, y, width, height):
+        """File the boxes under the cells they cover, replacing the previous contents."""
+        start = time.perf_counter()
+        keys, owner = self.cells(x, y, width, height)
+        order = np.argsort(keys, kind='stable')
+        self.keys = keys[order]
+        self.items = owner[order]
+        self.boxes = (x, y, width, height)
+        self.time += time.perf_counter() - start
+
+    def pairs(self, x, y, width, height):
+        """(query index, built index) arrays for every query box overlapping a built box.
+
+        Overlap is inclusive of touching edges, like Hitbox.collide. Pairs are
+        sorted by query index, then built index.
+        """
+        start = time.perf_counter()
+        empty = np.zeros(0, dtype=np.intp)
+        result = (empty, empty)
+        if len(x) and len(self.keys):
+            keys, owner = self.cells(x, y, width, height)
+            lo = np.searchsorted(self.keys, keys, 'left')
+            hi = np.searchsorted(self.keys, keys, 'right')
+            counts = hi - lo
+            query = np.repeat(owner, counts)
+            offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+            built = self.items[np.repeat(lo, counts) + offsets]
+            # A pair sharing several cells is found once per cell. Sort and drop
+            # repeats; np.unique's hash path is far slower on these sizes
+            pair_keys = np.sort(query * len(self.boxes[0]) + built)
+            first = np.ones(len(pair_keys), dtype=bool)
+            first[1:] = pair_keys[1:] != pair_keys[:-1]
+            pair_keys = pair_keys[first]
+            query, built = np.divmod(pair_keys, len(self.boxes[0]))
+            self.last_candidates = len(pair_keys)
+            bx, by, bw, bh = (column[built] for column in self.boxes)
+            qx, qy = x[query], y[query]
+            overlap = ((qx <= bx + bw) & (qx + width[query] >= bx) &
+                       (qy <= by + bh) & (qy + height[query] >= by))
+            result = (query[overlap], built[overlap])
+        else:
+            self.last_candidates = 0
+        self.last_hits = len(result[0])
+        self.queries += 1
+        self.candidates += self.last_candidates
+        self.hits += self.last_hits
+        self.time += time.perf_counter() - start
+        return result
+
+    def neighbors(self, x, y, radius):
+        """Unordered pairs (i, j), i < j, of points (x, y) closer than radius to each other.
+
+        Each point is filed as a radius-sized square around it, so the grid
+        only offers points within radius on both axes; the distance test
+        then keeps the true neighbors. Best with cell_size close to radius.
+        Below DIRECT_BELOW points every pair is checked directly instead,
+        which is cheaper than the grid's fixed cost.
+        """
+        if len(x) < self.DIRECT_BELOW:
+            points = list(zip(x.tolist(), y.tolist()))
+            close = [(i, j) for i, (x0, y0) in enumerate(points) for j in range(i + 1, len(points))
+                     if math.hypot(points[j][0] - x0, points[j][1] - y0) < radius]
+            i, j = np.array(close, dtype=np.intp).reshape(-1, 2).T
+            return i, j
+        side = np.full(len(x), float(radius))
+        left, bottom = x - radius / 2, y - radius / 2
+        self.build(left, bottom, side, side)
+        i, j = self.pairs(left, bottom, side, side)
+        keep = i < j
+        i, j = i[keep], j[keep]
+        close = np.hypot(x[j] - x[i], y[j] - y[i]) < radius
+        return i[close], j[close]
+
+    def stats(self):
+        return {
+            'queries': self.queries,
+            'candidate_pairs': self.candidates,
+            'hits': self.hits,
+            'last_candidate_pairs': self.last_candidates,
+            'last_hits': self.last_hits,
+            'time_ms': self.time * 1000,
+        }
@@ -1,5 +1,6 @@
 from .player import Character
+from .bodies import PlayerBody
 
 class Dino(Character):
-    def __init__(self, **kwargs):
-        super().__init__(gif_path='assets/gifs/ufopug.gif', **kwargs)
\ No newline at end of file
+    def __init__(self, body=None, **kwargs):
+        super().__init__(body if body else PlayerBody(), gif_path='assets/gifs/ufopug.gif', **kwargs)
\ No newline at end of file
@@ -1,83 +1,76 @@
 from kivy.uix.widget import Widget
-from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.image import Image
 from kivy.uix.button import Button
 from kivy.uix.label import Label
 from kivy.app import App
-from kivy.properties import NumericProperty, ObjectProperty, BooleanProperty, ListProperty
-from kivy.clock import Clock
+from kivy.properties import NumericProperty, ObjectProperty, BooleanProperty
 from kivy.core.window import Window
-from kivy.graphics import Color, Rectangle
-from .player import Player
+from .player import Player, Character
 from .stage import Stage
-from .hitbox import Hitbox
 from .boss import Boss
 from .enemy import Enemy, FlyingEnemy
-from .attack import ProjectileAttack
+from .attack import ProjectileLayer
 from .portal import Portal
-import random
+from .heart_bar import HeartBar
+from .glyph_text import GlyphText
+from .world import World
+from .scheduler import TickScheduler
+from .lifecycle import Lifecycle, EntityManager
+from .bodies import PlayerBody, EnemyBody, FlyingEnemyBody, BossBody
 from components.music_manager import MusicManager
 
 class Game(Widget):
-    """Main game widget managing game state, entities, and interactions."""
+    """Kivy view of a World: forwards input to it, mirrors its bodies as sprites and plays its events."""
     portal = ObjectProperty(None, allownone=True)
-    player = ObjectProperty(None)
-    stage = ObjectProperty(None)
+    player = ObjectProperty(None, allownone=True)
+    stage = ObjectProperty(None, allownone=True)
     boss = ObjectProperty(None, allownone=True)
     score = NumericProperty(0)
     stage_number = NumericProperty(1)
     player_health = NumericProperty(20)
     player_max_health = NumericProperty(20)
     game_active = BooleanProperty(True)
-    player_attacks = ListProperty([])
-    enemy_attacks = ListProperty([])
     debug_hitbox = BooleanProperty(False)
-    last_enemy_death_pos = ListProperty([0, 0])
 
-    ENABLE_PLAYER = True
-    ENABLE_ENEMIES = True
-    ENABLE_ATTACKS = True
-    ENABLE_BOSS = True
-    MAX_STAGES = 5
-
-    def __init__(self, music_manager=None, initial_player_hp=100, **kwargs):
+    RENDER_FPS = 60  # Lower on weak machines; the simulation keeps World.TICK regardless
+    DEBUG_LIFECYCLE = False  # Report despawned sprites that stay alive after stage changes
+    # Console lines for World events; the World itself prints nothing
+    EVENT_MESSAGES = {
+        'die': "Player has died!",
+        'enemy_died': "An enemy has died.",
+        'teleport': "Boss is teleporting!",
+        'boss_dash': "Boss is dashing!",
+        'boss_dash_hit': "Boss dashed into player, dealing 2 damage!",
+        'boss_summon': "Boss is summoning minions!",
+        'boss_shoot': "Boss is using enhanced shoot!",
+        'boss_aoe_warning': "Boss is preparing AoE attack!",
+        'boss_aoe': "Boss executes AoE attack!",
+        'boss_aoe_hit': "Player hit by AoE attack, dealing 3 damage!",
+        'boss_slam_jump': "Boss is performing Ground Slam!",
+        'boss_slam': "Boss slams the ground!",
+        'boss_slam_hit': "Player hit by Ground Slam, dealing 2 damage!",
+        'boss_enrage': "Boss has entered enrage mode!",
+    }
+
+    def __init__(self, music_manager=None, initial_player_hp=100, seed=None, **kwargs):
         super().__init__(**kwargs)
-        self.initial_player_hp = initial_player_hp
         self.hp_layout = None
         self.music_manager = music_manager if music_manager else MusicManager()
-        self.walk_sound_playing = False
         self.restart_button = None
         self.end_game_label = None
-        self.initialize_game()
-        self.bind_inputs()
-        Clock.schedule_interval(self.update, 1.0 / 60.0)
-        self.music_manager.play_music(self.stage_number)
-        Window.bind(on_resize=self.on_window_resize)
-
-    def initialize_game(self):
-        """Initialize the game state and entities."""
-        self.stage = Stage(stage_number=self.stage_number, spawn_obstacles=self.ENABLE_ENEMIES)
-        self.add_widget(self.stage)
-        if self.ENABLE_ENEMIES:
-            self.spawn_initial_enemies()
-            for enemy in self.stage.obstacles:
-                self.music_manager.play_spawn()
-        if self.ENABLE_PLAYER:
-            scale_x = Window.width / 1280
-            self.player = Player(pos=(100 * scale_x, 0), health=self.initial_player_hp)
-            self.player_health = self.player.health
-            self.player_max_health = self.player.max_health
-            self.add_widget(self.player)
-            self.player.bind(health=self.on_player_health_changed)
-            self.music_manager.play_spawn()
-            for enemy in self.stage.obstacles:
-                enemy.target = self.player
-        self.attack_cooldown = 0.1
-        self.last_attack_time = 0
         self.mouse_pos = (0, 0)
-        self.score = 0
-        self.on_platform = False
-        self.last_enemy_death_pos = [Window.width - 60, 10]
+        self.sprites = {}  # Body -> widget drawing it
+        self.idle_sprites = {}  # Idle pooled enemy body -> its hidden sprite, kept for reuse
+        self.sprite_reuses = 0
+        self.lifecycle = Lifecycle()
+        self.entities = EntityManager(debug=self.DEBUG_LIFECYCLE)
+        self.alpha = 1.0  # How far the last frame was into the next World tick
+        self.world = World(Window.width, Window.height, initial_player_hp=initial_player_hp, seed=seed)
+        # Every shot is drawn by this one widget
+        self.projectile_layer = self.entities.spawn(ProjectileLayer(self.world.projectiles), self)
+        # Enemy sprites outlive stages; the stage widget goes below them
+        self.enemy_layer = self.entities.spawn(Widget(), self, index=len(self.children))
+        self.sync_view()
+        self.play_events()
         try:
             self.hp_layout = self.ids.hp_layout
             self.hp_layout.bind(pos=self._update_hp_position)
@@ -85,95 +78,149 @@ class Game(Widget):
         except AttributeError:
             print("Warning: hp_layout not found in ids. Ensure .kv file is properly set up.")
             self.hp_layout = None
-        if self.stage_number == 5 and self.ENABLE_BOSS and not self.boss:
-            self.spawn_boss()
+        self.bind_inputs()
+        self.scheduler = TickScheduler()
+        self.animation_marks = {}  # Animation name -> simulated time it last advanced
+        self.add_systems()
+        self.lifecycle.schedule_interval(self.update, 1.0 / self.RENDER_FPS)
+        self.music_manager.play_music(self.stage_number)
+        self.lifecycle.bind(Window, on_resize=self.on_window_resize)
 
     def on_window_resize(self, window, width, height):
-        """Handle window resize by updating all entities."""
-        self.remove_widget(self.stage)
-        self.stage = Stage(stage_number=self.stage_number, spawn_obstacles=self.ENABLE_ENEMIES)
-        self.add_widget(self.stage)
-
-        scale_x = width / 1280
-        scale_y = height / 720
-        if self.player:
-            self.player.pos = (100 * scale_x, 0)
-            self.player.size = (80 * scale_x, 80 * scale_y)
-
-        if self.ENABLE_ENEMIES:
-            self.stage.obstacles.clear()
-            self.spawn_initial_enemies()
-
-        if self.portal:
-            self.remove_widget(self.portal)
-            portal_x = max(0, min(self.last_enemy_death_pos[0] * scale_x, Window.width - 80 * scale_x))
-            portal_y = max(0, min(self.last_enemy_death_pos[1] * scale_y, Window.height - 240 * scale_y))
-            self.portal = Portal(pos=(portal_x, portal_y), player=self.player)
-            self.add_widget(self.portal)
-
-        if self.boss:
-            self.boss.size = (60 * scale_x, 80 * scale_y)
-            self.boss.pos = (Window.width - 60 * scale_x, self.boss.y)
-
+        """Rebuild the stage for the new size and move the HUD with it."""
+        self.world.resize(width, height)
+        self.sync_view()
         if self.hp_layout:
             self.hp_layout.pos = (10, height - 55)  # Keep at top-left
         self.update_hp_hearts()
         self._update_restart_ui_positions()
 
-    def spawn_initial_enemies(self):
-        """Spawn initial enemies at random positions based on stage number, including FlyingEnemy."""
-        enemy_count = 5 + (self.stage_number - 1)
-        self.stage.obstacles.clear()
-        scale_x = Window.width / 1280
-        scale_y = Window.height / 720
-        enemy_size = (80 * scale_x, 80 * scale_y)
-        for _ in range(enemy_count):
-            spawn_x = random.uniform(0, Window.width - enemy_size[0])
-            spawn_y = random.uniform(0, Window.height - enemy_size[1])
-            if random.random() < 0.3:
-                enemy = FlyingEnemy(pos=(spawn_x, spawn_y), size=enemy_size)
+    def sync_view(self, alpha=1.0):
+        """Create, move and remove sprites so they match the World's bodies.
+
+        alpha places moving sprites between the previous and the current tick.
+        """
+        world = self.world
+        if self.stage is None or self.stage.platform_bodies is not world.platforms:
+            self.rebuild_stage()
+        bodies = world.enemies + [body for body in (world.player, world.boss, world.portal) if body]
+        live = set(bodies)
+        for body in [body for body in self.sprites if body not in live]:
+            sprite = self.sprites.pop(body)
+            if self.pooled(body):
+                self.park_sprite(body, sprite)
             else:
-                enemy = Enemy(pos=(spawn_x, spawn_y), size=enemy_size)
-            self.stage.add_widget(enemy)
-            self.stage.obstacles.append(enemy)
-            if self.player:
-                enemy.target = self.player
-
-    def spawn_boss(self):
-        scale_x = Window.width / 1280
-        scale_y = Window.height / 720
-        self.boss = Boss(pos=(Window.width - 60 * scale_x, 0))
-        self.boss.size = (240 * scale_x, 240 * scale_y)
-        self.boss.health = 150  # Set boss HP to 150
-        self.boss.max_health = 150  # Optional: Set max_health for HP bar scaling
-        self.boss.target = self.player
-        self.add_widget(self.boss)
-        self.boss.velocity_x = -1 * scale_x
-        self.music_manager.play_spawn()
-
-    def spawn_portal(self):
-        """Spawn or reposition the portal at the last enemy death position."""
-        if self.portal:
-            self.remove_widget(self.portal)
-        scale_x = Window.width / 1280
-        scale_y = Window.height / 720
-        portal_x = max(0, min(self.last_enemy_death_pos[0] * scale_x, Window.width - 80 * scale_x))
-        portal_y = max(0, min(self.last_enemy_death_pos[1] * scale_y, Window.height - 240 * scale_y))
-        self.portal = Portal(pos=(portal_x, portal_y), player=self.player)
-        self.add_widget(self.portal)
+                self.entities.despawn(sprite)
+        for body in bodies:
+            sprite = self.sprites.get(body)
+            if sprite is None:
+                sprite = self.sprites[body] = self.reuse_sprite(body) or self.create_sprite(body)
+            sprite.sync(alpha)
+        self.projectile_layer.sync(alpha)
+        self.player = self.sprites.get(world.player)
+        self.boss = self.sprites.get(world.boss)
+        self.portal = self.sprites.get(world.portal)
+        self.score = world.score
+        self.stage_number = world.stage_number
+        if world.player:
+            self.player_max_health = world.player.max_health
+            self.player_health = world.player.health
+
+    def rebuild_stage(self):
+        if self.stage:
+            self.entities.despawn(self.stage)
+        # Below the HUD and every other sprite
+        self.stage = self.entities.spawn(Stage(self.world), self, index=len(self.children))
+        if self.debug_hitbox:
+            for platform in self.stage.platforms:
+                platform.toggle_hitbox_debug(True)
+        self.prewarm_sprites()
+
+    @staticmethod
+    def pooled(body):
+        return isinstance(body, EnemyBody) and not isinstance(body, BossBody)
+
+    def prewarm_sprites(self):
+        """Build hidden sprites for idle pooled enemies, so a summon mid-fight only shows one."""
+        for body in self.world.enemy_pool.idle_bodies():
+            if body not in self.idle_sprites and body not in self.sprites:
+                self.park_sprite(body, self.create_sprite(body))
+
+    def park_sprite(self, body, sprite):
+        """Hide the sprite of a body the World released; it stays in the widget tree."""
+        sprite.opacity = 0
+        self.idle_sprites[body] = sprite
+
+    def reuse_sprite(self, body):
+        sprite = self.idle_sprites.pop(body, None)
+        if sprite is not None:
+            sprite.opacity = 1
+            if sprite.debug_hitbox_visible != self.debug_hitbox:
+                sprite.toggle_hitbox_debug(self.debug_hitbox)
+            self.sprite_reuses += 1
+        return sprite
+
+    def create_sprite(self, body):
+        if isinstance(body, PlayerBody):
+            sprite = Player(body)
+        elif isinstance(body, BossBody):
+            sprite = Boss(body)
+        elif isinstance(body, FlyingEnemyBody):
+            sprite = FlyingEnemy(body)
+        elif isinstance(body, EnemyBody):
+            sprite = Enemy(body)
+        else:
+            sprite = Portal(body, player=self.player)
+        if self.pooled(body):
+            self.entities.spawn(sprite, self.enemy_layer)
+        else:
+            self.entities.spawn(sprite, self)
+        if self.debug_hitbox and hasattr(sprite, 'toggle_hitbox_debug'):
+            sprite.toggle_hitbox_debug(True)
+        return sprite
+
+    def play_events(self):
+        """Turn World events into sounds, music changes and the end-of-game screen."""
+        for event in self.world.drain_events():
+            if event in self.EVENT_MESSAGES:
+                print(self.EVENT_MESSAGES[event])
+            if event == 'spawn':
+                self.music_manager.play_spawn()
+            elif event == 'jump':
+                self.music_manager.play_jump()
+            elif event == 'walk':
+                self.music_manager.play_walk()
+            elif event == 'shoot':
+                self.music_manager.play_shoot()
+            elif event == 'teleport':
+                self.music_manager.play_teleport()
+            elif event == 'stage':
+                self.update_hp_hearts()
+                self.music_manager.play_music(self.stage_number)
+                self.entities.report_leaks(f"entering stage {self.stage_number}")
+            elif event == 'portal':
+                # Load and silently start the next stage's track before the player reaches the portal
+                self.music_manager.cue_music(self.stage_number + 1)
+            elif event in ('victory', 'die'):
+                self.game_active = False
+                if event == 'victory':
+                    self.music_manager.play_victory()
+                else:
+                    self.music_manager.play_die()
+                self.music_manager.fade_out_music(duration=1.0)
+                self.show_restart_button(game_over=event == 'die', game_completed=event == 'victory')
 
     def _update_hp_position(self, instance, value):
         """Update HP layout position dynamically."""
         if self.hp_layout:
             self.hp_layout.pos = (10, Window.height - 55)  # Keep at top-left
-        self.update_hp_hearts()
 
     def bind_inputs(self):
         self.keyboard = Window.request_keyboard(self._keyboard_closed, self)
-        self.keyboard.bind(on_key_down=self._on_keyboard_down, on_key_up=self._on_keyboard_up)
-        Window.bind(mouse_pos=self._on_mouse_pos)
-        if self.ENABLE_ATTACKS:
-            Window.bind(on_mouse_down=self._on_mouse_down)
+        self.lifecycle.bind(self.keyboard, on_key_down=self._on_keyboard_down, on_key_up=self._on_keyboard_up)
+        self.lifecycle.bind(Window, mouse_pos=self._on_mouse_pos)
+        if World.ENABLE_ATTACKS:
+            self.lifecycle.bind(Window, on_mouse_down=self._on_mouse_down)
 
     def _keyboard_closed(self):
         self.keyboard.unbind(on_key_down=self._on_keyboard_down, on_key_up=self._on_keyboard_up)
@@ -190,70 +237,39 @@ class Game(Widget):
             self.debug_hitbox = not self.debug_hitbox
             self.update_hitbox_visibility()
             return True
-        if not self.ENABLE_PLAYER or not self.player:
+        if not self.world.player:
             return False
-        scale_x = Window.width / 1280
-        scale_y = Window.height / 720
         if keycode[1] == 'spacebar':
-            if self.can_jump(self.player):
-                self.player.velocity_y = 10 * scale_y
-                self.music_manager.play_jump()
+            self.world.jump()
         elif keycode[1] in ('left', 'a'):
-            self.player.velocity_x = -5 * scale_x
-            if not self.walk_sound_playing and self.on_platform:
-                self.music_manager.play_walk()
-                self.walk_sound_playing = True
+            self.world.walk(-1)
         elif keycode[1] in ('right', 'd'):
-            self.player.velocity_x = 5 * scale_x
-            if not self.walk_sound_playing and self.on_platform:
-                self.music_manager.play_walk()
-                self.walk_sound_playing = True
+            self.world.walk(1)
+        self.play_events()
         return True
 
     def _on_keyboard_up(self, keyboard, keycode):
-        if self.ENABLE_PLAYER and self.player and keycode[1] in ('left', 'a', 'right', 'd'):
-            self.player.velocity_x = 0
-            self.walk_sound_playing = False
+        if keycode[1] in ('left', 'a', 'right', 'd'):
+            self.world.stop_walking()
         return True
 
     def _on_mouse_pos(self, window, pos):
         self.mouse_pos = pos
 
     def _on_mouse_down(self, window, x, y, button, modifiers):
-        if button != 'left' or not self.game_active or (Clock.get_time() - self.last_attack_time < self.attack_cooldown):
+        if button != 'left' or not self.game_active:
             return
-        scale_x = Window.width / 1280
-        start_pos = (self.player.x + self.player.width, self.player.y + self.player.height / 2)
-        attack = ProjectileAttack(start_pos=start_pos, target_pos=self.mouse_pos, speed=15 * scale_x)
-        self.add_widget(attack)
-        self.player_attacks.append(attack)
-        self.last_attack_time = Clock.get_time()
-        self.music_manager.play_shoot()
-
-    def on_player_health_changed(self, instance, value):
-        self.player_health = value
+        self.world.shoot(self.mouse_pos)
+        self.play_events()
+
+    def on_player_health(self, instance, value):
         self.update_hp_hearts()
 
     def update_hp_hearts(self):
+        """Swap only the heart textures whose state changed."""
         if not self.hp_layout:
             return
-        self.hp_layout.clear_widgets()
-        scale_x = Window.width / 1280
-        max_hearts = int(self.player_max_health / 2)
-        full_hearts = int(self.player_health / 2)
-        half_heart = self.player_health % 2 == 1
-        for _ in range(full_hearts):
-            heart = Image(source='assets/images/full_heart.png', size=(50 * scale_x, 50 * scale_x), allow_stretch=True, keep_ratio=False)
-            self.hp_layout.add_widget(heart)
-        if half_heart:
-            half = Image(source='assets/images/half_heart.png', size=(50 * scale_x, 50 * scale_x), allow_stretch=True, keep_ratio=False)
-            self.hp_layout.add_widget(half)
-        remaining_hearts = max_hearts - full_hearts - (1 if half_heart else 0)
-        for _ in range(remaining_hearts):
-            blank = Image(source='assets/images/blank_heart.png', size=(50 * scale_x, 50 * scale_x), allow_stretch=True, keep_ratio=False)
-            self.hp_layout.add_widget(blank)
-        # Ensure position is updated after rebuilding
-        self.hp_layout.pos = (10, Window.height - 55)  # Keep at top-left
+        self.hp_layout.set_health(self.player_health, self.player_max_health)
 
     def _update_restart_ui_positions(self):
         """Update positions of restart button and end game label on window resize."""
@@ -299,234 +315,61 @@ class Game(Widget):
         
         self.add_widget(self.restart_button)
 
+    def add_systems(self):
+        """Register everything that runs per frame, in the order it runs."""
+        self.scheduler.add('simulation', self.update_simulation)
+        self.scheduler.add('sprites', lambda dt: self.sync_view(self.alpha))
+        self.scheduler.add('events', lambda dt: self.play_events())
+        self.scheduler.add('animation', self.animate_sprites)
+        self.scheduler.add('portal_animation', self.animate_portal)
+
     def update(self, dt):
+        """The single Clock callback of a running game; ticks every registered system.
+
+        Gameplay speed does not depend on RENDER_FPS or on how often Clock
+        actually calls this.
+        """
         if not self.game_active:
             return
+        self.scheduler.tick(dt)
 
-        if self.ENABLE_PLAYER and self.player:
-            self.apply_gravity(self.player)
-            self.player.move()
-            self.on_platform = self.handle_platform_collision(self.player)
-            self.player_health = self.player.health
-            if self.debug_hitbox:
-                self.player.update_hitbox_debug()
-
-        if self.ENABLE_ENEMIES and len(self.stage.obstacles) == 0 and not self.boss and not self.portal:
-            self.spawn_portal()
-
-        if self.boss:
-            self.apply_gravity(self.boss)
-            self.boss.move()
-            self.boss.update(self, dt)
-            self.handle_platform_collision(self.boss)
-            if self.boss.health <= 0 and not self.portal:
-                self.spawn_portal()
-            if self.debug_hitbox:
-                self.boss.update_hitbox_debug()
-
-        if self.ENABLE_ATTACKS:
-            self.update_attacks()
-
-        if self.ENABLE_ENEMIES:
-            self.update_enemies()
+    def update_simulation(self, dt):
+        """Run the World at its fixed tick rate; the frame is drawn between ticks."""
+        self.alpha = self.world.advance(dt)
 
-        if self.portal and self.player and Hitbox.collide(self.player.get_hitbox_rect(), self.portal.get_hitbox_rect()):
-            self.next_stage()
+    def animation_steps(self, name, frame_duration):
+        """Frames animation name is due to advance, counted in simulated time since it last advanced.
 
-        if self.stage_number == 1 and self.ENABLE_ENEMIES and len(self.stage.obstacles) == 0 and not self.boss and not self.portal:
-            self.spawn_portal()
-
-        if self.stage_number == self.MAX_STAGES and not self.stage.obstacles and not self.boss:
-            self.game_active = False
-            self.music_manager.play_victory()
-            self.music_manager.fade_out_music(duration=1.0)
-            self.show_restart_button(game_completed=True)
-
-        if self.player_health <= 0:
-            self.game_active = False
-            self.music_manager.play_die()
-            self.music_manager.fade_out_music(duration=1.0)
-            self.show_restart_button(game_over=True)
+        Animations run at their FRAME_DURATION whatever RENDER_FPS is, and
+        stop while the World does.
+        """
+        last = self.animation_marks.setdefault(name, self.world.time)
+        steps = int((self.world.time - last) // frame_duration)
+        self.animation_marks[name] = last + steps * frame_duration
+        return steps
+
+    def animate_sprites(self, dt):
+        for _ in range(self.animation_steps('sprites', Character.FRAME_DURATION)):
+            for sprite in self.sprites.values():
+                if isinstance(sprite, Character):
+                    sprite.update_frame(Character.FRAME_DURATION)
+
+    def animate_portal(self, dt):
+        for _ in range(self.animation_steps('portal', Portal.FRAME_DURATION)):
+            if self.portal:
+                self.portal.update_frame(Portal.FRAME_DURATION)
 
     def next_stage(self):
-        if self.stage_number >= self.MAX_STAGES:
-            return
-        self.stage_number += 1
-        for attack in self.player_attacks + self.enemy_attacks:
-            self.remove_widget(attack)
-        self.player_attacks.clear()
-        self.enemy_attacks.clear()
-        if self.portal:
-            self.remove_widget(self.portal)
-            self.portal = None
-        self.remove_widget(self.stage)
-        self.stage = Stage(stage_number=self.stage_number, spawn_obstacles=self.ENABLE_ENEMIES)
-        self.add_widget(self.stage)
-        if self.ENABLE_ENEMIES:
-            self.spawn_initial_enemies()
-            for enemy in self.stage.obstacles:
-                enemy.target = self.player
-                self.music_manager.play_spawn()
-        if self.ENABLE_PLAYER:
-            scale_x = Window.width / 1280
-            self.player.pos = (100 * scale_x, 0)
-            self.player.velocity_x = 0
-            self.player.velocity_y = 0
-        self.update_hp_hearts()
-        self.music_manager.play_music(self.stage_number)
-        if self.stage_number == 5 and self.ENABLE_BOSS and not self.boss:
-            self.spawn_boss()
+        self.world.next_stage()
+        self.sync_view()
+        self.play_events()
 
     def update_hitbox_visibility(self):
-        if self.player:
-            self.player.toggle_hitbox_debug(self.debug_hitbox)
+        for sprite in self.sprites.values():
+            if hasattr(sprite, 'toggle_hitbox_debug'):
+                sprite.toggle_hitbox_debug(self.debug_hitbox)
         for platform in self.stage.platforms:
             platform.toggle_hitbox_debug(self.debug_hitbox)
-        if self.boss:
-            self.boss.toggle_hitbox_debug(self.debug_hitbox)
-        for enemy in self.stage.obstacles:
-            enemy.toggle_hitbox_debug(self.debug_hitbox)
-
-    def apply_gravity(self, entity):
-        entity.velocity_y -= 0.15 * (Window.height / 720)
-
-    def can_jump(self, entity):
-        on_ground = entity.y <= 0
-        on_platform = self.is_on_platform(entity)
-        return (on_ground or on_platform) and abs(entity.velocity_y) < 0.01
-
-    def is_on_platform(self, entity):
-        entity_rect = entity.get_hitbox_rect()
-        for platform in self.stage.platforms:
-            plat_rect = platform.get_hitbox_rect()
-            if Hitbox.collide(entity_rect, plat_rect) and entity.velocity_y <= 0:
-                distance = plat_rect['top'] - entity_rect['y']
-                if -5 <= distance <= 10:
-                    return True
-        return False
-
-    def handle_platform_collision(self, entity):
-        entity_rect = entity.get_hitbox_rect()
-        on_platform = False
-        entity_prev_y = entity.y + entity.velocity_y
-    
-        for platform in self.stage.platforms:
-            plat_rect = platform.get_hitbox_rect()
-            if Hitbox.collide(entity_rect, plat_rect):
-                if entity.velocity_y <= 0 and entity_prev_y + entity_rect['height'] > plat_rect['top']:
-                    distance = plat_rect['top'] - entity_rect['y']
-                    if -5 <= distance <= 10:
-                        entity.y = plat_rect['top'] - entity.hitbox.offset_y
-                        entity.velocity_y = 0
-                        on_platform = True
-                        continue
-                    continue
-                
-        if entity.y <= 0:
-            entity.y = 0
-            entity.velocity_y = 0
-            on_platform = True
-    
-        return on_platform
-
-    def update_attacks(self):
-        scale_x = Window.width / 1280
-        for attack in self.player_attacks[:]:
-            attack.move()
-            attack_rect = attack.get_hitbox_rect()
-            if not (0 <= attack.x <= Window.width and 0 <= attack.y <= Window.height):
-                try:
-                    self.remove_widget(attack)
-                    self.player_attacks.remove(attack)
-                except Exception as e:
-                    print(f"Error removing player attack: {e}")
-            else:
-                if self.boss and Hitbox.collide(attack_rect, self.boss.get_hitbox_rect()):
-                    self.boss.health -= 1
-                    try:
-                        self.remove_widget(attack)
-                        self.player_attacks.remove(attack)
-                    except Exception as e:
-                        print(f"Error removing player attack: {e}")
-                    if self.boss.health <= 0:
-                        try:
-                            self.remove_widget(self.boss)
-                            self.boss = None
-                            self.score += 50
-                        except Exception as e:
-                            print(f"Error removing boss: {e}")
-                elif self.ENABLE_ENEMIES:
-                    for enemy in self.stage.obstacles[:]:
-                        enemy_rect = enemy.get_hitbox_rect()
-                        if Hitbox.collide(attack_rect, enemy_rect):
-                            enemy.take_damage(100)
-                            try:
-                                self.remove_widget(attack)
-                                self.player_attacks.remove(attack)
-                            except Exception as e:
-                                print(f"Error removing player attack: {e}")
-                            if enemy.health <= 0:
-                                self.score += 100
-                                self.last_enemy_death_pos = [enemy.x / scale_x, enemy.y / (Window.height / 720)]
-                            break
-
-        for attack in self.enemy_attacks[:]:
-            attack.move()
-            attack_rect = attack.get_hitbox_rect()
-            if not (0 <= attack.x <= Window.width and 0 <= attack.y <= Window.height):
-                try:
-                    self.remove_widget(attack)
-                    self.enemy_attacks.remove(attack)
-                except Exception as e:
-                    print(f"Error removing enemy attack: {e}")
-            elif Hitbox.collide(attack_rect, self.player.get_hitbox_rect()):
-                self.player.take_damage(1)
-                try:
-                    self.remove_widget(attack)
-                    self.enemy_attacks.remove(attack)
-                except Exception as e:
-                    print(f"Error removing enemy attack: {e}")
-
-        collisions = []
-        for player_attack in self.player_attacks[:]:
-            player_attack_rect = player_attack.get_hitbox_rect()
-            for enemy_attack in self.enemy_attacks[:]:
-                enemy_attack_rect = enemy_attack.get_hitbox_rect()
-                if Hitbox.collide(player_attack_rect, enemy_attack_rect):
-                    collisions.append((player_attack, enemy_attack))
-                    break
-
-        for player_attack, enemy_attack in collisions:
-            try:
-                if player_attack in self.player_attacks:
-                    self.remove_widget(player_attack)
-                    self.player_attacks.remove(player_attack)
-                if enemy_attack in self.enemy_attacks:
-                    self.remove_widget(enemy_attack)
-                    self.enemy_attacks.remove(enemy_attack)
-            except Exception as e:
-                print(f"Error handling collision: {e}")
-
-    def update_enemies(self):
-        for enemy in self.stage.obstacles[:]:
-            if isinstance(enemy, FlyingEnemy):
-                enemy.move()
-            else:
-                self.apply_gravity(enemy)
-                enemy.move()
-                self.handle_platform_collision(enemy)
-            if Hitbox.collide(self.player.get_hitbox_rect(), enemy.get_hitbox_rect()):
-                self.player.take_damage(1)
-                scale_x = Window.width / 1280
-                scale_y = Window.height / 720
-                self.last_enemy_death_pos = [enemy.x / scale_x, enemy.y / scale_y]
-                self.stage.remove_widget(enemy)
-                self.stage.obstacles.remove(enemy)
-            elif enemy.x < -enemy.width:
-                self.stage.remove_widget(enemy)
-                self.stage.obstacles.remove(enemy)
-            if self.debug_hitbox:
-                enemy.update_hitbox_debug()
 
     def restart(self, game_over=False, game_completed=False):
         """
@@ -548,54 +391,34 @@ class Game(Widget):
         if game_over:
             print("Game Over! Restarting game...")
         elif game_completed:
-            print(f"Congratulations! You've cleared all {self.MAX_STAGES} stages! Restarting game...")
+            print(f"Congratulations! You've cleared all {self.world.MAX_STAGES} stages! Restarting game...")
         else:
             print("Restarting game...")
 
         self.game_active = True
-        self.score = 0
-        self.stage_number = 1
-        self.player_health = self.initial_player_hp
-        self.player_max_health = self.initial_player_hp
-        self.player_attacks.clear()
-        self.enemy_attacks.clear()
-        
-        if self.boss:
-            self.remove_widget(self.boss)
-            self.boss = None
-        
-        if self.portal:
-            self.remove_widget(self.portal)
-            self.portal = None
-        
-        self.remove_widget(self.stage)
-        self.stage = Stage(stage_number=self.stage_number, spawn_obstacles=self.ENABLE_ENEMIES)
-        self.add_widget(self.stage)
-        
-        if self.ENABLE_ENEMIES:
-            self.spawn_initial_enemies()
-            for enemy in self.stage.obstacles:
-                enemy.target = self.player
-                self.music_manager.play_spawn()
-        
-        if self.ENABLE_PLAYER:
-            self.remove_widget(self.player)
-            scale_x = Window.width / 1280
-            scale_y = Window.height / 720
-            self.player = Player(pos=(100 * scale_x, 0), health=self.initial_player_hp)
-            self.player.size = (80 * scale_x, 80 * scale_y)
-            self.player_health = self.player.health
-            self.player_max_health = self.player.max_health
-            self.player.bind(health=self.on_player_health_changed)
-            self.add_widget(self.player)
-            for enemy in self.stage.obstacles:
-                enemy.target = self.player
-        
-        self.last_enemy_death_pos = [Window.width - 60, 10]
-        
+        self.world.reset()
+        self.sync_view()
+        self.play_events()
         self.update_hp_hearts()
-        
-        Clock.schedule_once(lambda dt: self.music_manager.play_music(self.stage_number), 0.6)
+        self.entities.report_leaks("restart")
+
+        self.lifecycle.schedule_once(lambda dt: self.music_manager.play_music(self.stage_number), 0.6)
+
+    def dispose(self):
+        """Release every sprite, timer and binding; the Game is not used again."""
+        for sprite in list(self.sprites.values()) + list(self.idle_sprites.values()):
+            self.entities.despawn(sprite)
+        self.sprites.clear()
+        self.idle_sprites.clear()
+        self.entities.despawn(self.enemy_layer)
+        self.entities.despawn(self.projectile_layer)
+        if self.stage:
+            self.entities.despawn(self.stage)
+            self.stage = None
+        self.lifecycle.dispose()
+        if self.keyboard:
+            self.keyboard.release()
+            self.keyboard = None
 
     def show_pause_menu(self):
         from .pause_menu import PauseMenu
@@ -1,17 +1,223 @@
-from kivy.uix.widget import Widget
-from kivy.graphics import Color, Rectangle
-from kivy.clock import Clock
-from kivy.properties import ListProperty, NumericProperty
-from typing import List
+# gif_loader.py
 from kivy.graphics.texture import Texture
 from PIL import Image
+from collections import OrderedDict
+import numpy as np
 import os
+import time
+from typing import List
+from .texture_atlas import TextureAtlas
+from .asset_cache import BakedGifCache
+
+class AnimationClip:
+    """Uploaded textures of one GIF, shared by every entity that plays it."""
+
+    def __init__(self, path: str, textures: List[Texture], flipped_textures: List[Texture], nbytes=None,
+                 atlas=None):
+        self.path = path
+        self.atlas = atlas  # TextureAtlas whose pages hold the frames, shared with other clips
+        self.textures = textures
+        self.flipped_textures = flipped_textures
+        self.frame_count = len(textures)
+        self.size = textures[0].size if textures else (0, 0)
+        # RGBA bytes held on the GPU; flipped textures are regions of the same ones
+        if nbytes is None:
+            nbytes = sum(t.width * t.height * 4 for t in textures)
+        self.nbytes = nbytes
+
+class ClipCache:
+    """Process-wide LRU cache of AnimationClips bounded by a texture memory budget.
+
+    Clips packed into one atlas share its pages, so they are charged and
+    evicted together: the atlas counts once, using a member touches all of
+    them, and evicting one evicts the rest.
+    """
+
+    def __init__(self, budget_bytes=64 * 1024 * 1024):
+        self.budget_bytes = budget_bytes
+        self.clips = OrderedDict()
+        self.atlases = {}  # TextureAtlas -> paths of its cached clips
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+
+    def get(self, path: str):
+        clip = self.clips.get(path)
+        if clip is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        for member in self.members(clip):
+            self.clips.move_to_end(member)
+        return clip
+
+    def members(self, clip: AnimationClip):
+        """Paths of the cached clips that are evicted together with clip, clip's own last."""
+        if clip.atlas is None:
+            return [clip.path]
+        return [path for path in self.atlases[clip.atlas] if path != clip.path] + [clip.path]
+
+    def put(self, clip: AnimationClip):
+        if clip.path in self.clips:
+            self.discard(clip.path)
+        self.clips[clip.path] = clip
+        if clip.atlas is None:
+            self.bytes += clip.nbytes
+        else:
+            paths = self.atlases.setdefault(clip.atlas, [])
+            if not paths:
+                self.bytes += clip.atlas.nbytes
+            paths.append(clip.path)
+            for member in self.members(clip):
+                self.clips.move_to_end(member)
+        self.evict()
+
+    def discard(self, path: str):
+        clip = self.clips.pop(path)
+        if clip.atlas is None:
+            self.bytes -= clip.nbytes
+            return
+        paths = self.atlases[clip.atlas]
+        paths.remove(path)
+        if not paths:
+            del self.atlases[clip.atlas]
+            self.bytes -= clip.atlas.nbytes
+
+    def evict(self):
+        """Drop least recently used clips, whole atlases at a time, until the budget is met.
+
+        The newest clip, and any atlas it is part of, always stays.
+        """
+        newest = next(reversed(self.clips), None)
+        while self.bytes > self.budget_bytes and len(self.clips) > 1:
+            doomed = self.members(next(iter(self.clips.values())))
+            if newest in doomed:
+                break
+            for path in doomed:
+                self.discard(path)
+                self.evictions += 1
+
+    def set_budget(self, budget_bytes):
+        self.budget_bytes = budget_bytes
+        self.evict()
+
+    def clear(self):
+        self.clips.clear()
+        self.atlases.clear()
+        self.bytes = 0
+
+    def stats(self):
+        return {
+            'clips': len(self.clips),
+            'atlases': len(self.atlases),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'bytes': self.bytes,
+            'budget_bytes': self.budget_bytes,
+        }
 
 class GifLoader:
+    clip_cache = ClipCache()
+    baked_cache = BakedGifCache()
+
+    # GIFs packed together into shared atlas pages; a miss on any member builds its group
+    ATLAS_GROUPS = [
+        ['assets/gifs/dino1.gif', 'assets/gifs/turtle.gif', 'assets/gifs/fy.gif', 'assets/gifs/portal.gif'],
+        ['assets/gifs/boss.gif'],
+    ]
+
     @staticmethod
-    def load_gif_frames(gif_path: str) -> List[Image.Image]:
+    def load_clip(gif_path: str, frames=None) -> AnimationClip:
+        """Return the cached clip for gif_path, decoding and uploading it on first use.
+
+        frames may carry an already decoded array (see AssetPreloader) so only the upload runs here.
+        """
+        key = os.path.normpath(gif_path)
+        clip = GifLoader.clip_cache.get(key)
+        if clip is None:
+            group = GifLoader.atlas_group(key)
+            if group:
+                return GifLoader.load_atlas(group)[key]
+            # The frame array is dropped once the pixels live on the GPU
+            if frames is None:
+                frames = GifLoader.load_gif_array(gif_path)
+            textures = GifLoader.create_textures(frames)
+            clip = AnimationClip(key, textures, GifLoader.flipped_regions(textures))
+            GifLoader.clip_cache.put(clip)
+        return clip
+
+    @staticmethod
+    def atlas_group(key: str) -> List[str]:
+        for group in GifLoader.ATLAS_GROUPS:
+            paths = [os.path.normpath(path) for path in group]
+            if key in paths:
+                return paths
+        return []
+
+    @staticmethod
+    def load_atlas(gif_paths: List[str], decoded=None) -> dict:
+        """Pack every frame of gif_paths into one atlas and cache a clip per GIF.
+
+        decoded optionally maps paths to frame arrays that were decoded ahead of time.
+        """
+        decoded = decoded or {}
+        frames_by_path = {path: decoded[path] if path in decoded else GifLoader.load_gif_array(path)
+                          for path in gif_paths}
+        atlas = TextureAtlas()
+        regions = atlas.build(frames_by_path)
+        clips = {}
+        for path, (textures, flipped_textures) in regions.items():
+            # Flipped regions share the page; the cache charges the atlas pages once for all clips
+            clips[path] = AnimationClip(path, textures, flipped_textures, nbytes=frames_by_path[path].nbytes,
+                                        atlas=atlas)
+            GifLoader.clip_cache.put(clips[path])
+        print(f"TextureAtlas: packed {len(gif_paths)} GIFs into {len(atlas.pages)} pages "
+              f"({atlas.nbytes / 1e6:.1f} MB)")
+        return clips
+
+    @staticmethod
+    def load_gif_array(gif_path: str) -> np.ndarray:
+        """Return pre-oriented frames as one (frames, height, width, 4) RGBA array.
+
+        Reads the baked cache when it is current, otherwise decodes and bakes.
+        """
         if not os.path.exists(gif_path):
             raise FileNotFoundError(f"GIF file not found: {gif_path}")
+        frames = GifLoader.baked_cache.read(gif_path)
+        if frames is None:
+            start = time.perf_counter()
+            frames = GifLoader.decode_gif_array(gif_path)
+            GifLoader.baked_cache.add_decode_time(time.perf_counter() - start)
+            GifLoader.baked_cache.write(gif_path, frames)
+        return frames
+
+    @staticmethod
+    def decode_gif_array(gif_path: str) -> np.ndarray:
+        with Image.open(gif_path) as gif:
+            if not gif.is_animated:
+                raise ValueError(f"File {gif_path} is not an animated GIF")
+            width, height = gif.size
+            if width <= 0 or height <= 0:
+                raise ValueError(f"Invalid frame dimensions in {gif_path}: {gif.size}")
+            frames = np.empty((gif.n_frames, height, width, 4), dtype=np.uint8)
+            # A 180 degree turn is the frame's pixel order reversed, so copy each
+            # frame in as reversed 32-bit pixels instead of resampling with rotate
+            pixels = frames.view(np.uint32).reshape(gif.n_frames, height * width)
+            for frame in range(gif.n_frames):
+                gif.seek(frame)
+                pixels[frame] = np.asarray(gif.convert('RGBA')).view(np.uint32).reshape(-1)[::-1]
+            return frames
+
+    @staticmethod
+    def load_gif_frames(gif_path: str) -> List[Image.Image]:
+        """Return pre-oriented RGBA frames as PIL images backed by load_gif_array."""
+        return [Image.fromarray(frame, 'RGBA') for frame in GifLoader.load_gif_array(gif_path)]
+
+    @staticmethod
+    def decode_gif_frames(gif_path: str) -> List[Image.Image]:
+        """Original PIL decode path, kept for comparison in benchmarks/bench_gif_decode.py."""
         with Image.open(gif_path) as gif:
             if not gif.is_animated:
                 raise ValueError(f"File {gif_path} is not an animated GIF")
@@ -25,61 +231,31 @@ class GifLoader:
             return frames
 
     @staticmethod
-    def create_textures(frames: List[Image.Image]) -> List[Texture]:
+    def frame_buffer(frame) -> memoryview:
+        """Flat view of a contiguous frame array, or the bytes of a PIL frame."""
+        if isinstance(frame, np.ndarray):
+            return memoryview(frame).cast('B')
+        return frame.tobytes()
+
+    @staticmethod
+    def create_textures(frames) -> List[Texture]:
+        """Upload frames given as a (frames, h, w, 4) array or a list of PIL images."""
         textures = []
         for i, frame in enumerate(frames):
-            texture = Texture.create(size=(frame.width, frame.height), colorfmt='rgba')
+            height, width = frame.shape[:2] if isinstance(frame, np.ndarray) else (frame.height, frame.width)
+            texture = Texture.create(size=(width, height), colorfmt='rgba')
             if texture is None:
-                raise RuntimeError(f"Failed to create texture for frame {i}: size={frame.size}")
-            texture.blit_buffer(frame.tobytes(), colorfmt='rgba', bufferfmt='ubyte')
+                raise RuntimeError(f"Failed to create texture for frame {i}: size={(width, height)}")
+            texture.blit_buffer(GifLoader.frame_buffer(frame), colorfmt='rgba', bufferfmt='ubyte')
             textures.append(texture)
         return textures
 
     @staticmethod
-    def create_flipped_textures(frames: List[Image.Image]) -> List[Texture]:
-        textures = GifLoader.create_textures(frames)
-        for i, texture in enumerate(textures):
-            if texture is None:
-                raise RuntimeError(f"Texture {i} is None before flipping")
-            texture.flip_horizontal()
-        return textures
-
-class Portal(Widget):
-    current_frame = NumericProperty(0)
-    textures = ListProperty([])
-
-    def __init__(self, pos, **kwargs):
-        super().__init__(**kwargs)
-        self.size = (50, 50)  # ปรับขนาดตาม GIF จริง
-        self.pos = pos
-        self.frame_duration = 0.1  # ความเร็วของแอนิเมชัน (วินาทีต่อเฟรม)
-        self.load_gif()
-        Clock.schedule_interval(self.update_animation, self.frame_duration)
-
-    def load_gif(self):
-        try:
-            gif_path = os.path.join(os.path.dirname(__file__), '..', 'assets', 'gifs', 'portal.gif')
-            frames = GifLoader.load_gif_frames(gif_path)
-            self.textures = GifLoader.create_textures(frames)
-            if self.textures:
-                self.size = (self.textures[0].width, self.textures[0].height)  # ปรับขนาดตามเฟรมแรก
-                with self.canvas:
-                    Color(1, 1, 1, 1)  # สีพื้นฐาน (ขาวเต็มที่)
-                    self.rect = Rectangle(pos=self.pos, size=self.size, texture=self.textures[0])
-            else:
-                raise ValueError("No textures loaded")
-        except Exception as e:
-            print(f"Error loading GIF: {e}")
-
-    def update_animation(self, dt):
-        if self.textures:
-            self.current_frame = (self.current_frame + 1) % len(self.textures)
-            self.rect.texture = self.textures[self.current_frame]
-
-    def get_hitbox_rect(self):
-        return {
-            'x': self.x,
-            'y': self.y,
-            'right': self.x + self.width,
-            'top': self.y + self.height
-        }
\ No newline at end of file
+    def flipped_regions(textures: List[Texture]) -> List[Texture]:
+        """Mirrored views of textures that share their pixels, as TextureAtlas makes for its pages."""
+        flipped = []
+        for texture in textures:
+            region = texture.get_region(0, 0, texture.width, texture.height)
+            region.flip_horizontal()
+            flipped.append(region)
+        return flipped
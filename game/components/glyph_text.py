@@ -0,0 +1,107 @@
+from kivy.uix.widget import Widget
+from kivy.properties import StringProperty, NumericProperty, ListProperty
+from kivy.graphics import Color, Rectangle, InstructionGroup
+from kivy.core.text import Label as CoreLabel
+import string
+
+class GlyphAtlas:
+    """Glyphs of one font size rasterized once into a single texture.
+
+    The charset is rendered as one label with a space between glyphs; every
+    glyph is then a region of that texture. Characters outside the charset
+    extend it and re-render the atlas once.
+    """
+    CHARSET = string.digits + string.ascii_letters + ' .,:;!?+-/%()'
+    _atlases = {}
+
+    def __init__(self, font_size, charset=CHARSET):
+        self.font_size = font_size
+        self.charset = ''.join(dict.fromkeys(charset))
+        self.rasterizations = 0
+        self.render()
+
+    @classmethod
+    def get(cls, font_size):
+        if font_size not in cls._atlases:
+            cls._atlases[font_size] = cls(font_size)
+        return cls._atlases[font_size]
+
+    def render(self):
+        label = CoreLabel(text=' '.join(self.charset), font_size=self.font_size)
+        label.refresh()
+        self.texture = label.texture
+        self.line_height = self.texture.height
+        self.glyphs = {}
+        self.advances = {}
+        for i, ch in enumerate(self.charset):
+            x = label.get_extents(' '.join(self.charset[:i]) + (' ' if i else ''))[0]
+            width = label.get_extents(ch)[0]
+            self.glyphs[ch] = self.texture.get_region(x, 0, width, self.line_height)
+            self.advances[ch] = width
+        self.rasterizations += 1
+
+    def glyph(self, ch):
+        if ch not in self.glyphs:
+            self.charset += ch
+            self.render()
+        return self.glyphs[ch]
+
+    def text_width(self, text):
+        for ch in text:
+            self.glyph(ch)
+        return sum(self.advances[ch] for ch in text)
+
+class GlyphText(Widget):
+    """Text drawn as one quad per character from a shared GlyphAtlas.
+
+    Changing text retextures only the quads whose character changed and moves
+    the ones after it, so nothing is rasterized per update. Like Label, the
+    text is centered in the widget.
+    """
+    text = StringProperty('')
+    font_size = NumericProperty(15)
+    color = ListProperty([1, 1, 1, 1])
+
+    def __init__(self, **kwargs):
+        self.quads = []  # Rectangle per character
+        self.chars = ''
+        self.quad_updates = 0
+        self.glyph_group = InstructionGroup()
+        self.glyph_color = Color(1, 1, 1, 1)
+        super().__init__(**kwargs)
+        self.glyph_color.rgba = self.color
+        self.canvas.add(self.glyph_color)
+        self.canvas.add(self.glyph_group)
+        self.bind(text=self.update_glyphs, pos=self.update_glyphs, size=self.update_glyphs,
+                  font_size=self.reset_glyphs, color=self.update_color)
+        self.update_glyphs()
+
+    def update_color(self, instance, value):
+        self.glyph_color.rgba = value
+
+    def reset_glyphs(self, *args):
+        self.chars = ''
+        self.update_glyphs()
+
+    def update_glyphs(self, *args):
+        atlas = GlyphAtlas.get(self.font_size)
+        text = self.text
+        while len(self.quads) < len(text):
+            quad = Rectangle()
+            self.glyph_group.add(quad)
+            self.quads.append(quad)
+        while len(self.quads) > len(text):
+            self.glyph_group.remove(self.quads.pop())
+
+        x = self.center_x - atlas.text_width(text) / 2
+        y = self.center_y - atlas.line_height / 2
+        for i, ch in enumerate(text):
+            quad = self.quads[i]
+            if i >= len(self.chars) or self.chars[i] != ch:
+                quad.texture = atlas.glyph(ch)
+                quad.size = (atlas.advances[ch], atlas.line_height)
+                self.quad_updates += 1
+            if quad.pos != (x, y):
+                quad.pos = (x, y)
+            x += atlas.advances[ch]
+        self.chars = text
@@ -0,0 +1,67 @@
+from kivy.uix.widget import Widget
+from kivy.properties import NumericProperty
+from kivy.graphics import Color, Rectangle
+from kivy.core.image import Image as CoreImage
+
+class HeartBar(Widget):
+    """Row of heart icons drawn as fixed canvas rectangles.
+
+    Health changes only swap the texture of hearts whose state changed; the
+    rectangles are rebuilt only when the number of hearts changes.
+    """
+    spacing = NumericProperty(1)
+
+    HEART_IMAGES = {
+        'full': 'assets/images/full_heart.png',
+        'half': 'assets/images/half_heart.png',
+        'blank': 'assets/images/blank_heart.png',
+    }
+    _textures = {}
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.hearts = []  # Rectangle per heart
+        self.states = []  # 'full', 'half' or 'blank' per heart
+        self.bind(pos=self.layout_hearts, size=self.layout_hearts, spacing=self.layout_hearts)
+
+    @classmethod
+    def texture_for(cls, state):
+        if state not in cls._textures:
+            cls._textures[state] = CoreImage(cls.HEART_IMAGES[state]).texture
+        return cls._textures[state]
+
+    @staticmethod
+    def heart_states(health, max_health):
+        max_hearts = int(max_health / 2)
+        full_hearts = int(health / 2)
+        half_heart = health % 2 == 1
+        states = ['full'] * full_hearts + (['half'] if half_heart else [])
+        return states + ['blank'] * max(0, max_hearts - len(states))
+
+    def set_health(self, health, max_health):
+        states = self.heart_states(health, max_health)
+        if len(states) != len(self.hearts):
+            self.build_hearts(states)
+            return
+        for i, state in enumerate(states):
+            if state != self.states[i]:
+                self.hearts[i].texture = self.texture_for(state)
+                self.states[i] = state
+
+    def build_hearts(self, states):
+        self.canvas.clear()
+        with self.canvas:
+            Color(1, 1, 1, 1)
+            self.hearts = [Rectangle(texture=self.texture_for(state)) for state in states]
+        self.states = list(states)
+        self.layout_hearts()
+
+    def layout_hearts(self, *args):
+        """Split the bar width evenly between hearts, like the BoxLayout it replaces."""
+        if not self.hearts:
+            return
+        count = len(self.hearts)
+        heart_width = max(0, (self.width - self.spacing * (count - 1)) / count)
+        for i, heart in enumerate(self.hearts):
+            heart.pos = (self.x + i * (heart_width + self.spacing), self.y)
+            heart.size = (heart_width, self.height)
@@ -1,3 +1,19 @@
+class Rect:
+    """World-space box with its right and top edges precomputed; updated in place."""
+    __slots__ = ('x', 'y', 'width', 'height', 'right', 'top')
+
+    def __init__(self, x=0, y=0, width=0, height=0):
+        self.set(x, y, width, height)
+
+    def set(self, x, y, width, height):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.right = x + width
+        self.top = y + height
+        return self
+
 class Hitbox:
     def __init__(self, offset_x=0, offset_y=0, width=0, height=0):
         self.offset_x = offset_x
@@ -5,19 +21,15 @@ class Hitbox:
         self.width = width
         self.height = height
 
-    def get_rect(self, parent_x, parent_y):
-        return {
-            'x': parent_x + self.offset_x,
-            'y': parent_y + self.offset_y,
-            'width': self.width,
-            'height': self.height,
-            'right': parent_x + self.offset_x + self.width,
-            'top': parent_y + self.offset_y + self.height
-        }
+    def get_rect(self, parent_x, parent_y, out=None):
+        """The hitbox placed at (parent_x, parent_y), written into out when given."""
+        if out is None:
+            out = Rect()
+        return out.set(parent_x + self.offset_x, parent_y + self.offset_y, self.width, self.height)
 
     @staticmethod
     def collide(rect1, rect2):
-        return (rect1['x'] <= rect2['right'] and    # Changed < to <=
-                rect1['right'] >= rect2['x'] and    # Changed > to >=
-                rect1['y'] <= rect2['top'] and      # Changed < to <=
-                rect1['top'] >= rect2['y'])         # Changed > to >=
\ No newline at end of file
+        return (rect1.x <= rect2.right and    # Changed < to <=
+                rect1.right >= rect2.x and    # Changed > to >=
+                rect1.y <= rect2.top and      # Changed < to <=
+                rect1.top >= rect2.y)         # Changed > to >=
@@ -0,0 +1,90 @@
+# lifecycle.py
+from kivy.clock import Clock
+from collections import Counter
+import gc
+import weakref
+
+class Lifecycle:
+    """Clock events and event bindings owned by one object, released together by dispose().
+
+    Owners create their timers and bindings through this instead of calling
+    Clock and bind() directly, so nothing keeps running once they are gone.
+    """
+
+    def __init__(self):
+        self.events = []
+        self.bindings = []  # (dispatcher, {event: callback})
+        self.disposed = False
+
+    def schedule_interval(self, callback, interval):
+        event = Clock.schedule_interval(callback, interval)
+        self.events.append(event)
+        return event
+
+    def schedule_once(self, callback, timeout=0):
+        event = Clock.schedule_once(callback, timeout)
+        self.events.append(event)
+        return event
+
+    def bind(self, dispatcher, **kwargs):
+        dispatcher.bind(**kwargs)
+        self.bindings.append((dispatcher, kwargs))
+
+    def dispose(self):
+        for event in self.events:
+            event.cancel()
+        for dispatcher, kwargs in self.bindings:
+            dispatcher.unbind(**kwargs)
+        self.events.clear()
+        self.bindings.clear()
+        self.disposed = True
+
+class EntityManager:
+    """Adds and removes entity widgets, disposing what each one owns.
+
+    In debug mode despawned entities are tracked weakly; report_leaks() lists
+    the ones that are still alive but detached, i.e. something (a timer, a
+    binding, a stray reference) kept them from being freed.
+    """
+
+    def __init__(self, debug=False):
+        self.debug = debug
+        self.despawned = weakref.WeakSet()
+        self.spawned_count = 0
+        self.despawned_count = 0
+
+    def spawn(self, entity, parent, index=0):
+        parent.add_widget(entity, index=index)
+        self.spawned_count += 1
+        return entity
+
+    def despawn(self, entity):
+        if entity.parent:
+            entity.parent.remove_widget(entity)
+        self.dispose(entity)
+        self.despawned_count += 1
+        if self.debug:
+            self.despawned.add(entity)
+
+    @staticmethod
+    def dispose(entity):
+        lifecycle = getattr(entity, 'lifecycle', None)
+        if lifecycle:
+            lifecycle.dispose()
+
+    def leaks(self):
+        gc.collect()
+        return [entity for entity in self.despawned if entity.parent is None]
+
+    def report_leaks(self, label):
+        """Print despawned entities that are still alive; returns them."""
+        if not self.debug:
+            return []
+        leaked = self.leaks()
+        if leaked:
+            counts = Counter(type(entity).__name__ for entity in leaked)
+            print(f"EntityManager: {len(leaked)} despawned entities still alive after {label}: {dict(counts)}")
+        else:
+            print(f"EntityManager: no leaked entities after {label} "
+                  f"({self.spawned_count} spawned, {self.despawned_count} despawned)")
+        return leaked
@@ -1,148 +1,386 @@
 from kivy.core.audio import SoundLoader
 from kivy.clock import Clock
+from concurrent.futures import ThreadPoolExecutor
+from .asset_cache import AudioTranscodeCache
+
+class VoicePool:
+    """Several Sound objects for one effect so overlapping plays don't cut each other off.
+
+    At most len(voices) copies play at once; further triggers are dropped, and
+    repeated triggers within one frame are coalesced into a single play.
+    """
+
+    def __init__(self, name, voices):
+        self.name = name
+        self.voices = voices
+        self.next_voice = 0
+        self.last_frame = -1
+        self.played = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self._volume = 1.0
+
+    @property
+    def volume(self):
+        return self._volume
+
+    @volume.setter
+    def volume(self, value):
+        self._volume = value
+        for voice in self.voices:
+            voice.volume = value
+
+    def play(self):
+        if Clock.frames == self.last_frame:
+            self.coalesced += 1
+            return False
+        for i in range(len(self.voices)):
+            voice = self.voices[(self.next_voice + i) % len(self.voices)]
+            if voice.state != 'play':
+                self.next_voice = (self.next_voice + i + 1) % len(self.voices)
+                self.last_frame = Clock.frames
+                voice.play()
+                self.played += 1
+                return True
+        self.dropped += 1
+        return False
+
+    def stop(self):
+        for voice in self.voices:
+            voice.stop()
+
+    def unload(self):
+        for voice in self.voices:
+            voice.unload()
+
+    def stats(self):
+        return {'voices': len(self.voices), 'played': self.played,
+                'dropped': self.dropped, 'coalesced': self.coalesced}
 
 class MusicManager:
     _instance = None
 
-    def __new__(cls):
+    # Name -> file for every music track and sound effect; loaded on first use
+    SOUND_FILES = {
+        'menu_music': 'assets/audio/menu_music.mp3',
+        'background_music': 'assets/audio/background_music.mp3',
+        'stage_100_music': 'assets/audio/stage_100_music.mp3',
+        'walk_sound': 'assets/audio/walk.mp3',
+        'shoot_sound': 'assets/audio/shoot.mp3',
+        'jump_sound': 'assets/audio/jump.mp3',
+        'spawn_sound': 'assets/audio/spawn.mp3',
+        'die_sound': 'assets/audio/die.mp3',
+        'victory_sound': 'assets/audio/victory.mp3',
+        'teleport_sound': 'assets/audio/dangguitar.mp3',
+    }
+    MUSIC_TRACKS = ('menu_music', 'background_music', 'stage_100_music')
+    # Effect name -> share of the effects volume
+    EFFECT_VOLUMES = {
+        'walk_sound': 0.5,
+        'shoot_sound': 0.7,
+        'jump_sound': 0.6,
+        'spawn_sound': 0.5,
+        'die_sound': 0.8,
+        'victory_sound': 0.9,
+        'teleport_sound': 0.7,
+    }
+    # Effect name -> voices loaded for it, which is also its polyphony cap
+    EFFECT_VOICES = {
+        'walk_sound': 1,
+        'shoot_sound': 4,
+        'jump_sound': 2,
+        'spawn_sound': 2,
+        'die_sound': 1,
+        'victory_sound': 1,
+        'teleport_sound': 1,
+    }
+    # Loaded by the preloader; the large stage tracks are left to prefetch()
+    STARTUP_SOUNDS = ('menu_music',) + tuple(EFFECT_VOLUMES)
+    # Tracks idle for longer than this (seconds) are unloaded on the next music change
+    UNLOAD_AFTER = 30.0
+    # Music changes crossfade over this many seconds; one shared timer steps every fade
+    CROSSFADE_TIME = 1.5
+    FADE_STEP = 1.0 / 20.0
+    # Effects are played from PCM copies; music tracks stay compressed
+    audio_cache = AudioTranscodeCache()
+
+    def __new__(cls, sounds=None):
+        """Create the shared manager; sounds may hold results of load_file() by name."""
         if cls._instance is None:
             cls._instance = super(MusicManager, cls).__new__(cls)
-            # Initialize audio files only once
-            cls._instance.menu_music = SoundLoader.load('assets/audio/menu_music.mp3')
-            cls._instance.background_music = SoundLoader.load('assets/audio/background_music.mp3')
-            cls._instance.stage_100_music = SoundLoader.load('assets/audio/stage_100_music.mp3')
+            cls._instance.sounds = {}
+            cls._instance.last_used = {}
+            cls._instance.pending = {}
+            cls._instance.failed = set()  # Names whose load failed; not retried
+            cls._instance.executor = None
             cls._instance.current_music = None
-            cls._instance.fade_event = None
-
-            # Sound effects
-            cls._instance.walk_sound = SoundLoader.load('assets/audio/walk.mp3')
-            cls._instance.shoot_sound = SoundLoader.load('assets/audio/shoot.mp3')
-            cls._instance.jump_sound = SoundLoader.load('assets/audio/jump.mp3')
-            cls._instance.spawn_sound = SoundLoader.load('assets/audio/spawn.mp3')
-            cls._instance.die_sound = SoundLoader.load('assets/audio/die.mp3')
-            cls._instance.victory_sound = SoundLoader.load('assets/audio/victory.mp3')
-            cls._instance.teleport_sound = SoundLoader.load('assets/audio/dangguitar.mp3')
-            
+            cls._instance.cued_music = None
+            cls._instance.cue_name = None
+            # Sound -> (start volume, target volume, start time, duration, on_done)
+            cls._instance.envelopes = {}
+            # Stepping every envelope; started by fade(), cancelled once none are left
+            cls._instance.fade_event = Clock.create_trigger(
+                cls._instance.update_fades, cls.FADE_STEP, interval=True)
+
             # Default volumes
             cls._instance.effects_volume = 0.4
             cls._instance.music_volume = 0.68  # เพิ่มตัวแปรเก็บ volume ของเพลง
-            cls._instance.set_effects_volume(cls._instance.effects_volume)
+            for name, sound in (sounds or {}).items():
+                cls._instance.register(name, sound)
         return cls._instance
 
+    def register(self, name, sound):
+        """Store a loaded sound and give it the volume for its kind."""
+        self.pending.pop(name, None)
+        if not sound:
+            self.failed.add(name)
+            return
+        if name in self.EFFECT_VOLUMES:
+            sound.volume = self.effects_volume * self.EFFECT_VOLUMES[name]
+        self.sounds[name] = sound
+        self.last_used[name] = Clock.get_time()
+
+    @classmethod
+    def resolve_file(cls, name):
+        """Return the file to load for name: a cached WAV for effects, the MP3 otherwise."""
+        path = cls.SOUND_FILES[name]
+        if name in cls.EFFECT_VOLUMES:
+            return cls.audio_cache.resolve(path)
+        return path
+
+    @classmethod
+    def load_file(cls, name):
+        """Load a music track as one Sound, or an effect as a VoicePool."""
+        path = cls.resolve_file(name)
+        if name not in cls.EFFECT_VOICES:
+            return SoundLoader.load(path)
+        voices = [SoundLoader.load(path) for _ in range(cls.EFFECT_VOICES[name])]
+        voices = [voice for voice in voices if voice]
+        return VoicePool(name, voices) if voices else None
+
+    def get_sound(self, name):
+        """Return the sound for name, loading it now if it has not been loaded or prefetched.
+
+        A name that failed to load once returns None without trying again.
+        """
+        if name in self.failed:
+            return None
+        sound = self.sounds.get(name)
+        if sound is None:
+            future = self.pending.get(name)
+            try:
+                sound = future.result() if future else self.load_file(name)
+            except Exception as e:
+                print(f"Failed to load {name}: {e}")
+                sound = None
+            self.register(name, sound)
+        self.last_used[name] = Clock.get_time()
+        return sound
+
+    def prefetch(self, *names):
+        """Load sounds on a background thread so a later play does not block the frame."""
+        for name in names:
+            if name in self.sounds or name in self.pending or name in self.failed:
+                continue
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=1)
+            future = self.executor.submit(self.load_file, name)
+            self.pending[name] = future
+            # Hand the result over on the main thread
+            future.add_done_callback(
+                lambda f, name=name: Clock.schedule_once(lambda dt: self.finish_prefetch(name, f)))
+
+    def finish_prefetch(self, name, future):
+        """Register a prefetched sound unless get_sound already waited for it."""
+        if self.pending.get(name) is not future:
+            return
+        try:
+            self.register(name, future.result())
+        except Exception as e:
+            self.register(name, None)
+            print(f"Failed to prefetch {name}: {e}")
+            return
+        if name == self.cue_name and self.sounds.get(name):
+            self.start_cued(name, self.sounds[name])
+
+    def mark_stopped(self, sound):
+        """Start the idle timer of a track when it stops playing."""
+        for name, loaded in self.sounds.items():
+            if loaded is sound:
+                self.last_used[name] = Clock.get_time()
+
+    def unload_idle(self, max_idle=None):
+        """Unload music tracks that are not playing and have not been used for max_idle seconds."""
+        max_idle = self.UNLOAD_AFTER if max_idle is None else max_idle
+        now = Clock.get_time()
+        for name in self.MUSIC_TRACKS:
+            sound = self.sounds.get(name)
+            if not sound or sound is self.current_music or sound is self.cued_music or sound in self.envelopes:
+                continue
+            if now - self.last_used.get(name, now) >= max_idle:
+                sound.unload()
+                del self.sounds[name]
+                print(f"Unloaded idle track {name}")
+
+    @staticmethod
+    def music_for_stage(stage_number):
+        return 'background_music' if stage_number < 5 else 'stage_100_music'
+
     def play_menu_music(self):
-        """Play the menu background music."""
-        if self.current_music:
-            self.current_music.stop()
-        self.current_music = self.menu_music
-        if self.current_music:
-            self.current_music.volume = self.music_volume
-            self.current_music.loop = True
-            self.current_music.play()
+        """Crossfade to the menu background music."""
+        if self.switch_music(self.get_sound('menu_music')):
             print("Playing menu music")
+        self.unload_idle()
 
     def play_music(self, stage_number):
-        """Play the appropriate background music based on stage number."""
-        if stage_number < 5:
-            new_music = self.background_music
+        """Crossfade to the appropriate background music based on stage number."""
+        if self.switch_music(self.get_sound(self.music_for_stage(stage_number))):
+            print(f"Playing music for stage {stage_number}")
+        self.unload_idle()
+
+    def switch_music(self, new_music, duration=None):
+        """Make new_music the current track, crossfading from the old one; False if unchanged."""
+        duration = self.CROSSFADE_TIME if duration is None else duration
+        old_music = self.current_music
+        if new_music is old_music:
+            return False
+        self.current_music = new_music
+        if old_music:
+            self.fade(old_music, 0, duration, on_done=self.stop_faded)
+        if new_music:
+            new_music.loop = True
+            if new_music.state == 'play':
+                # Cued or still fading out: only the envelope changes
+                self.fade(new_music, self.music_volume, duration)
+            elif old_music:
+                new_music.volume = 0
+                new_music.play()
+                self.fade(new_music, self.music_volume, duration)
+            else:
+                new_music.volume = self.music_volume
+                new_music.play()
+        if self.cued_music is new_music:
+            self.cued_music = None
+        self.drop_cue()
+        return True
+
+    def cue_music(self, stage_number):
+        """Start the track for stage_number silently once loaded, so switching to it is only a fade."""
+        name = self.music_for_stage(stage_number)
+        sound = self.sounds.get(name)
+        if sound is not None and sound is self.current_music:
+            return
+        self.cue_name = name
+        if sound is None:
+            self.prefetch(name)
         else:
-            new_music = self.stage_100_music
-
-        if self.current_music != new_music:
-            if self.current_music:
-                self.current_music.stop()
-            self.current_music = new_music
-            if self.current_music:
-                self.current_music.volume = self.music_volume
-                self.current_music.loop = True
-                self.current_music.play()
-                print(f"Playing music for stage {stage_number}")
+            self.start_cued(name, sound)
 
-    def stop_music(self):
-        """Stop the currently playing music immediately."""
-        if self.current_music:
-            self.current_music.stop()
-            self.current_music = None
-        if self.fade_event:
+    def start_cued(self, name, sound):
+        if name != self.cue_name or sound is self.current_music:
+            return
+        self.cue_name = None
+        if sound.state != 'play':
+            sound.volume = 0
+            sound.loop = True
+            sound.play()
+        self.cued_music = sound
+
+    def drop_cue(self):
+        """Forget a pending cue and stop a cued track that did not become current."""
+        self.cue_name = None
+        sound, self.cued_music = self.cued_music, None
+        if sound and sound is not self.current_music and sound not in self.envelopes:
+            if sound.state == 'play':
+                self.stop_faded(sound)
+
+    def fade(self, sound, target, duration, on_done=None):
+        """Ramp sound.volume linearly to target over duration seconds on the shared fade timer."""
+        self.envelopes[sound] = (sound.volume, target, Clock.get_time(), duration, on_done)
+        if not self.fade_event.is_triggered:
+            self.fade_event()
+
+    def update_fades(self, dt):
+        """Advance every active envelope; the timer stops itself once none are left."""
+        now = Clock.get_time()
+        for sound, (start, target, began, duration, on_done) in list(self.envelopes.items()):
+            progress = min(1.0, (now - began) / duration) if duration > 0 else 1.0
+            sound.volume = start + (target - start) * progress
+            if progress >= 1.0:
+                del self.envelopes[sound]
+                if on_done:
+                    on_done(sound)
+        if not self.envelopes:
             self.fade_event.cancel()
-            self.fade_event = None
+
+    def stop_faded(self, sound):
+        sound.stop()
+        self.mark_stopped(sound)
+
+    def stop_music(self):
+        """Stop the current, fading and cued music immediately."""
+        for sound in list(self.envelopes) + [self.current_music, self.cued_music]:
+            if sound and sound.state == 'play':
+                self.stop_faded(sound)
+        self.envelopes.clear()
+        self.current_music = None
+        self.cued_music = None
+        self.cue_name = None
+        self.fade_event.cancel()
 
     def fade_out_music(self, duration=1.0):
-    
+        """Fade the current track to silence, then stop it; a cued track is stopped too."""
+        self.drop_cue()
         if not self.current_music or self.current_music.state != 'play':
             return
-        
-        if self.fade_event:
-            self.fade_event.cancel()
-
-        initial_volume = self.current_music.volume
-        step = initial_volume / (duration * 60)
-
-        def _fade(dt):
-            if self.current_music and self.current_music.state == 'play':
-                new_volume = max(0, self.current_music.volume - step)  # Clamp to 0
-                self.current_music.volume = new_volume
-                if new_volume <= 0:
-                    self.current_music.stop()
-                    self.current_music = None
-                    if self.fade_event:
-                        self.fade_event.cancel()
-                        self.fade_event = None
-            else:
-                if self.fade_event:
-                    self.fade_event.cancel()
-                    self.fade_event = None
-
-        self.fade_event = Clock.schedule_interval(_fade, 1.0 / 60.0)
+        self.fade(self.current_music, 0, duration, on_done=self.stop_faded)
+        self.current_music = None
 
     def set_music_volume(self, volume):
         """Set the volume for background music."""
         self.music_volume = volume
         if self.current_music:
-            self.current_music.volume = volume
+            if self.current_music in self.envelopes:
+                # Retarget the fade-in instead of jumping over it
+                self.fade(self.current_music, volume, self.CROSSFADE_TIME)
+            else:
+                self.current_music.volume = volume
 
     def set_effects_volume(self, volume):
         """Set the volume for all sound effects."""
         self.effects_volume = volume
-        if self.walk_sound:
-            self.walk_sound.volume = volume * 0.5
-        if self.shoot_sound:
-            self.shoot_sound.volume = volume * 0.7
-        if self.jump_sound:
-            self.jump_sound.volume = volume * 0.6
-        if self.spawn_sound:
-            self.spawn_sound.volume = volume * 0.5
-        if self.die_sound:
-            self.die_sound.volume = volume * 0.8
-        if self.victory_sound:  
-            self.victory_sound.volume = volume * 0.9
-        if self.teleport_sound:  
-            self.teleport_sound.volume = volume * 0.7    
+        for name, share in self.EFFECT_VOLUMES.items():
+            sound = self.sounds.get(name)
+            if sound:
+                sound.volume = volume * share
+
+    def play_effect(self, name):
+        pool = self.get_sound(name)
+        if pool:
+            pool.play()
+
+    def effect_stats(self):
+        """Played, dropped and coalesced trigger counts for every loaded effect."""
+        return {name: sound.stats() for name, sound in self.sounds.items() if isinstance(sound, VoicePool)}
 
     # Sound effect methods
     def play_walk(self):
-        if self.walk_sound:
-            self.walk_sound.play()
+        self.play_effect('walk_sound')
 
     def play_shoot(self):
-        if self.shoot_sound:
-            self.shoot_sound.play()
+        self.play_effect('shoot_sound')
 
     def play_jump(self):
-        if self.jump_sound:
-            self.jump_sound.play()
+        self.play_effect('jump_sound')
 
     def play_spawn(self):
-        if self.spawn_sound:
-            self.spawn_sound.play()
+        self.play_effect('spawn_sound')
 
     def play_die(self):
-        if self.die_sound:
-            self.die_sound.play()
+        self.play_effect('die_sound')
+
+    def play_victory(self):
+        self.play_effect('victory_sound')
 
-    def play_victory(self): 
-        if self.victory_sound:
-            self.victory_sound.play()
-    
     def play_teleport(self):
-        if self.teleport_sound:
-            self.teleport_sound.play()
\ No newline at end of file
+        self.play_effect('teleport_sound')
\ No newline at end of file
@@ -5,7 +5,6 @@ from kivy.uix.label import Label
 from kivy.uix.slider import Slider
 from kivy.uix.popup import Popup
 from kivy.app import App
-from components.game import Game
 
 class PauseMenu(BoxLayout):
     def __init__(self, game_instance, **kwargs):
@@ -120,6 +119,7 @@ class PauseMenu(BoxLayout):
     def exit_to_main_menu(self, instance):
         """Return to the main menu."""
         self.game_instance.music_manager.stop_music()
+        self.game_instance.dispose()
         app = App.get_running_app()
         app.root.clear_widgets()
         from main import MainMenu
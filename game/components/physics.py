@@ -0,0 +1,318 @@
+# physics.py
+"""Structure-of-arrays physics for the characters World simulates.
+
+Every character body (player, boss, enemies) is one row of a PhysicsStore.
+Its x/y/velocity attributes read and write that row, so AI code keeps working
+per body while gravity, integration, window clamping and platform landing run
+as a handful of NumPy operations over all rows at once.
+"""
+from bisect import bisect_left, bisect_right
+import numpy as np
+from .hitbox import Rect
+
+# Row flags
+GRAVITY = 1  # Pulled down every tick
+FLYING = 2  # Integrates x only; the body sets its own y
+BOUNCE = 4  # Reverses off the window sides instead of stopping
+LANDS = 8  # Stands on platforms and the ground
+
+class PlatformIndex:
+    """A stage's static platform hitboxes sorted by left edge.
+
+    Built once per stage. No platform is wider than max_width, so only those
+    whose left edge lies in [x0 - max_width, x1] can overlap the span x0..x1;
+    two binary searches find them. Platforms are referred to by their
+    position in this sorted order; ids maps a position back to the index in
+    the World's platform list.
+    """
+
+    def __init__(self, platforms=()):
+        rects = [platform.get_hitbox_rect() for platform in platforms]
+        self.ids = np.argsort([rect.x for rect in rects], kind='stable').astype(np.intp)
+        rects = [rects[i] for i in self.ids]
+        self.x = np.array([rect.x for rect in rects], dtype=float)
+        self.right = np.array([rect.right for rect in rects], dtype=float)
+        self.y = np.array([rect.y for rect in rects], dtype=float)
+        self.top = np.array([rect.top for rect in rects], dtype=float)
+        self.max_width = float((self.right - self.x).max()) if rects else 0.0
+        # Bodies whose bottom is outside this band cannot land on anything
+        self.low = float(self.top.min()) - 10 if rects else 0.0
+        self.high = float(self.top.max()) if rects else 0.0
+        self.lefts = self.x.tolist()  # For scalar queries without NumPy overhead
+        self.queries = 0
+        self.candidates = 0
+
+    def __len__(self):
+        return len(self.x)
+
+    def spans(self, x0, x1):
+        """Vectorized: [lo, hi) ranges of positions that may overlap each span x0..x1."""
+        self.queries += len(x0)
+        return (np.searchsorted(self.x, x0 - self.max_width, 'left'),
+                np.searchsorted(self.x, x1, 'right'))
+
+    def overlapping(self, x0, x1):
+        """Positions of the platforms overlapping the span x0..x1 horizontally."""
+        self.queries += 1
+        lo = bisect_left(self.lefts, x0 - self.max_width)
+        hi = bisect_right(self.lefts, x1)
+        right = self.right
+        found = [i for i in range(lo, hi) if right.item(i) >= x0]
+        self.candidates += hi - lo
+        return found
+
+    def supports(self, i, rect):
+        """Whether rect (a hitbox Rect) rests on platform i: overlapping, with its bottom near the top."""
+        top = self.top.item(i)
+        return (rect.x <= self.right.item(i) and rect.right >= self.x.item(i) and
+                rect.top >= self.y.item(i) and 0 <= top - rect.y <= 10)
+
+class PhysicsStore:
+    """Contiguous per-row arrays of position, velocity, size, hitbox and flags.
+
+    Rows are packed: remove() moves the last row into the freed slot and
+    updates that body's row index. A body outside any world keeps a private
+    one-row store, so bodies can be built and inspected on their own.
+    """
+
+    FLOAT_COLUMNS = ('x', 'y', 'vx', 'vy', 'w', 'h', 'prev_x', 'prev_y', 'hx', 'hy', 'hw', 'hh')
+    COLUMNS = FLOAT_COLUMNS + ('flags', 'facing', 'grounded', 'contact')
+    SCALAR_ROWS = 8  # Landing runs per row in Python up to this many landing rows
+
+    def __init__(self, capacity=64):
+        self.capacity = max(1, capacity)
+        self.count = 0
+        self.bodies = []  # Row -> body
+        for name in self.FLOAT_COLUMNS:
+            setattr(self, name, np.zeros(self.capacity))
+        self.flags = np.zeros(self.capacity, dtype=np.uint8)
+        self.facing = np.ones(self.capacity, dtype=bool)
+        self.grounded = np.zeros(self.capacity, dtype=bool)
+        self.contact = np.full(self.capacity, -1, dtype=np.intp)  # Platform position stood on, or -1
+        self.contact_hits = 0  # Landings confirmed on the remembered platform alone
+        self.scratch = Rect()  # Reused by land_each for each row's hitbox
+        self.masks = None
+        self.set_platforms(())
+
+    @classmethod
+    def single(cls, body):
+        """A one-row store holding body, for a body outside any world."""
+        store = cls(capacity=1)
+        store.bodies.append(body)
+        store.count = 1
+        body.store, body.row = store, 0
+        return store
+
+    def grow(self):
+        self.capacity *= 2
+        for name in self.COLUMNS:
+            old = getattr(self, name)
+            new = np.zeros(self.capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def add(self, body):
+        """Move body's row from wherever it lives now into this store."""
+        if body.store is self:
+            return
+        if self.count == self.capacity:
+            self.grow()
+        row = self.count
+        self.copy_row(body.store, body.row, row)
+        self.bodies.append(body)
+        self.count += 1
+        self.masks = None
+        body.store, body.row = self, row
+
+    def remove(self, body):
+        """Detach body into a private store, keeping its last state readable."""
+        if body.store is not self:
+            return
+        row = body.row
+        private = PhysicsStore.single(body)
+        private.copy_row(self, row, 0)
+        last = self.count - 1
+        if row != last:
+            self.copy_row(self, last, row)
+            moved = self.bodies[last]
+            self.bodies[row] = moved
+            moved.row = row
+        self.bodies.pop()
+        self.count -= 1
+        self.masks = None
+
+    def clear(self):
+        for body in self.bodies[:]:
+            self.remove(body)
+
+    def copy_row(self, source, source_row, row):
+        for name in self.COLUMNS:
+            getattr(self, name)[row] = getattr(source, name)[source_row]
+
+    def set_platforms(self, platforms):
+        """Index a new stage's platforms; remembered contacts refer to the old ones."""
+        self.platforms = PlatformIndex(platforms)
+        self.contact[:] = -1
+
+    def snap(self):
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+
+    def row_masks(self):
+        """Per-row flag masks, rebuilt only after rows were added or removed."""
+        if self.masks is None:
+            flags = self.flags[:self.count]
+            self.masks = (
+                np.where(flags & GRAVITY, 1.0, 0.0),  # gravity
+                np.where(flags & FLYING, 0.0, 1.0),  # moves in y
+                (flags & FLYING) == 0,  # clamped to the floor and ceiling
+                (flags & BOUNCE) != 0,
+                np.flatnonzero(flags & LANDS),
+            )
+        return self.masks
+
+    def step(self, width, height, gravity):
+        """One tick of gravity, integration, window clamping and platform landing."""
+        n = self.count
+        if not n:
+            return
+        gravity_mask, moves_y, walks, bounce, landers = self.row_masks()
+        x, y, vx, vy = self.x[:n], self.y[:n], self.vx[:n], self.vy[:n]
+
+        vy -= gravity_mask * gravity
+        x += vx
+        y += vy * moves_y
+
+        # Window sides: bouncing bodies turn around, the rest stop
+        max_x = width - self.w[:n]
+        out = (x < 0) | (x > max_x)
+        if out.any():
+            left = x < 0
+            np.clip(x, 0, max_x, out=x)
+            turn = out & bounce
+            vx[turn] = np.where(left[turn], 1, -1) * np.abs(vx[turn])
+            self.facing[:n][turn] = left[turn]
+            vx[out & ~bounce] = 0
+
+        # Floor and ceiling, except for flyers which clamp their own y
+        max_y = height - self.h[:n]
+        out = walks & ((y < 0) | (y > max_y))
+        if out.any():
+            y[out] = np.clip(y[out], 0, max_y[out])
+            vy[out] = 0
+
+        self.grounded[:n] = False
+        if len(landers):
+            self.land(landers)
+
+    def land(self, rows):
+        """Put falling bodies on the platform they reach; a body also stands on the ground once y reaches 0.
+
+        A body first re-checks the platform it stood on last tick, which is
+        the usual outcome. Only the others look up the platform index. If
+        several platforms qualify, the latest in the World's list wins.
+        """
+        if len(rows) <= self.SCALAR_ROWS:
+            self.land_each(rows)
+            return
+        y, vy = self.y[rows], self.vy[rows]
+        hy, hh = self.hy[rows], self.hh[rows]
+        rect_x = self.x[rows] + self.hx[rows]
+        rect_w = self.hw[rows]
+        rect_y = y + hy
+        falling_top = y + vy + hh
+        platforms = self.platforms
+        on = np.full(len(rows), -1, dtype=np.intp)
+
+        def supported(owner, position):
+            """Landing test for body owner on platform position, as aligned arrays."""
+            gap = platforms.top[position] - rect_y[owner]
+            return ((rect_x[owner] <= platforms.right[position]) &
+                    (rect_x[owner] + rect_w[owner] >= platforms.x[position]) &
+                    (gap >= 0) & (gap <= 10) & (rect_y[owner] + hh[owner] >= platforms.y[position]) &
+                    (falling_top[owner] > platforms.top[position]) & (vy[owner] <= 0))
+
+        if len(platforms):
+            kept = np.flatnonzero(self.contact[rows] >= 0)
+            if len(kept):
+                position = self.contact[rows[kept]]
+                held = supported(kept, position)
+                on[kept[held]] = position[held]
+                self.contact_hits += int(np.count_nonzero(held))
+            rest = np.flatnonzero((on < 0) & (rect_y >= platforms.low) & (rect_y <= platforms.high))
+            if len(rest):
+                lo, hi = platforms.spans(rect_x[rest], rect_x[rest] + rect_w[rest])
+                counts = hi - lo
+                owner = np.repeat(rest, counts)
+                position = np.repeat(lo, counts) + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+                platforms.candidates += len(position)
+                held = supported(owner, position)
+                if held.any():
+                    owner, position = owner[held], position[held]
+                    # Latest platform in World order per body: sort by id, the last write wins
+                    order = np.argsort(platforms.ids[position], kind='stable')
+                    on[owner[order]] = position[order]
+        landed = on >= 0
+        if landed.any():
+            y[landed] = platforms.top[on[landed]] - hy[landed]
+            vy[landed] = 0
+        ground = y <= 0
+        y[ground] = 0
+        vy[ground] = 0
+        self.y[rows] = y
+        self.vy[rows] = vy
+        self.grounded[rows] = landed | ground
+        self.contact[rows] = on
+
+    def land_each(self, rows):
+        """land() one row at a time, for the few rows where NumPy call overhead would dominate."""
+        platforms = self.platforms
+        ids = platforms.ids
+        for row in rows.tolist():
+            y, vy = self.y.item(row), self.vy.item(row)
+            rect_x, rect_y = self.x.item(row) + self.hx.item(row), y + self.hy.item(row)
+            rect = self.scratch.set(rect_x, rect_y, self.hw.item(row), self.hh.item(row))
+            falling_top = y + vy + self.hh.item(row)
+            on = -1
+            if vy <= 0 and len(platforms):
+                contact = self.contact.item(row)
+                if contact >= 0 and falling_top > platforms.top.item(contact) and platforms.supports(contact, rect):
+                    on = contact
+                    self.contact_hits += 1
+                elif platforms.low <= rect_y <= platforms.high:
+                    for i in platforms.overlapping(rect.x, rect.right):
+                        if (falling_top > platforms.top.item(i) and platforms.supports(i, rect) and
+                                (on < 0 or ids.item(i) > ids.item(on))):
+                            on = i
+            if on >= 0:
+                y = platforms.top.item(on) - self.hy.item(row)
+                vy = 0
+            grounded = on >= 0
+            if y <= 0:
+                y = vy = 0
+                grounded = True
+            self.y[row] = y
+            self.vy[row] = vy
+            self.grounded[row] = grounded
+            self.contact[row] = on
+
+    def stats(self):
+        return {
+            'rows': self.count,
+            'platforms': len(self.platforms),
+            'contact_hits': self.contact_hits,
+            'index_queries': self.platforms.queries,
+            'index_candidates': self.platforms.candidates,
+        }
+
+def column(name):
+    """Property backed by one PhysicsStore column at the body's row."""
+
+    def fget(self):
+        return getattr(self.store, name).item(self.row)
+
+    def fset(self, value):
+        getattr(self.store, name)[self.row] = value
+
+    return property(fget, fset)
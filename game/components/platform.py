@@ -1,87 +1,84 @@
 from kivy.uix.widget import Widget
 from kivy.properties import ObjectProperty
-from kivy.graphics import Rectangle, PushMatrix, PopMatrix, Rotate, Line, Color
-from kivy.core.window import Window
+from kivy.graphics import Rectangle, PushMatrix, PopMatrix, Rotate
 from kivy.graphics.texture import Texture
 from PIL import Image
 import os
-from .hitbox import Hitbox
+from .sprites import Outline
 
 class Platform(Widget):
+    """Sprite for a PlatformBody."""
     texture = ObjectProperty(None)
-    hitbox = ObjectProperty(None)
 
-    def __init__(self, pos: tuple, size: tuple = (93, 24), **kwargs):
+    GRASS_PATH = 'assets/images/grass.png'
+    # Uploaded textures shared by every platform, keyed by (path, size); size None keeps the source resolution
+    _textures = {}
+
+    def __init__(self, body, **kwargs):
         super().__init__(**kwargs)
-        self.pos = pos
-        self.size = size
-        self.hitbox = Hitbox(offset_x=0, offset_y=0, width=self.size[0], height=self.size[1])
+        self.body = body
+        self.pos = body.pos
+        self.size = body.size
         self.debug_hitbox_visible = False
-        self.debug_hitbox_instruction = None
-        self.load_texture('assets/images/grass.png')
+        self.debug_outline = Outline(color=(0, 1, 0, 1))  # Green outline for platforms
+        self.debug_outline.show(False)
+        self.canvas.after.add(self.debug_outline.group)
+        self.load_texture(self.GRASS_PATH)
         self.update_graphics()
-        # Bind to size changes to update hitbox
-        self.bind(size=self.update_hitbox_size)
+        self.bind(pos=self.update_rect, size=self.update_rect)
+
+    @classmethod
+    def shared_texture(cls, path: str, size: tuple = None):
+        """Return the uploaded texture for path, resampled to size only when one is asked for."""
+        key = (path, size)
+        texture = cls._textures.get(key)
+        if texture is None:
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"Image file not found: {path}")
+            with Image.open(path) as image:
+                image = image.convert('RGBA')
+                if size is not None:
+                    image = image.resize(size, Image.Resampling.LANCZOS)
+                texture = Texture.create(size=image.size, colorfmt='rgba')
+                texture.blit_buffer(image.tobytes(), colorfmt='rgba', bufferfmt='ubyte')
+            texture.wrap = 'repeat'
+            cls._textures[key] = texture
+        return texture
 
     def load_texture(self, path: str):
-        if not os.path.exists(path):
-            raise FileNotFoundError(f"Image file not found: {path}")
-        with Image.open(path) as image:
-            self.texture = Texture.create(size=(self.size[0], self.size[1]), colorfmt='rgba')
-            # Resize image to match dynamic platform size
-            resized_image = image.resize((int(self.size[0]), int(self.size[1])), Image.Resampling.LANCZOS)
-            self.texture.blit_buffer(resized_image.tobytes(), colorfmt='rgba', bufferfmt='ubyte')
-            self.texture.wrap = 'repeat'
+        self.texture = Platform.shared_texture(path)
+
+    def tex_coords(self):
+        """Repeat the texture across the platform width, keeping the tile's aspect ratio."""
+        aspect = self.texture.width / self.texture.height
+        repeat = max(1, round(self.width / (self.height * aspect))) if self.height > 0 else 1
+        return (0, 0, repeat, 0, repeat, 1, 0, 1)
 
     def update_graphics(self):
         self.canvas.clear()
         with self.canvas:
             PushMatrix()
             self.rot = Rotate(angle=180, origin=(self.center_x, self.center_y))
-            self.rect = Rectangle(pos=self.pos, size=self.size, texture=self.texture)
+            self.rect = Rectangle(pos=self.pos, size=self.size, texture=self.texture, tex_coords=self.tex_coords())
             PopMatrix()
-        self.bind(pos=self.update_rect)
 
     def update_rect(self, *args):
         self.rect.pos = self.pos
         self.rect.size = self.size
+        self.rect.tex_coords = self.tex_coords()
         self.rot.origin = (self.center_x, self.center_y)
         self.update_hitbox_debug()
 
-    def update_hitbox_size(self, instance, value):
-        """Update hitbox size when platform size changes."""
-        self.hitbox.width = self.size[0]
-        self.hitbox.height = self.size[1]
-        self.load_texture('assets/images/grass.png')  # Reload texture with new size
-        self.update_graphics()
-        self.update_hitbox_debug()
-
     def get_hitbox_rect(self):
-        return self.hitbox.get_rect(self.x, self.y)
+        return self.body.get_hitbox_rect()
 
     def toggle_hitbox_debug(self, visible: bool):
         """Show or hide the hitbox debug outline."""
         self.debug_hitbox_visible = visible
-        if visible:
-            self.update_hitbox_debug()
-        else:
-            if self.debug_hitbox_instruction:
-                self.canvas.after.remove(self.debug_hitbox_instruction)
-                self.debug_hitbox_instruction = None
+        self.debug_outline.show(visible)
+        self.update_hitbox_debug()
 
     def update_hitbox_debug(self):
         """Update the hitbox debug outline position and size."""
-        if not self.debug_hitbox_visible:
-            return
-        hitbox_rect = self.get_hitbox_rect()
-        if self.debug_hitbox_instruction:
-            self.canvas.after.remove(self.debug_hitbox_instruction)
-        with self.canvas.after:
-            Color(0, 1, 0, 1)  # Green outline for platforms
-            self.debug_hitbox_instruction = Line(
-                rectangle=(
-                    hitbox_rect['x'], hitbox_rect['y'],
-                    hitbox_rect['width'], hitbox_rect['height']
-                ),
-                width=1
-            )
\ No newline at end of file
+        if self.debug_hitbox_visible:
+            self.debug_outline.place(self.get_hitbox_rect())
\ No newline at end of file
@@ -1,64 +1,61 @@
 from kivy.uix.widget import Widget
-from kivy.properties import NumericProperty, ReferenceListProperty, ObjectProperty, BooleanProperty
-from kivy.vector import Vector
-from kivy.clock import Clock
-from kivy.core.window import Window
-from kivy.graphics import Line, Color, Rectangle
+from kivy.properties import ObjectProperty, BooleanProperty
 from .gif_loader import GifLoader
-from .hitbox import Hitbox
+from .sprites import Sprite, Outline, SpriteLayers
 
 class Character(Widget):
-    velocity_x = NumericProperty(0)
-    velocity_y = NumericProperty(0)
-    velocity = ReferenceListProperty(velocity_x, velocity_y)
+    """Animated sprite that mirrors a CharacterBody from the World.
+
+    Everything is drawn by Sprites built in __init__ into fixed layers:
+    the character itself, overlays such as HP bars above it, and the hitbox
+    outline on top. Later frames only update them in place.
+    """
     texture = ObjectProperty(None)
     facing_right = BooleanProperty(True)
-    hitbox = ObjectProperty(None)
-    health = NumericProperty(100)  # Default health
-    max_health = NumericProperty(100)  # Maximum health for HP bar scaling
 
-    def __init__(self, gif_path: str, size: tuple = (80, 80), health=100, **kwargs):
+    FRAME_DURATION = 0.1  # Seconds per animation frame, advanced by the Game scheduler
+    LAYERS = ('body', 'overlay', 'debug')
+
+    def __init__(self, body, gif_path: str, **kwargs):
         super().__init__(**kwargs)
-        self.size = size
-        self.health = health
-        self.max_health = health  # Set max_health to initial health
-        self.hitbox = Hitbox(offset_x=10, offset_y=0, width=size[0]-20, height=size[1])
+        self.body = body
+        self.pos = body.pos
+        self.size = body.size
+        self.facing_right = body.facing_right
+        self.layers = SpriteLayers(self.canvas, self.LAYERS)
+        self.sprite = self.layers.add('body', Sprite())
+        self.debug_outline = self.layers.add('debug', Outline(color=(1, 0, 0, 1)))
+        self.debug_outline.show(False)
         self.debug_hitbox_visible = False
-        self.debug_hitbox_instruction = None
-        self.rect_instruction = None
         try:
             self.load_animations(gif_path)
-            Clock.schedule_interval(self.update_frame, 0.1)
         except Exception as e:
             print(f"Failed to load animations from {gif_path}: {e}")
             self.texture = None
             self.load_fallback()
         self.update_graphics()
+        self.update_rect()
+        self.bind(pos=self.update_rect, size=self.update_rect)
 
     def load_animations(self, gif_path: str):
-        self.frames = GifLoader.load_gif_frames(gif_path)
-        if not self.frames:
+        # Textures are shared through the process-wide clip cache
+        clip = GifLoader.load_clip(gif_path)
+        if not clip.frame_count:
             raise ValueError(f"No frames loaded from {gif_path}")
         self.current_frame = 0
-        self.frame_count = len(self.frames)
-        self.original_frames = GifLoader.create_textures(self.frames)
-        self.flipped_frames = GifLoader.create_flipped_textures(self.frames)
+        self.frame_count = clip.frame_count
+        self.original_frames = clip.textures
+        self.flipped_frames = clip.flipped_textures
         if not self.original_frames or not self.flipped_frames:
             raise ValueError("Failed to create textures from GIF frames")
         self.texture = self.original_frames[0]
 
     def load_fallback(self):
-        with self.canvas:
-            Color(1, 0, 0, 1)
-            self.rect_instruction = Rectangle(pos=self.pos, size=self.size)
+        self.frame_count = 0
+        self.sprite.set_color((1, 0, 0, 1))
 
     def update_graphics(self):
-        if self.rect_instruction:
-            self.canvas.remove(self.rect_instruction)
-        with self.canvas:
-            Color(1, 1, 1, 1)
-            self.rect_instruction = Rectangle(pos=self.pos, size=self.size, texture=self.texture)
-        self.bind(pos=self.update_rect, size=self.update_rect)
+        self.sprite.set_texture(self.texture)
 
     def update_frame(self, dt: float):
         if not self.frame_count or not self.original_frames:
@@ -66,75 +63,30 @@ class Character(Widget):
         self.current_frame = (self.current_frame + 1) % self.frame_count
         self.texture = self.original_frames[self.current_frame] if self.facing_right else self.flipped_frames[self.current_frame]
         self.update_graphics()
-        self.canvas.ask_update()
-
-    def move(self):
-        self.pos = Vector(*self.velocity) + self.pos
-        self.x = max(0, min(self.x, Window.width - self.width))
 
-    def on_velocity_x(self, instance, value: float):
-        self.facing_right = value >= 0
+    def sync(self, alpha=1.0):
+        """Copy size and facing from the body, and its position alpha of the way into the last tick."""
+        self.pos = self.body.lerp_pos(alpha)
+        self.size = self.body.size
+        self.facing_right = self.body.facing_right
+        if self.debug_hitbox_visible:
+            self.update_hitbox_debug()
 
     def get_hitbox_rect(self):
-        return self.hitbox.get_rect(self.x, self.y)
+        return self.body.get_hitbox_rect()
 
     def toggle_hitbox_debug(self, visible: bool):
         self.debug_hitbox_visible = visible
-        if visible:
-            self.update_hitbox_debug()
-        else:
-            if self.debug_hitbox_instruction:
-                self.canvas.after.remove(self.debug_hitbox_instruction)
-                self.debug_hitbox_instruction = None
+        self.debug_outline.show(visible)
+        self.update_hitbox_debug()
 
     def update_hitbox_debug(self):
-        if not self.debug_hitbox_visible:
-            return
-        hitbox_rect = self.get_hitbox_rect()
-        if self.debug_hitbox_instruction:
-            self.canvas.after.remove(self.debug_hitbox_instruction)
-        with self.canvas.after:
-            Color(1, 0, 0, 1)
-            self.debug_hitbox_instruction = Line(
-                rectangle=(hitbox_rect['x'], hitbox_rect['y'], hitbox_rect['width'], hitbox_rect['height']),
-                width=1
-            )
+        if self.debug_hitbox_visible:
+            self.debug_outline.place(self.get_hitbox_rect())
 
     def update_rect(self, *args):
-        if self.rect_instruction:
-            self.rect_instruction.pos = self.pos
-            self.rect_instruction.size = self.size
-
-    def take_damage(self, damage):
-        """Reduce health and let binding handle UI update."""
-        self.health = max(0, self.health - damage)
-        if self.health <= 0:
-            print("Player has died!")
+        self.sprite.place(self.pos, self.size)
 
 class Player(Character):
-    def __init__(self, health=3, **kwargs):
-        super().__init__(gif_path='assets/gifs/dino1.gif', health=health, **kwargs)
-    
-    def move(self):
-        """Move the player and ensure they stay within window boundaries."""
-        new_pos = Vector(*self.velocity) + self.pos
-        
-        # Horizontal boundary checks
-        if new_pos[0] < 0:
-            new_pos[0] = 0
-            self.velocity_x = 0  # Stop movement to the left
-        elif new_pos[0] > Window.width - self.width:
-            new_pos[0] = Window.width - self.width
-            self.velocity_x = 0  # Stop movement to the right
-            
-        # Vertical boundary checks
-        if new_pos[1] < 0:
-            new_pos[1] = 0
-            self.velocity_y = 0  # Stop downward movement
-        elif new_pos[1] > Window.height - self.height:
-            new_pos[1] = Window.height - self.height
-            self.velocity_y = 0  # Stop upward movement
-            
-        self.pos = new_pos
-        if self.debug_hitbox_visible:
-            self.update_hitbox_debug()
\ No newline at end of file
+    def __init__(self, body, **kwargs):
+        super().__init__(body, gif_path='assets/gifs/dino1.gif', **kwargs)
@@ -0,0 +1,55 @@
+# pool.py
+"""Enemy bodies kept for reuse across stages, restarts and boss summons.
+
+Building an enemy sets up a physics row, a hitbox and, in the Game, a
+sprite with its animation. The pool builds each body once and afterwards
+hands out idle ones reset to their new position, so spawning costs an
+attribute reset and the view can keep one sprite per body.
+"""
+
+class EnemyPool:
+    """Idle enemy bodies by class, built ahead by prewarm() or on demand by acquire()."""
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.idle = {}  # Class -> idle bodies
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+
+    def build(self, enemy_class, x, y, width, height):
+        body = enemy_class(x, y, width, height, rng=self.rng)
+        self.created += 1
+        return body
+
+    def prewarm(self, enemy_class, count, width=80, height=80):
+        """Build idle bodies of enemy_class until at least count are idle."""
+        idle = self.idle.setdefault(enemy_class, [])
+        while len(idle) < count:
+            idle.append(self.build(enemy_class, 0, 0, width, height))
+
+    def acquire(self, enemy_class, x, y, width=80, height=80):
+        """An enemy_class body at (x, y) with full health and fresh AI state."""
+        idle = self.idle.get(enemy_class)
+        if not idle:
+            return self.build(enemy_class, x, y, width, height)
+        body = idle.pop()
+        body.respawn(x, y, width, height)
+        self.reused += 1
+        return body
+
+    def release(self, body):
+        """Take back a body the World no longer simulates; it must not be used until acquired again."""
+        self.idle.setdefault(type(body), []).append(body)
+        self.released += 1
+
+    def idle_bodies(self):
+        return [body for idle in self.idle.values() for body in idle]
+
+    def stats(self):
+        return {
+            'created': self.created,
+            'reused': self.reused,
+            'released': self.released,
+            'idle': sum(len(idle) for idle in self.idle.values()),
+        }
@@ -0,0 +1,107 @@
+# preloader.py
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.label import Label
+from kivy.uix.progressbar import ProgressBar
+from kivy.clock import Clock
+from concurrent.futures import ThreadPoolExecutor
+import os
+import time
+from .gif_loader import GifLoader
+from .music_manager import MusicManager
+
+class AssetPreloader:
+    """Decodes GIFs and audio on a thread pool, then uploads textures on the main thread.
+
+    Call step() once per frame: it collects finished decodes and runs at most one
+    upload (an atlas group or a single clip) so no frame does all the GPU work.
+    """
+
+    def __init__(self, gif_paths=(), max_workers=4):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.start_time = time.perf_counter()
+        self.gif_futures = {}
+        self.sound_futures = {}
+        self.uploads = []
+        self.finished = False
+
+        groups = [[os.path.normpath(path) for path in group] for group in GifLoader.ATLAS_GROUPS]
+        clips = [os.path.normpath(path) for path in gif_paths if os.path.exists(path)]
+        for path in [path for group in groups for path in group] + clips:
+            self.gif_futures[path] = self.executor.submit(GifLoader.load_gif_array, path)
+        if MusicManager._instance is None:
+            for name in MusicManager.STARTUP_SOUNDS:
+                self.sound_futures[name] = self.executor.submit(MusicManager.load_file, name)
+
+        self.upload_queue = [('atlas', group) for group in groups] + [('clip', [path]) for path in clips]
+        if self.sound_futures:
+            self.upload_queue.append(('sounds', []))
+        self.total = len(self.gif_futures) + len(self.sound_futures) + len(self.upload_queue)
+
+    @property
+    def progress(self):
+        decoded = sum(f.done() for f in self.gif_futures.values()) + sum(f.done() for f in self.sound_futures.values())
+        return (decoded + len(self.uploads)) / self.total if self.total else 1.0
+
+    def result(self, future, name):
+        try:
+            return future.result()
+        except Exception as e:
+            print(f"Preloader: failed to load {name}: {e}")
+            return None
+
+    def step(self):
+        """Run the next main-thread upload whose inputs are decoded; return True when done."""
+        if self.finished:
+            return True
+        if self.upload_queue:
+            kind, paths = self.upload_queue[0]
+            futures = [self.gif_futures[path] for path in paths] if kind != 'sounds' else list(self.sound_futures.values())
+            if not all(f.done() for f in futures):
+                return False
+            self.upload_queue.pop(0)
+            if kind == 'atlas':
+                decoded = {path: self.result(self.gif_futures[path], path) for path in paths}
+                if all(frames is not None for frames in decoded.values()):
+                    GifLoader.load_atlas(paths, decoded)
+            elif kind == 'clip':
+                frames = self.result(self.gif_futures[paths[0]], paths[0])
+                if frames is not None:
+                    GifLoader.load_clip(paths[0], frames)
+            else:
+                MusicManager({name: self.result(f, name) for name, f in self.sound_futures.items()})
+            self.uploads.append(kind)
+            return False
+        self.finished = True
+        self.executor.shutdown(wait=False)
+        print(f"Preloader: assets ready in {time.perf_counter() - self.start_time:.2f}s")
+        return True
+
+class LoadingScreen(BoxLayout):
+    """Lightweight progress screen shown while AssetPreloader runs."""
+
+    def __init__(self, on_complete, gif_paths=(), **kwargs):
+        super().__init__(**kwargs)
+        self.orientation = 'vertical'
+        self.padding = 200
+        self.spacing = 20
+        self.on_complete = on_complete
+        self.preloader = AssetPreloader(gif_paths=gif_paths)
+        self.dots = 0
+        self.label = Label(text='Loading', font_size=48, size_hint=(1, 0.6))
+        self.add_widget(self.label)
+        self.progress_bar = ProgressBar(max=1.0, value=0, size_hint=(1, 0.1))
+        self.add_widget(self.progress_bar)
+        self.step_event = Clock.schedule_interval(self.update, 0)
+        self.dots_event = Clock.schedule_interval(self.animate_label, 0.3)
+
+    def animate_label(self, dt):
+        self.dots = (self.dots + 1) % 4
+        self.label.text = 'Loading' + '.' * self.dots
+
+    def update(self, dt):
+        done = self.preloader.step()
+        self.progress_bar.value = self.preloader.progress
+        if done:
+            self.step_event.cancel()
+            self.dots_event.cancel()
+            self.on_complete()
@@ -0,0 +1,126 @@
+# projectiles.py
+"""Every live shot as a row of preallocated NumPy arrays.
+
+World spawns, moves, culls and collides shots with array operations, and
+ProjectileLayer draws them all with one Mesh built from the same arrays.
+"""
+import math
+import numpy as np
+
+PLAYER = 0
+ENEMY = 1
+
+class ProjectileStore:
+    """Rows of position, velocity, size, rotation, owner and time to live.
+
+    Rows are packed: removing shots fills their slots with the last live
+    rows, so the first count rows are always the live ones.
+    """
+
+    HITBOX_SIZE = 20  # Every shot collides as a 20x20 square at its position
+    TTL = 10.0  # Seconds before a shot is dropped even if still on screen
+    FLOAT_COLUMNS = ('x', 'y', 'vx', 'vy', 'w', 'h', 'prev_x', 'prev_y', 'rotation', 'ttl')
+
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self.count = 0
+        self.spawned = 0
+        self.removed = 0
+        for name in self.FLOAT_COLUMNS:
+            setattr(self, name, np.zeros(capacity))
+        self.owner = np.zeros(capacity, dtype=np.uint8)
+
+    def columns(self):
+        return [getattr(self, name) for name in self.FLOAT_COLUMNS] + [self.owner]
+
+    def grow(self):
+        self.capacity *= 2
+        for name in self.FLOAT_COLUMNS + ('owner',):
+            old = getattr(self, name)
+            new = np.zeros(self.capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def spawn(self, owner, start_pos, target_pos, speed, size, ttl=TTL):
+        """Add a shot flying from start_pos towards target_pos; returns its row."""
+        if self.count == self.capacity:
+            self.grow()
+        row = self.count
+        dx, dy = target_pos[0] - start_pos[0], target_pos[1] - start_pos[1]
+        distance = max(math.hypot(dx, dy), 0.1)
+        self.x[row] = self.prev_x[row] = start_pos[0]
+        self.y[row] = self.prev_y[row] = start_pos[1]
+        self.vx[row] = dx / distance * speed
+        self.vy[row] = dy / distance * speed
+        self.w[row], self.h[row] = size
+        self.rotation[row] = math.degrees(math.atan2(dy, dx))
+        self.ttl[row] = ttl
+        self.owner[row] = owner
+        self.count += 1
+        self.spawned += 1
+        return row
+
+    def clear(self):
+        self.removed += self.count
+        self.count = 0
+
+    def remove(self, dead):
+        """Swap-remove the rows where the boolean mask dead (one entry per live row) is set."""
+        n = self.count
+        kept = n - int(np.count_nonzero(dead))
+        if kept == n:
+            return
+        # Dead rows inside the kept range take the live rows from beyond it
+        holes = np.flatnonzero(dead[:kept])
+        movers = kept + np.flatnonzero(~dead[kept:])
+        for column in self.columns():
+            column[holes] = column[movers]
+        self.count = kept
+        self.removed += n - kept
+
+    def snap(self):
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+
+    def move(self, dt, width, height):
+        """Advance every shot and drop those that left the window or ran out of time."""
+        n = self.count
+        if not n:
+            return
+        x, y = self.x[:n], self.y[:n]
+        x += self.vx[:n]
+        y += self.vy[:n]
+        ttl = self.ttl[:n]
+        ttl -= dt
+        self.remove((x < 0) | (x > width) | (y < 0) | (y > height) | (ttl <= 0))
+
+    def hits(self, rows, rect):
+        """Boolean mask over rows of shots whose hitbox overlaps rect (a hitbox Rect)."""
+        x, y = self.x[rows], self.y[rows]
+        size = self.HITBOX_SIZE
+        return (x <= rect.right) & (x + size >= rect.x) & (y <= rect.top) & (y + size >= rect.y)
+
+    def quad_vertices(self, alpha, out=None):
+        """Mesh vertices (x, y, u, v) for the four corners of every shot, rotated about its center.
+
+        Positions are interpolated alpha of the way from the previous tick.
+        With out given, fills it for the first len(out) shots.
+        """
+        n = self.count if out is None else len(out)
+        x = self.prev_x[:n] + (self.x[:n] - self.prev_x[:n]) * alpha
+        y = self.prev_y[:n] + (self.y[:n] - self.prev_y[:n]) * alpha
+        half_w, half_h = self.w[:n] / 2, self.h[:n] / 2
+        angle = np.radians(self.rotation[:n])
+        cos, sin = np.cos(angle), np.sin(angle)
+        cx, cy = x + half_w, y + half_h
+        if out is None:
+            out = np.empty((n, 4, 4), dtype=np.float32)
+        # Corners in draw order: bottom-left, bottom-right, top-right, top-left
+        for corner, (sx, sy) in enumerate(((-1, -1), (1, -1), (1, 1), (-1, 1))):
+            dx, dy = sx * half_w, sy * half_h
+            out[:, corner, 0] = cx + dx * cos - dy * sin
+            out[:, corner, 1] = cy + dx * sin + dy * cos
+            out[:, corner, 2] = (sx + 1) / 2
+            out[:, corner, 3] = (sy + 1) / 2
+        return out
@@ -0,0 +1,87 @@
+# scheduler.py
+import time
+
+class System:
+    """A callback run by TickScheduler every divisor ticks, with its timing."""
+
+    def __init__(self, name, callback, divisor=1):
+        self.name = name
+        self.callback = callback
+        self.divisor = max(1, int(divisor))
+        self.elapsed = 0.0  # dt accumulated since the last run
+        self.runs = 0
+        self.total_time = 0.0
+        self.last_time = 0.0
+        self.max_time = 0.0
+
+    def record(self, seconds):
+        self.runs += 1
+        self.total_time += seconds
+        self.last_time = seconds
+        if seconds > self.max_time:
+            self.max_time = seconds
+
+class TickScheduler:
+    """Runs registered systems in registration order from a single tick.
+
+    A system with divisor n runs on every nth tick and receives the dt summed
+    over those ticks. Plain Python, so World uses it for its simulation passes
+    and Game drives one from a single Clock event.
+    """
+
+    def __init__(self):
+        self.systems = []
+        self.ticks = 0
+        self.last_callbacks = 0  # Systems that ran on the last tick
+        self.last_tick_time = 0.0
+
+    def add(self, name, callback, divisor=1):
+        if any(system.name == name for system in self.systems):
+            raise ValueError(f"System {name!r} is already registered")
+        system = System(name, callback, divisor)
+        self.systems.append(system)
+        return system
+
+    def remove(self, name):
+        self.systems = [system for system in self.systems if system.name != name]
+
+    def tick(self, dt):
+        self.ticks += 1
+        ticks = self.ticks
+        clock = time.perf_counter
+        ran = 0
+        tick_start = start = clock()
+        for system in self.systems:
+            system.elapsed += dt
+            if ticks % system.divisor:
+                continue
+            system.callback(system.elapsed)
+            # One clock read per system: each run ends where the next starts
+            end = clock()
+            system.record(end - start)
+            start = end
+            system.elapsed = 0.0
+            ran += 1
+        self.last_callbacks = ran
+        self.last_tick_time = start - tick_start
+
+    def stats(self):
+        """Per-system runs and timings in milliseconds, in run order."""
+        return {
+            system.name: {
+                'divisor': system.divisor,
+                'runs': system.runs,
+                'last_ms': system.last_time * 1000,
+                'avg_ms': system.total_time / system.runs * 1000 if system.runs else 0.0,
+                'max_ms': system.max_time * 1000,
+            }
+            for system in self.systems
+        }
+
+    def report(self):
+        lines = [f"{'system':<18}{'every':>6}{'runs':>8}{'last ms':>10}{'avg ms':>10}{'max ms':>10}"]
+        for name, stats in self.stats().items():
+            lines.append(f"{name:<18}{stats['divisor']:>6}{stats['runs']:>8}{stats['last_ms']:>10.3f}"
+                         f"{stats['avg_ms']:>10.3f}{stats['max_ms']:>10.3f}")
+        lines.append(f"{self.last_callbacks} callbacks on the last tick ({self.last_tick_time * 1000:.3f} ms)")
+        return '\n'.join(lines)
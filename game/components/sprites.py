@@ -0,0 +1,86 @@
+# sprites.py
+"""Canvas instructions that entity widgets build once and then update in place.
+
+A Sprite is a colored quad (or ellipse), optionally textured and rotated.
+Animation swaps its texture, movement moves its shape, and hiding it only
+zeroes its alpha. SpriteLayers gives a canvas fixed InstructionGroups to
+draw sprites in a set order. Once an entity is built its canvas never gains
+or loses an instruction.
+"""
+from kivy.graphics import Color, Rectangle, Line, Rotate, PushMatrix, PopMatrix, InstructionGroup
+
+class Sprite:
+    """One shape drawn by a Color, an optional Rotate and the shape itself, grouped together."""
+
+    def __init__(self, color=(1, 1, 1, 1), texture=None, rotate=False, shape=Rectangle):
+        self.group = InstructionGroup()
+        self.color = Color(*color)
+        self.alpha = self.color.a
+        self.shape = shape(texture=texture)
+        self.rotation = Rotate() if rotate else None
+        self.group.add(self.color)
+        if self.rotation:
+            self.group.add(PushMatrix())
+            self.group.add(self.rotation)
+        self.group.add(self.shape)
+        if self.rotation:
+            self.group.add(PopMatrix())
+
+    def set_color(self, rgba):
+        self.color.rgba = rgba
+        self.alpha = self.color.a
+
+    def set_texture(self, texture):
+        if texture is not self.shape.texture:
+            self.shape.texture = texture
+
+    def set_angle(self, angle):
+        if self.rotation.angle != angle:
+            self.rotation.angle = angle
+
+    def place(self, pos, size):
+        pos, size = tuple(pos), tuple(size)
+        if pos != self.shape.pos or size != self.shape.size:
+            self.shape.pos = pos
+            self.shape.size = size
+            if self.rotation:
+                self.rotation.origin = (pos[0] + size[0] / 2, pos[1] + size[1] / 2)
+
+    def show(self, visible):
+        self.color.a = self.alpha if visible else 0
+
+class Outline:
+    """Unfilled rectangle drawn by one persistent Line, as used for hitbox debug drawing."""
+
+    def __init__(self, color=(1, 0, 0, 1), width=1):
+        self.group = InstructionGroup()
+        self.color = Color(*color)
+        self.alpha = self.color.a
+        self.line = Line(width=width)
+        self.rectangle = None  # Last (x, y, width, height) given to the Line
+        self.group.add(self.color)
+        self.group.add(self.line)
+
+    def place(self, rect):
+        """Outline rect (a hitbox Rect)."""
+        rectangle = (rect.x, rect.y, rect.width, rect.height)
+        if rectangle != self.rectangle:
+            self.line.rectangle = self.rectangle = rectangle
+
+    def show(self, visible):
+        self.color.a = self.alpha if visible else 0
+
+class SpriteLayers:
+    """InstructionGroups added to a canvas once, drawn in the order of names."""
+
+    def __init__(self, canvas, names):
+        self.groups = {}
+        for name in names:
+            group = InstructionGroup()
+            canvas.add(group)
+            self.groups[name] = group
+
+    def add(self, name, sprite):
+        """Draw sprite in layer name, after the sprites already there; returns the sprite."""
+        self.groups[name].add(sprite.group)
+        return sprite
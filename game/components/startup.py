@@ -0,0 +1,46 @@
+# startup.py
+import sys
+import time
+
+# Imported first by main.py, so this is close to interpreter start
+PROCESS_START = time.perf_counter()
+
+# Modules that belong to gameplay and should not load before the first frame
+GAMEPLAY_MODULES = [
+    'components.game', 'components.player', 'components.stage', 'components.boss',
+    'components.enemy', 'components.attack', 'components.portal', 'components.world',
+    'components.bodies',
+]
+
+class StartupReport:
+    """Timestamps for the path from launch to the first drawn frame.
+
+    mark() records named checkpoints in seconds since PROCESS_START; report()
+    prints them, lists gameplay modules that were imported too early and
+    compares the first frame against BUDGET.
+    """
+    BUDGET = 1.5  # seconds from launch to first frame
+    marks = {}
+
+    @classmethod
+    def mark(cls, name):
+        cls.marks.setdefault(name, time.perf_counter() - PROCESS_START)
+
+    @staticmethod
+    def eager_gameplay_modules():
+        return [name for name in GAMEPLAY_MODULES if name in sys.modules]
+
+    @classmethod
+    def within_budget(cls):
+        first_frame = cls.marks.get('first_frame')
+        return first_frame is not None and first_frame <= cls.BUDGET and not cls.eager_gameplay_modules()
+
+    @classmethod
+    def report(cls):
+        steps = ', '.join(f"{name} {seconds:.3f}s" for name, seconds in cls.marks.items())
+        status = 'OK' if cls.within_budget() else 'OVER BUDGET'
+        print(f"Startup: {steps} (budget {cls.BUDGET:.2f}s) {status}")
+        eager = cls.eager_gameplay_modules()
+        if eager:
+            print(f"Startup: gameplay modules imported before the first frame: {', '.join(eager)}")
+        return cls.within_budget()
@@ -0,0 +1,79 @@
+# texture_atlas.py
+from kivy.graphics.texture import Texture
+import numpy as np
+from typing import Dict, List
+
+class TextureAtlas:
+    """Packs RGBA frames into a few large page textures and hands out per-frame regions.
+
+    Frames are placed on horizontal shelves. Every page keeps one GPU texture, and
+    flipped frames are regions of the same page with mirrored texture coordinates.
+    """
+
+    def __init__(self, page_width=2048, max_page_height=2048, padding=1):
+        self.page_width = page_width
+        self.max_page_height = max_page_height
+        self.padding = padding
+        self.pages = []  # Page textures
+        self.nbytes = 0
+
+    def pack(self, frames_by_path: Dict[str, np.ndarray]) -> Dict[str, List[tuple]]:
+        """Return (page, x, y, width, height) placements for every frame of every path.
+
+        frames_by_path maps each path to a (frames, height, width, 4) RGBA array.
+        """
+        items = []
+        for path, frames in frames_by_path.items():
+            _, height, width, _ = frames.shape
+            if width > self.page_width or height > self.max_page_height:
+                raise ValueError(f"Frames of {path} do not fit an atlas page: {(width, height)}")
+            for index in range(len(frames)):
+                items.append((path, index, width, height))
+        # Tallest frames first keeps shelves tight
+        items.sort(key=lambda item: item[3], reverse=True)
+
+        placements = {path: [None] * len(frames) for path, frames in frames_by_path.items()}
+        page_sizes = [[0, 0]]
+        x = y = shelf_height = 0
+        for path, index, width, height in items:
+            if x + width > self.page_width:
+                x = 0
+                y += shelf_height + self.padding
+                shelf_height = 0
+            if y + height > self.max_page_height:
+                page_sizes.append([0, 0])
+                x = y = shelf_height = 0
+            placements[path][index] = (len(page_sizes) - 1, x, y, width, height)
+            x += width + self.padding
+            shelf_height = max(shelf_height, height)
+            # Pages are trimmed to the area actually used
+            page_sizes[-1][0] = max(page_sizes[-1][0], x - self.padding)
+            page_sizes[-1][1] = y + shelf_height
+        self.page_sizes = [tuple(size) for size in page_sizes]
+        return placements
+
+    def build(self, frames_by_path: Dict[str, np.ndarray]):
+        """Upload all frames and return {path: (textures, flipped_textures)} made of atlas regions."""
+        placements = self.pack(frames_by_path)
+        first_page = len(self.pages)
+        for width, height in self.page_sizes:
+            page = Texture.create(size=(width, height), colorfmt='rgba')
+            if page is None:
+                raise RuntimeError(f"Failed to create atlas page: size={(width, height)}")
+            self.pages.append(page)
+            self.nbytes += width * height * 4
+
+        regions = {}
+        for path, frames in frames_by_path.items():
+            textures = []
+            flipped_textures = []
+            for frame, (page_index, x, y, width, height) in zip(frames, placements[path]):
+                page = self.pages[first_page + page_index]
+                page.blit_buffer(memoryview(frame).cast('B'), pos=(x, y), size=(width, height),
+                                 colorfmt='rgba', bufferfmt='ubyte')
+                textures.append(page.get_region(x, y, width, height))
+                flipped = page.get_region(x, y, width, height)
+                flipped.flip_horizontal()
+                flipped_textures.append(flipped)
+            regions[path] = (textures, flipped_textures)
+        return regions
@@ -0,0 +1,500 @@
+# world.py
+"""Headless game simulation: stage flow, physics, AI and collisions without Kivy.
+
+World.step(dt) advances one tick. The Game widget feeds it input, draws its
+bodies and turns the names queued in World.events into sounds and music.
+"""
+import random
+from itertools import groupby
+from operator import itemgetter
+import numpy as np
+from .hitbox import Hitbox
+from .scheduler import TickScheduler
+from .physics import PhysicsStore
+from .projectiles import ProjectileStore, PLAYER, ENEMY
+from .broadphase import SpatialHash
+from .pool import EnemyPool
+from .bodies import PlayerBody, EnemyBody, FlyingEnemyBody, BossBody, PlatformBody, PortalBody
+
+BASE_WIDTH = 1280
+BASE_HEIGHT = 720
+
+class World:
+    ENABLE_PLAYER = True
+    ENABLE_ENEMIES = True
+    ENABLE_ATTACKS = True
+    ENABLE_BOSS = True
+    MAX_STAGES = 5
+    BOSS_STAGE = 5
+    TICK = 1.0 / 60.0  # Fixed simulation step; speeds and gravity are per tick
+    MAX_CATCH_UP = 5  # Most ticks advance() runs for one frame before dropping time
+    AI_DIVISOR = 2  # Enemy AI runs every other tick (30 Hz)
+    GRAVITY = 0.15  # Per tick, scaled by the window height
+    SEPARATION = 3  # Enemies closer than this many of their widths push apart
+    SUMMON_RESERVE = 2  # Idle enemies of each class kept ready on the boss stage for summons
+
+    # Platform generation constants
+    PLATFORM_WIDTH = 93
+    PLATFORM_HEIGHT = 24
+    BUFFER_ZONE = 20  # Minimum distance between platforms
+    NUM_PLATFORMS = 15
+    MAX_ATTEMPTS = 1000
+
+    def __init__(self, width=BASE_WIDTH, height=BASE_HEIGHT, initial_player_hp=100, seed=None):
+        self.width = width
+        self.height = height
+        self.initial_player_hp = initial_player_hp
+        self.rng = random.Random(seed)
+        self.time = 0.0
+        self.ticks = 0
+        self.accumulator = 0.0  # Real time not yet simulated, less than one TICK
+        self.dropped_time = 0.0  # Real time skipped because a frame needed more than MAX_CATCH_UP ticks
+        self.events = []  # Names of sounds and state changes since the view last drained them
+        self.player = None
+        self.boss = None
+        self.portal = None
+        self.platforms = []
+        self.enemies = []
+        self.projectiles = ProjectileStore()  # Player and enemy shots
+        self.character_grid = SpatialHash()  # Character hitboxes, for player shots
+        self.shot_grid = SpatialHash()  # Enemy shots, for player shots that meet them
+        self.enemy_grid = SpatialHash(cell_size=self.SEPARATION * 80)  # Enemy positions, for separation
+        self.timers = []  # [due_time, callback]
+        self.physics = PhysicsStore()  # Rows for the player, boss and enemies
+        self.enemy_pool = EnemyPool(self.rng)  # Enemy bodies reused across stages and restarts
+        self.systems = TickScheduler()
+        self.add_systems()
+        self.reset()
+
+    @property
+    def scale_x(self):
+        return self.width / BASE_WIDTH
+
+    @property
+    def scale_y(self):
+        return self.height / BASE_HEIGHT
+
+    def emit(self, name):
+        self.events.append(name)
+
+    def drain_events(self):
+        events, self.events = self.events, []
+        return events
+
+    def schedule(self, delay, callback):
+        """Run callback once after delay seconds of simulated time."""
+        self.timers.append([self.time + delay, callback])
+
+    def run_timers(self):
+        due = [timer for timer in self.timers if timer[0] <= self.time]
+        if due:
+            self.timers = [timer for timer in self.timers if timer[0] > self.time]
+            for _, callback in due:
+                callback()
+
+    # Stage flow
+
+    def reset(self):
+        """Start over from stage 1 with a fresh player."""
+        self.physics.clear()
+        self.active = True
+        self.outcome = None  # 'victory' or 'game_over' once the run ends
+        self.score = 0
+        self.stage_number = 1
+        self.boss = None
+        self.portal = None
+        self.projectiles.clear()
+        self.timers = []
+        self.attack_cooldown = 0.1
+        self.last_attack_time = -self.attack_cooldown
+        self.on_platform = False
+        self.walk_sound_playing = False
+        self.last_enemy_death_pos = [self.width - 60, 10]
+        self.build_stage()
+        self.player = None
+        if self.ENABLE_PLAYER:
+            self.player = PlayerBody(100 * self.scale_x, 0, 80 * self.scale_x, 80 * self.scale_y,
+                                     health=self.initial_player_hp)
+            self.physics.add(self.player)
+            self.emit('spawn')
+        self.start_stage_boss()
+
+    def next_stage(self):
+        if self.stage_number >= self.MAX_STAGES:
+            return
+        self.stage_number += 1
+        self.projectiles.clear()
+        self.portal = None
+        self.build_stage()
+        if self.player:
+            self.player.pos = (100 * self.scale_x, 0)
+            self.player.snap()
+            self.player.velocity_x = 0
+            self.player.velocity_y = 0
+        self.emit('stage')
+        self.start_stage_boss()
+
+    def start_stage_boss(self):
+        if self.stage_number == self.BOSS_STAGE and self.ENABLE_BOSS and not self.boss:
+            self.spawn_boss()
+
+    def resize(self, width, height):
+        """Rebuild the stage for a new window size, keeping the player, boss and portal."""
+        self.width = width
+        self.height = height
+        self.build_stage(announce=False)
+        if self.player:
+            self.player.pos = (100 * self.scale_x, 0)
+            self.player.size = (80 * self.scale_x, 80 * self.scale_y)
+            self.player.snap()
+        if self.portal:
+            self.spawn_portal(cue_music=False)
+        if self.boss:
+            self.boss.size = (60 * self.scale_x, 80 * self.scale_y)
+            self.boss.pos = (self.width - 60 * self.scale_x, self.boss.y)
+            self.boss.snap()
+
+    def build_stage(self, announce=True):
+        self.platforms = self.spawn_platforms()
+        self.physics.set_platforms(self.platforms)
+        for enemy in self.enemies:
+            self.physics.remove(enemy)
+            self.enemy_pool.release(enemy)
+        self.enemies = []
+        if self.ENABLE_ENEMIES:
+            self.spawn_initial_enemies()
+            if self.stage_number == self.BOSS_STAGE and self.ENABLE_BOSS:
+                for enemy_class in (EnemyBody, FlyingEnemyBody):
+                    self.enemy_pool.prewarm(enemy_class, self.SUMMON_RESERVE)
+            if announce:
+                for _ in self.enemies:
+                    self.emit('spawn')
+
+    def spawn_platforms(self):
+        """Random platforms scaled to the world size, kept below the HUD."""
+        platform_width = self.PLATFORM_WIDTH * self.scale_x
+        platform_height = self.PLATFORM_HEIGHT * self.scale_y
+        buffer_zone = self.BUFFER_ZONE * self.scale_x
+        # Leave room for the HP hearts (55) and the score text (25)
+        max_y = self.height - (55 * self.scale_y + 25 * self.scale_y)
+        positions = self.generate_random_platforms(self.NUM_PLATFORMS, platform_width, platform_height,
+                                                   buffer_zone, max_y)
+        print(f"Stage {self.stage_number}: Generated {len(positions)} platforms")
+        return [PlatformBody(x, y, platform_width, platform_height) for x, y in positions]
+
+    def generate_random_platforms(self, num_platforms, platform_width, platform_height, buffer_zone, max_y):
+        """Generate random, non-overlapping platform positions below max_y."""
+        platforms = []
+        for _ in range(num_platforms):
+            attempts = 0
+            while attempts < self.MAX_ATTEMPTS:
+                x = self.rng.uniform(buffer_zone, self.width - platform_width - buffer_zone)
+                y = self.rng.uniform(buffer_zone, max_y - platform_height - buffer_zone)
+                if not self.check_overlap((x, y), platforms, platform_width, platform_height, buffer_zone):
+                    platforms.append((x, y))
+                    break
+                attempts += 1
+            if attempts >= self.MAX_ATTEMPTS:
+                print(f"Stage {self.stage_number}: Could only place {len(platforms)} platforms due to spacing constraints")
+                break
+        return platforms
+
+    @staticmethod
+    def check_overlap(new_platform, existing_platforms, platform_width, platform_height, buffer_zone):
+        """Check if new_platform overlaps with or is too close to existing platforms."""
+        new_x, new_y = new_platform
+        for x, y in existing_platforms:
+            if (new_x - buffer_zone < x + platform_width + buffer_zone and
+                    new_x + platform_width + buffer_zone > x - buffer_zone and
+                    new_y - buffer_zone < y + platform_height + buffer_zone and
+                    new_y + platform_height + buffer_zone > y - buffer_zone):
+                return True
+        return False
+
+    def spawn_initial_enemies(self):
+        """Spawn 5 enemies plus one per stage, about 30% of them flying, from the enemy pool."""
+        enemy_count = 5 + (self.stage_number - 1)
+        width, height = 80 * self.scale_x, 80 * self.scale_y
+        for _ in range(enemy_count):
+            x = self.rng.uniform(0, self.width - width)
+            y = self.rng.uniform(0, self.height - height)
+            enemy_class = FlyingEnemyBody if self.rng.random() < 0.3 else EnemyBody
+            self.add_enemy(self.enemy_pool.acquire(enemy_class, x, y, width, height))
+
+    def add_enemy(self, enemy):
+        self.physics.add(enemy)
+        self.enemies.append(enemy)
+
+    def remove_enemy(self, enemy):
+        self.physics.remove(enemy)
+        self.enemies.remove(enemy)
+        self.enemy_pool.release(enemy)
+
+    def spawn_boss(self):
+        self.boss = BossBody(self.width - 60 * self.scale_x, 0, 240 * self.scale_x, 240 * self.scale_y,
+                             health=150, rng=self.rng)
+        self.boss.velocity_x = -1 * self.scale_x
+        self.physics.add(self.boss)
+        self.emit('spawn')
+
+    def spawn_portal(self, cue_music=True):
+        """Place the portal at the last enemy death position."""
+        x = max(0, min(self.last_enemy_death_pos[0] * self.scale_x, self.width - 80 * self.scale_x))
+        y = max(0, min(self.last_enemy_death_pos[1] * self.scale_y, self.height - 240 * self.scale_y))
+        self.portal = PortalBody(x, y)
+        if cue_music and self.stage_number < self.MAX_STAGES:
+            self.emit('portal')
+
+    # Input
+
+    def jump(self):
+        if self.player and self.can_jump(self.player):
+            self.player.velocity_y = 10 * self.scale_y
+            self.emit('jump')
+
+    def walk(self, direction):
+        """Walk left (-1) or right (1)."""
+        if not self.player:
+            return
+        self.player.velocity_x = direction * 5 * self.scale_x
+        if not self.walk_sound_playing and self.on_platform:
+            self.emit('walk')
+            self.walk_sound_playing = True
+
+    def stop_walking(self):
+        if self.player:
+            self.player.velocity_x = 0
+            self.walk_sound_playing = False
+
+    def shoot(self, target_pos):
+        if not self.active or not self.player or self.time - self.last_attack_time < self.attack_cooldown:
+            return
+        start_pos = (self.player.x + self.player.width, self.player.y + self.player.height / 2)
+        self.projectiles.spawn(PLAYER, start_pos, target_pos, 15 * self.scale_x, (10, 3))
+        self.last_attack_time = self.time
+        self.emit('shoot')
+
+    def add_enemy_projectile(self, start_pos, target_pos):
+        self.projectiles.spawn(ENEMY, start_pos, target_pos, 5, (8, 8))
+
+    # Simulation
+
+    def advance(self, elapsed):
+        """Simulate elapsed seconds of real time in fixed TICK steps.
+
+        Leftover time carries over to the next call. A frame that would need
+        more than MAX_CATCH_UP ticks drops the rest, so a stall slows the game
+        down instead of snowballing. Returns how far (0..1) the leftover is
+        into the next tick, for interpolating what is drawn.
+        """
+        self.accumulator += elapsed
+        steps = 0
+        while self.accumulator >= self.TICK and steps < self.MAX_CATCH_UP:
+            self.step(self.TICK)
+            self.accumulator -= self.TICK
+            steps += 1
+        if self.accumulator >= self.TICK:
+            self.dropped_time += self.accumulator - self.accumulator % self.TICK
+            self.accumulator %= self.TICK
+        return self.accumulator / self.TICK
+
+    def step(self, dt=TICK):
+        """Advance the simulation by one tick, running the systems in order."""
+        if not self.active:
+            return
+        self.time += dt
+        self.ticks += 1
+        self.physics.snap()
+        self.projectiles.snap()
+        self.systems.tick(dt)
+
+    def add_systems(self):
+        self.systems.add('timers', lambda dt: self.run_timers())
+        if self.ENABLE_ENEMIES:
+            self.systems.add('enemy_ai', self.update_enemy_ai, divisor=self.AI_DIVISOR)
+            self.systems.add('flying', self.update_flying)
+        self.systems.add('physics', self.update_physics)
+        if self.ENABLE_PLAYER:
+            self.systems.add('player', self.update_player)
+        if self.ENABLE_BOSS:
+            self.systems.add('boss', self.update_boss)
+        if self.ENABLE_ATTACKS:
+            self.systems.add('attacks', self.update_attacks)
+        if self.ENABLE_ENEMIES:
+            self.systems.add('enemies', lambda dt: self.update_enemies())
+        self.systems.add('stage_flow', lambda dt: self.update_stage_flow())
+
+    def update_enemy_ai(self, dt):
+        for enemy in self.enemies[:]:
+            enemy.update_ai(self, dt)
+        self.separate_enemies()
+
+    def separate_enemies(self):
+        """Push every pair of enemies closer than SEPARATION widths apart, once per pair.
+
+        Each enemy moves 2 px/tick away from each crowding neighbor, and
+        hops if the neighbor is at about its height. The grid limits the
+        pairs looked at to enemies within reach.
+        """
+        if len(self.enemies) < 2:
+            return
+        physics = self.physics
+        rows = np.array([enemy.row for enemy in self.enemies])
+        x, y = physics.x[rows], physics.y[rows]
+        width, height = physics.w[rows], physics.h[rows]
+        i, j = self.enemy_grid.neighbors(x, y, self.SEPARATION * width.max())
+        dx, dy = x[j] - x[i], y[j] - y[i]
+        distance = np.maximum(np.hypot(dx, dy), 0.001)
+        close = distance < self.SEPARATION * width[i]
+        if not close.any():
+            return
+        i, j, dx, dy, distance = i[close], j[close], dx[close], dy[close], distance[close]
+        push = dx / distance * 2
+        old_vx = physics.vx[rows]
+        vx = old_vx.copy()
+        np.subtract.at(vx, i, push)
+        np.add.at(vx, j, push)
+        physics.vx[rows] = vx
+        # Set facing the way the velocity_x setter would: right unless now moving left
+        changed = vx != old_vx
+        physics.facing[rows[changed]] = vx[changed] >= 0
+        level = np.abs(dy) < height[i] * 2
+        hops = np.bincount(np.concatenate((i[level], j[level])), minlength=len(rows))
+        for index in np.flatnonzero(hops).tolist():
+            self.enemies[index].jump_apart(self)
+
+    def update_flying(self, dt):
+        for enemy in self.enemies:
+            if isinstance(enemy, FlyingEnemyBody):
+                enemy.update_flying(self, dt)
+
+    def update_physics(self, dt):
+        """Gravity, movement, window bounds and platform landing for every character at once."""
+        self.physics.step(self.width, self.height, self.GRAVITY * self.scale_y)
+
+    def update_player(self, dt):
+        if self.player:
+            self.on_platform = self.physics.grounded.item(self.player.row)
+
+    def update_boss(self, dt):
+        if self.boss:
+            self.boss.update(self, dt)
+            if self.boss.health <= 0 and not self.portal:
+                self.spawn_portal()
+
+    def update_stage_flow(self):
+        """Open the portal once a stage is cleared, take it, and end the run."""
+        if self.ENABLE_ENEMIES and not self.enemies and not self.boss and not self.portal:
+            self.spawn_portal()
+
+        if self.portal and self.player and Hitbox.collide(self.player.get_hitbox_rect(), self.portal.get_hitbox_rect()):
+            self.next_stage()
+
+        if self.stage_number == self.MAX_STAGES and not self.enemies and not self.boss:
+            self.finish('victory')
+        elif self.player and self.player.health <= 0:
+            self.finish('game_over')
+
+    def finish(self, outcome):
+        self.active = False
+        self.outcome = outcome
+        self.emit('victory' if outcome == 'victory' else 'die')
+
+    def can_jump(self, body):
+        on_ground = body.y <= 0
+        return (on_ground or self.is_on_platform(body)) and abs(body.velocity_y) < 0.01
+
+    def is_on_platform(self, body):
+        """Whether body rests on a platform: the one it landed on last tick, else any the index finds."""
+        if body.velocity_y > 0:
+            return False
+        rect = body.get_hitbox_rect()
+        platforms = self.physics.platforms
+        contact = body.store.contact.item(body.row) if body.store is self.physics else -1
+        if contact >= 0 and platforms.supports(contact, rect):
+            return True
+        return any(platforms.supports(i, rect) for i in platforms.overlapping(rect.x, rect.right))
+
+    def update_attacks(self, dt):
+        """Move every shot, then resolve hits on the boss, enemies and player and shots that meet."""
+        shots = self.projectiles
+        shots.move(dt, self.width, self.height)
+        n = shots.count
+        if not n:
+            return
+        dead = np.zeros(n, dtype=bool)
+        owner = shots.owner[:n]
+        player_shots = np.flatnonzero(owner == PLAYER)
+        enemy_shots = np.flatnonzero(owner == ENEMY)
+
+        size = shots.HITBOX_SIZE
+        if len(player_shots) and self.physics.count:
+            # Grid pairs of player shots and character hitboxes; each shot resolves boss first, then enemies
+            physics = self.physics
+            n = physics.count
+            self.character_grid.build(physics.x[:n] + physics.hx[:n], physics.y[:n] + physics.hy[:n],
+                                      physics.hw[:n], physics.hh[:n])
+            boxes = np.full(len(player_shots), float(size))
+            shot_index, rows = self.character_grid.pairs(shots.x[player_shots], shots.y[player_shots], boxes, boxes)
+            targets = [physics.bodies[row] for row in rows]
+            for i, group in groupby(zip(shot_index.tolist(), targets), key=itemgetter(0)):
+                hit = [body for _, body in group]
+                row = player_shots[i]
+                if self.boss and self.boss in hit:
+                    self.boss.health -= 1
+                    dead[row] = True
+                    if self.boss.health <= 0:
+                        self.physics.remove(self.boss)
+                        self.boss = None
+                        self.score += 50
+                elif self.ENABLE_ENEMIES:
+                    enemies = [body for body in hit if body in self.enemies]
+                    if enemies:
+                        enemy = min(enemies, key=self.enemies.index)
+                        enemy.take_damage(100)
+                        dead[row] = True
+                        if enemy.health <= 0:
+                            self.remove_enemy(enemy)
+                            self.emit('enemy_died')
+                            self.score += 100
+                            self.last_enemy_death_pos = [enemy.x / self.scale_x, enemy.y / self.scale_y]
+
+        if self.player and len(enemy_shots):
+            hit = enemy_shots[shots.hits(enemy_shots, self.player.get_hitbox_rect())]
+            for _ in hit:
+                self.player.take_damage(1)
+            dead[hit] = True
+
+        # Shots that meet cancel each other out, each player shot taking the first enemy shot it meets
+        player_shots = player_shots[~dead[player_shots]]
+        enemy_shots = enemy_shots[~dead[enemy_shots]]
+        if len(player_shots) and len(enemy_shots):
+            boxes = np.full(len(enemy_shots), float(size))
+            self.shot_grid.build(shots.x[enemy_shots], shots.y[enemy_shots], boxes, boxes)
+            boxes = np.full(len(player_shots), float(size))
+            pairs = self.shot_grid.pairs(shots.x[player_shots], shots.y[player_shots], boxes, boxes)
+            for i, j in zip(*(index.tolist() for index in pairs)):
+                player_row, enemy_row = player_shots[i], enemy_shots[j]
+                if not dead[player_row] and not dead[enemy_row]:
+                    dead[player_row] = dead[enemy_row] = True
+
+        shots.remove(dead)
+
+    def broadphase_report(self):
+        """Candidate pairs, real hits and time spent in each collision grid so far."""
+        lines = [f"{'grid':<12}{'queries':>9}{'candidates':>12}{'hits':>8}{'last cand':>11}{'last hits':>11}{'ms':>10}"]
+        for name, grid in (('characters', self.character_grid), ('shots', self.shot_grid)):
+            stats = grid.stats()
+            lines.append(f"{name:<12}{stats['queries']:>9}{stats['candidate_pairs']:>12}{stats['hits']:>8}"
+                         f"{stats['last_candidate_pairs']:>11}{stats['last_hits']:>11}{stats['time_ms']:>10.3f}")
+        return '\n'.join(lines)
+
+    def update_enemies(self):
+        """Enemies that touch the player hurt them and are used up."""
+        for enemy in self.enemies[:]:
+            if self.player and Hitbox.collide(self.player.get_hitbox_rect(), enemy.get_hitbox_rect()):
+                self.player.take_damage(1)
+                self.last_enemy_death_pos = [enemy.x / self.scale_x, enemy.y / self.scale_y]
+                self.remove_enemy(enemy)
+            elif enemy.x < -enemy.width:
+                self.remove_enemy(enemy)
@@ -1,3 +1,4 @@
+from components.startup import StartupReport
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.button import Button
 from kivy.uix.label import Label
@@ -6,13 +7,17 @@ from kivy.uix.popup import Popup
 from kivy.app import App
 from kivy.core.window import Window
 from kivy.graphics import Color, Rectangle
-from kivy.clock import Clock
 from kivy.properties import ListProperty, NumericProperty
-from components.background import GifLoader
-from components.game import Game
+from components.gif_loader import GifLoader
 from components.music_manager import MusicManager
+from components.preloader import LoadingScreen
+from components.lifecycle import Lifecycle
 import os
 
+StartupReport.mark('imports')
+
+MENU_BACKGROUND_GIF = os.path.join(os.path.dirname(__file__), 'assets', 'gifs', 'darkforest.gif')
+
 class MainMenu(BoxLayout):
     current_frame = NumericProperty(0)
     textures = ListProperty([])
@@ -22,8 +27,11 @@ class MainMenu(BoxLayout):
         self.orientation = 'vertical'
         self.padding = 50
         self.spacing = 20  # คงระยะห่างระหว่างปุ่มไว้
+        self.lifecycle = Lifecycle()
         self.music_manager = MusicManager()
         self.music_manager.play_menu_music()
+        # Stage 1 music loads in the background while the menu is open
+        self.music_manager.prefetch(MusicManager.music_for_stage(1))
 
         # Load background GIF
         self.load_background_gif()
@@ -70,14 +78,13 @@ class MainMenu(BoxLayout):
         self.add_widget(self.exit_button)
 
         # Bind window resize to update background
-        Window.bind(on_resize=self.on_window_resize)
+        self.lifecycle.bind(Window, on_resize=self.on_window_resize)
 
     def load_background_gif(self):
         """Load and animate the background GIF."""
         try:
-            gif_path = os.path.join(os.path.dirname(__file__), 'assets', 'gifs', 'darkforest.gif')
-            frames = GifLoader.load_gif_frames(gif_path)
-            self.textures = GifLoader.create_textures(frames)
+            # Already decoded and uploaded by the LoadingScreen when the file exists
+            self.textures = GifLoader.load_clip(MENU_BACKGROUND_GIF).textures
             if self.textures:
                 self.size = Window.size
                 with self.canvas.before:
@@ -88,7 +95,7 @@ class MainMenu(BoxLayout):
                         texture=self.textures[0]
                     )
                 self.bind(size=self._update_rect, pos=self._update_rect)
-                Clock.schedule_interval(self.update_background, 0.1)
+                self.lifecycle.schedule_interval(self.update_background, 0.1)
             else:
                 raise ValueError("No textures loaded for background")
         except Exception as e:
@@ -120,8 +127,12 @@ class MainMenu(BoxLayout):
     def start_game(self, instance):
         """Start the game by switching to the Game widget."""
         self.music_manager.stop_music()
+        # The menu is discarded; stop its background animation and resize handler
+        self.lifecycle.dispose()
         app = App.get_running_app()
         app.root.clear_widgets()
+        # Gameplay modules load on first start, not before the menu is shown
+        from components.game import Game
         game = Game(music_manager=self.music_manager)
         app.root.add_widget(game)
 
@@ -172,7 +183,22 @@ class MainMenu(BoxLayout):
 class DinoApp(App):
     def build(self):
         Window.size = (1280, 720)
-        return MainMenu()
+        # The root only hosts screens; assets load behind the loading screen first
+        root = BoxLayout()
+        root.add_widget(LoadingScreen(on_complete=lambda: self.show_main_menu(root),
+                                      gif_paths=[MENU_BACKGROUND_GIF]))
+        StartupReport.mark('build')
+        Window.bind(on_flip=self.on_first_frame)
+        return root
+
+    def on_first_frame(self, window):
+        Window.unbind(on_flip=self.on_first_frame)
+        StartupReport.mark('first_frame')
+        StartupReport.report()
+
+    def show_main_menu(self, root):
+        root.clear_widgets()
+        root.add_widget(MainMenu())
 
 if __name__ == '__main__':
     from kivy.config import Config
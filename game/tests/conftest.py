@@ -0,0 +1,9 @@
+# conftest.py
+# Run from the game directory: python -m pytest -q
+# Like the benchmarks, uses Kivy's mock GL backend and imports components from the game directory.
+import os
+import sys
+
+os.environ.setdefault('KIVY_GL_BACKEND', 'mock')
+os.environ['KIVY_NO_ARGS'] = '1'
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -0,0 +1,78 @@
+# test_asset_cache.py
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from components.asset_cache import BakedGifCache, HEADER
+
+@pytest.fixture
+def source(tmp_path):
+    """A stand-in GIF; the cache only hashes and stats the source, it never decodes it."""
+    path = tmp_path / 'walk.gif'
+    path.write_bytes(b'GIF89a frames')
+    return str(path)
+
+@pytest.fixture
+def cache(tmp_path):
+    return BakedGifCache(str(tmp_path / 'cache'))
+
+@pytest.fixture
+def frames():
+    return np.arange(3 * 4 * 5 * 4, dtype=np.uint8).reshape(3, 4, 5, 4)
+
+def set_mtime(path, mtime_ns):
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+def test_baked_frames_read_back(cache, source, frames):
+    assert cache.read(source) is None
+    cache.write(source, frames)
+    baked = cache.read(source)
+    assert np.array_equal(baked, frames)
+    assert baked.flags.writeable
+    assert cache.stats()['cache_reads'] == 1
+
+def test_changed_source_invalidates(cache, source, frames):
+    cache.write(source, frames)
+    with open(source, 'wb') as f:
+        f.write(b'GIF89a FRAMES')  # Same size, new content
+    set_mtime(source, os.stat(source).st_mtime_ns + 10 ** 9)
+    assert cache.read(source) is None
+    with open(source, 'ab') as f:
+        f.write(b'!')
+    assert cache.read(source) is None
+
+def test_touched_source_stays_valid_and_refreshes_the_header(cache, source, frames, monkeypatch):
+    cache.write(source, frames)
+    mtime_ns = os.stat(source).st_mtime_ns + 10 ** 9
+    set_mtime(source, mtime_ns)
+    assert np.array_equal(cache.read(source), frames)
+    with open(cache.cache_path(source), 'rb') as f:
+        assert HEADER.unpack(f.read(HEADER.size))[2] == mtime_ns
+    # With the header refreshed, the next read trusts mtime and size alone
+    monkeypatch.setattr(BakedGifCache, 'source_hash', pytest.fail)
+    assert np.array_equal(cache.read(source), frames)
+
+@pytest.mark.parametrize('damage', ['magic', 'version', 'truncated'])
+def test_foreign_or_damaged_files_are_ignored(cache, source, frames, damage):
+    cache.write(source, frames)
+    path = Path(cache.cache_path(source))
+    data = bytearray(path.read_bytes())
+    if damage == 'magic':
+        data[:4] = b'NOPE'
+    elif damage == 'version':
+        data[4] ^= 0xFF
+    else:
+        del data[-10:]
+    path.write_bytes(bytes(data))
+    assert cache.read(source) is None
+
+def test_disabled_cache_neither_reads_nor_writes(cache, source, frames):
+    cache.enabled = False
+    cache.write(source, frames)
+    assert not os.path.exists(cache.cache_path(source))
+    cache.enabled = True
+    cache.write(source, frames)
+    cache.enabled = False
+    assert cache.read(source) is None
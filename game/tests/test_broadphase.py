@@ -0,0 +1,69 @@
+# test_broadphase.py
+import numpy as np
+import pytest
+
+from components.broadphase import SpatialHash
+
+def random_boxes(rng, n, extent=1000, largest=150):
+    """Boxes on whole pixels, so some edges touch exactly; a few reach off the left and bottom."""
+    return (rng.integers(-100, extent, n).astype(float), rng.integers(-100, extent, n).astype(float),
+            rng.integers(0, largest, n).astype(float), rng.integers(0, largest, n).astype(float))
+
+def brute_pairs(query, built):
+    """Every (query index, built index) whose boxes overlap, touching edges included."""
+    qx, qy, qw, qh = query
+    bx, by, bw, bh = built
+    return [(i, j) for i in range(len(qx)) for j in range(len(bx))
+            if qx[i] <= bx[j] + bw[j] and qx[i] + qw[i] >= bx[j] and
+            qy[i] <= by[j] + bh[j] and qy[i] + qh[i] >= by[j]]
+
+@pytest.mark.parametrize('seed', range(5))
+@pytest.mark.parametrize('cell_size', [16, 64, 300])
+def test_pairs_match_brute_force(seed, cell_size):
+    rng = np.random.default_rng(seed)
+    built, query = random_boxes(rng, 120), random_boxes(rng, 80)
+    grid = SpatialHash(cell_size=cell_size)
+    grid.build(*built)
+    i, j = grid.pairs(*query)
+    assert list(zip(i.tolist(), j.tolist())) == brute_pairs(query, built)
+    assert grid.last_hits == len(i) <= grid.last_candidates
+
+def test_touching_edges_overlap():
+    grid = SpatialHash(cell_size=10)
+    grid.build(np.array([0.0]), np.array([0.0]), np.array([10.0]), np.array([10.0]))
+    i, j = grid.pairs(np.array([10.0, 10.5]), np.array([10.0, 0.0]), np.array([5.0, 5.0]), np.array([5.0, 5.0]))
+    assert (i.tolist(), j.tolist()) == ([0], [0])
+
+def test_pairs_with_nothing_built_or_queried():
+    grid = SpatialHash()
+    empty = (np.zeros(0),) * 4
+    one = (np.zeros(1),) * 4
+    assert all(len(side) == 0 for side in grid.pairs(*one))
+    grid.build(*one)
+    assert all(len(side) == 0 for side in grid.pairs(*empty))
+    assert grid.stats()['queries'] == 2
+
+def brute_neighbors(x, y, radius):
+    return {(i, j) for i in range(len(x)) for j in range(i + 1, len(x))
+            if np.hypot(x[j] - x[i], y[j] - y[i]) < radius}
+
+@pytest.mark.parametrize('count', [0, 1, 5, SpatialHash.DIRECT_BELOW - 1, SpatialHash.DIRECT_BELOW, 300])
+def test_neighbors_match_brute_force_on_both_paths(count):
+    rng = np.random.default_rng(count)
+    x, y = rng.uniform(0, 1280, count), rng.uniform(0, 720, count)
+    radius = 240
+    i, j = SpatialHash(cell_size=radius).neighbors(x, y, radius)
+    found = list(zip(i.tolist(), j.tolist()))
+    assert len(found) == len(set(found))
+    assert set(found) == brute_neighbors(x, y, radius)
+    assert all(a < b for a, b in found)
+
+@pytest.mark.parametrize('count', [3, 30])
+def test_neighbors_exclude_points_exactly_radius_apart(count):
+    x = np.arange(count) * 10.0
+    y = np.zeros(count)
+    i, j = SpatialHash(cell_size=10).neighbors(x, y, 10)
+    assert len(i) == 0
+    x[1] = x[0]
+    i, j = SpatialHash(cell_size=10).neighbors(x, y, 10)
+    assert list(zip(i.tolist(), j.tolist())) == [(0, 1)]
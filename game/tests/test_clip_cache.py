@@ -0,0 +1,96 @@
+# test_clip_cache.py
+from components.gif_loader import AnimationClip, ClipCache
+
+MB = 1024 * 1024
+
+def clip(path, nbytes=MB, atlas=None):
+    return AnimationClip(path, [], [], nbytes=nbytes, atlas=atlas)
+
+def test_get_counts_hits_and_misses():
+    cache = ClipCache()
+    walk = clip('walk')
+    cache.put(walk)
+    assert cache.get('walk') is walk
+    assert cache.get('jump') is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_least_recently_used_clip_is_evicted_over_budget():
+    cache = ClipCache(budget_bytes=3 * MB)
+    for path in ('a', 'b', 'c'):
+        cache.put(clip(path))
+    cache.get('a')
+    cache.put(clip('d'))
+    assert list(cache.clips) == ['c', 'a', 'd']
+    assert (cache.bytes, cache.evictions) == (3 * MB, 1)
+
+def test_newest_clip_stays_even_over_budget():
+    cache = ClipCache(budget_bytes=MB)
+    cache.put(clip('small'))
+    cache.put(clip('huge', nbytes=5 * MB))
+    assert list(cache.clips) == ['huge']
+    assert cache.bytes == 5 * MB
+
+def test_replacing_a_clip_recharges_it():
+    cache = ClipCache()
+    cache.put(clip('a', nbytes=MB))
+    cache.put(clip('a', nbytes=2 * MB))
+    assert len(cache.clips) == 1 and cache.bytes == 2 * MB
+
+def test_lowering_the_budget_evicts():
+    cache = ClipCache()
+    for path in ('a', 'b', 'c'):
+        cache.put(clip(path))
+    cache.set_budget(MB)
+    assert list(cache.clips) == ['c']
+    cache.clear()
+    assert cache.stats()['clips'] == cache.stats()['bytes'] == 0
+
+class Atlas:
+    """Stands in for a TextureAtlas: the cache only needs its size and identity."""
+
+    def __init__(self, nbytes):
+        self.nbytes = nbytes
+
+def test_atlas_pages_are_charged_once():
+    cache = ClipCache()
+    atlas = Atlas(4 * MB)
+    for path in ('dino', 'turtle', 'portal'):
+        cache.put(clip(path, atlas=atlas))
+    assert cache.bytes == 4 * MB
+    assert cache.stats()['atlases'] == 1
+    cache.discard('dino')
+    cache.discard('turtle')
+    assert cache.bytes == 4 * MB
+    cache.discard('portal')
+    assert cache.bytes == 0 and cache.atlases == {}
+
+def test_getting_one_member_touches_the_whole_atlas():
+    cache = ClipCache(budget_bytes=5 * MB)
+    atlas = Atlas(4 * MB)
+    cache.put(clip('dino', atlas=atlas))
+    cache.put(clip('turtle', atlas=atlas))
+    cache.put(clip('boss'))
+    cache.get('turtle')
+    assert list(cache.clips) == ['boss', 'dino', 'turtle']
+    cache.put(clip('menu'))
+    assert list(cache.clips) == ['dino', 'turtle', 'menu']
+
+def test_an_atlas_is_evicted_whole():
+    cache = ClipCache(budget_bytes=5 * MB)
+    atlas = Atlas(4 * MB)
+    cache.put(clip('dino', atlas=atlas))
+    cache.put(clip('turtle', atlas=atlas))
+    cache.put(clip('boss', nbytes=2 * MB))
+    assert list(cache.clips) == ['boss']
+    assert (cache.bytes, cache.evictions, cache.atlases) == (2 * MB, 2, {})
+
+def test_joining_an_atlas_touches_its_older_members():
+    cache = ClipCache(budget_bytes=6 * MB)
+    atlas = Atlas(4 * MB)
+    cache.put(clip('dino', atlas=atlas))
+    cache.put(clip('boss', nbytes=2 * MB))
+    cache.put(clip('turtle', atlas=atlas))
+    assert list(cache.clips) == ['boss', 'dino', 'turtle']
+    cache.put(clip('menu'))
+    assert list(cache.clips) == ['dino', 'turtle', 'menu']
+    assert cache.bytes == 5 * MB
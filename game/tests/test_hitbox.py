@@ -0,0 +1,25 @@
+# test_hitbox.py
+from components.bodies import PlayerBody
+from components.hitbox import Hitbox, Rect
+
+def test_get_rect_fills_the_given_rect():
+    hitbox = Hitbox(offset_x=10, offset_y=5, width=60, height=70)
+    out = Rect()
+    assert hitbox.get_rect(100, 200, out=out) is out
+    assert (out.x, out.y, out.right, out.top) == (110, 205, 170, 275)
+
+def test_collide_includes_touching_edges():
+    rect = Rect(0, 0, 10, 10)
+    assert Hitbox.collide(rect, Rect(10, 10, 5, 5))
+    assert not Hitbox.collide(rect, Rect(10.5, 0, 5, 5))
+    assert not Hitbox.collide(rect, Rect(0, -6, 5, 5))
+
+def test_body_rect_is_reused_and_follows_the_body():
+    body = PlayerBody(x=100, y=50)
+    rect = body.get_hitbox_rect()
+    assert (rect.x, rect.y, rect.width, rect.height) == (110, 50, 60, 80)
+    body.pos = (200, 60)
+    assert body.get_hitbox_rect() is rect
+    assert (rect.x, rect.y) == (210, 60)
+    body.hitbox = Hitbox(offset_x=0, offset_y=0, width=80, height=80)
+    assert (body.get_hitbox_rect().x, rect.width) == (200, 80)
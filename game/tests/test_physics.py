@@ -0,0 +1,134 @@
+# test_physics.py
+import random
+
+import numpy as np
+import pytest
+
+from components.bodies import PlayerBody, EnemyBody, FlyingEnemyBody, PlatformBody
+from components.physics import PhysicsStore, PlatformIndex
+
+WIDTH, HEIGHT, GRAVITY = 800, 600, 0.5
+
+def stored(*bodies):
+    store = PhysicsStore(capacity=2)
+    for body in bodies:
+        store.add(body)
+    return store
+
+def test_add_moves_rows_and_grows():
+    bodies = [PlayerBody(x=i * 10, y=i) for i in range(5)]
+    store = stored(*bodies)
+    assert store.count == 5 and store.capacity == 8
+    assert [body.row for body in bodies] == [0, 1, 2, 3, 4]
+    assert all(body.store is store for body in bodies)
+    assert store.x[:5].tolist() == [0, 10, 20, 30, 40]
+    store.add(bodies[0])
+    assert store.count == 5
+
+def test_remove_moves_last_row_into_the_gap_and_keeps_state():
+    first, middle, last = PlayerBody(x=1), PlayerBody(x=2), PlayerBody(x=3)
+    store = stored(first, middle, last)
+    middle.velocity_x = -4
+    store.remove(middle)
+    assert store.count == 2
+    assert store.bodies == [first, last]
+    assert last.row == 1 and store.x[1] == 3
+    assert middle.store is not store
+    assert (middle.x, middle.velocity_x, middle.facing_right) == (2, -4, False)
+
+def test_step_integrates_and_clamps_to_the_window():
+    walker, bouncer = PlayerBody(x=5, y=100), EnemyBody(x=5, y=100, rng=random.Random(1))
+    store = stored(walker, bouncer)
+    walker.velocity_x = bouncer.velocity_x = -10
+    store.step(WIDTH, HEIGHT, GRAVITY)
+    assert walker.x == bouncer.x == 0
+    assert walker.velocity_x == 0
+    assert bouncer.velocity_x == 10 and bouncer.facing_right
+    assert walker.velocity_y == -GRAVITY and walker.y == 100 - GRAVITY
+
+def test_flyers_ignore_gravity_and_keep_their_y():
+    flyer = FlyingEnemyBody(x=100, y=300, rng=random.Random(1))
+    store = stored(flyer)
+    flyer.velocity_x = 2
+    store.step(WIDTH, HEIGHT, GRAVITY)
+    assert (flyer.x, flyer.y, flyer.velocity_y) == (102, 300, 0)
+
+def test_bodies_stop_on_the_ground():
+    body = PlayerBody(x=100, y=0.2)
+    store = stored(body)
+    body.velocity_y = -5
+    store.step(WIDTH, HEIGHT, GRAVITY)
+    assert (body.y, body.velocity_y) == (0, 0)
+    assert store.grounded[body.row]
+
+@pytest.mark.parametrize('start, value, facing', [(3, 0, True), (-3, 0, True), (0, -2, False), (-2, -2, False)])
+def test_velocity_x_faces_the_way_it_changed(start, value, facing):
+    """Like the Kivy on_velocity_x observer it replaced: on change, face right unless moving left."""
+    body = PlayerBody()
+    body.velocity_x = start
+    body.facing_right = not facing
+    body.velocity_x = value
+    assert body.facing_right == (facing if value != start else not facing)
+
+def platform_stage(rng, count=30):
+    """Platforms in World order, many overlapping, with tops close enough that several can hold one body."""
+    tops = [100, 105, 200, 204, 300]
+    return [PlatformBody(float(rng.integers(0, 700)), float(rng.choice(tops)) - 20,
+                         float(rng.integers(60, 200)), 20) for _ in range(count)]
+
+def falling_bodies(rng, platforms, count):
+    bodies = []
+    for _ in range(count):
+        platform = platforms[rng.integers(len(platforms))]
+        body = PlayerBody(x=float(rng.uniform(platform.x - 60, platform.x + platform.width)),
+                          y=float(platform.y + platform.height + rng.uniform(-5, 15)))
+        body.velocity_y = float(rng.uniform(-6, 1))
+        bodies.append(body)
+    return bodies
+
+def landing_store(seed, scalar_rows, count=40):
+    rng = np.random.default_rng(seed)
+    platforms = platform_stage(rng)
+    store = stored(*falling_bodies(rng, platforms, count))
+    store.set_platforms(platforms)
+    store.SCALAR_ROWS = scalar_rows
+    return store
+
+@pytest.mark.parametrize('seed', range(5))
+@pytest.mark.parametrize('count', [3, 40])
+def test_vectorized_land_matches_land_each(seed, count):
+    vectorized = landing_store(seed, scalar_rows=0, count=count)
+    scalar = landing_store(seed, scalar_rows=10 ** 6, count=count)
+    for _ in range(30):
+        vectorized.step(WIDTH, HEIGHT, GRAVITY)
+        scalar.step(WIDTH, HEIGHT, GRAVITY)
+        n = vectorized.count
+        for name in ('x', 'y', 'vx', 'vy', 'grounded', 'contact'):
+            assert getattr(vectorized, name)[:n].tolist() == getattr(scalar, name)[:n].tolist(), name
+    assert vectorized.grounded[:n].any()
+    assert vectorized.contact_hits == scalar.contact_hits > 0
+
+@pytest.mark.parametrize('scalar_rows', [0, 10 ** 6])
+def test_latest_platform_in_world_order_wins(scalar_rows):
+    platforms = [PlatformBody(100, 80, 100, 20), PlatformBody(100, 75, 100, 20), PlatformBody(50, 83, 100, 20)]
+    body = PlayerBody(x=120, y=101)
+    store = stored(body)
+    store.set_platforms(platforms)
+    store.SCALAR_ROWS = scalar_rows
+    body.velocity_y = -2
+    store.step(WIDTH, HEIGHT, GRAVITY)
+    assert store.platforms.ids[store.contact[body.row]] == 2
+    assert (body.y, body.velocity_y) == (103, 0)
+
+def test_platform_index_overlapping_matches_brute_force():
+    rng = np.random.default_rng(7)
+    platforms = platform_stage(rng, count=50)
+    index = PlatformIndex(platforms)
+    for x0 in range(-100, 900, 37):
+        x1 = x0 + 50
+        found = sorted(index.ids[i] for i in index.overlapping(x0, x1))
+        expected = [k for k, platform in enumerate(platforms)
+                    if platform.x <= x1 and platform.x + platform.width >= x0]
+        assert found == expected
+        lo, hi = index.spans(np.array([x0]), np.array([x1]))
+        assert set(index.overlapping(x0, x1)) <= set(range(lo[0], hi[0]))
@@ -0,0 +1,67 @@
+# test_pool.py
+import random
+
+from components.bodies import EnemyBody, FlyingEnemyBody
+from components.pool import EnemyPool
+from components.world import World
+
+def test_acquire_builds_until_bodies_are_released():
+    pool = EnemyPool(random.Random(1))
+    first = pool.acquire(EnemyBody, 10, 20)
+    second = pool.acquire(EnemyBody, 30, 40)
+    assert first is not second
+    assert pool.stats() == {'created': 2, 'reused': 0, 'released': 0, 'idle': 0}
+    pool.release(first)
+    assert pool.acquire(EnemyBody, 50, 60) is first
+    assert pool.stats() == {'created': 2, 'reused': 1, 'released': 1, 'idle': 0}
+
+def test_reused_body_is_reset_like_a_new_one():
+    pool = EnemyPool(random.Random(1))
+    body = pool.acquire(EnemyBody, 10, 20)
+    body.take_damage(100)
+    body.velocity_x, body.velocity_y = -3, 4
+    body.last_attack_time = 9
+    body.wander_target = (1, 2)
+    body.store.contact[body.row] = 3
+    pool.release(body)
+    body = pool.acquire(EnemyBody, 300, 200, 60, 50)
+    fresh = EnemyBody(300, 200, 60, 50, rng=random.Random(1))
+    assert (body.pos, body.size, body.prev_x, body.prev_y) == (fresh.pos, fresh.size, 300, 200)
+    assert (body.velocity_x, body.velocity_y, body.facing_right) == (0, 0, True)
+    assert body.health == body.max_health
+    assert (body.last_attack_time, body.wander_target) == (0, None)
+    assert body.store.contact[body.row] == -1 and not body.store.grounded[body.row]
+    rect, fresh_rect = body.get_hitbox_rect(), fresh.get_hitbox_rect()
+    assert (rect.x, rect.y, rect.width, rect.height) == (fresh_rect.x, fresh_rect.y, fresh_rect.width, fresh_rect.height)
+
+def test_flyer_respawns_around_its_new_height():
+    pool = EnemyPool(random.Random(1))
+    flyer = pool.acquire(FlyingEnemyBody, 10, 20)
+    flyer.time = 5
+    pool.release(flyer)
+    assert pool.acquire(FlyingEnemyBody, 10, 300) is flyer
+    assert (flyer.base_y, flyer.time) == (300, 0)
+
+def test_prewarm_fills_each_class_separately():
+    pool = EnemyPool(random.Random(1))
+    pool.prewarm(EnemyBody, 2)
+    pool.prewarm(EnemyBody, 2)
+    pool.prewarm(FlyingEnemyBody, 1)
+    assert pool.stats()['created'] == 3 and pool.stats()['idle'] == 3
+    assert isinstance(pool.acquire(FlyingEnemyBody, 0, 0), FlyingEnemyBody)
+    assert pool.acquire(FlyingEnemyBody, 0, 0) is not None
+    assert pool.stats()['reused'] == 1
+
+def test_world_reuses_enemies_across_stages():
+    world = World(seed=1)
+    world.next_stage()
+    world.next_stage()
+    stats = world.enemy_pool.stats()
+    assert stats['reused'] > 0
+    live = world.enemies
+    assert len({id(enemy) for enemy in live}) == len(live)
+    assert not any(enemy in live for enemy in world.enemy_pool.idle_bodies())
+    assert all(enemy.store is world.physics for enemy in live)
+    enemy = live[0]
+    world.remove_enemy(enemy)
+    assert enemy in world.enemy_pool.idle_bodies() and enemy.store is not world.physics
@@ -0,0 +1,52 @@
+# test_projectiles.py
+import numpy as np
+import pytest
+
+from components.hitbox import Rect
+from components.projectiles import ProjectileStore, PLAYER, ENEMY
+
+def spawn_row(store, i):
+    """A shot whose x identifies it, flying right."""
+    return store.spawn(PLAYER if i % 2 else ENEMY, (i, 10), (i + 1, 10), 5, (8, 4))
+
+@pytest.mark.parametrize('dead_rows', [[], [0], [4], [1, 3], [0, 1, 2, 3, 4], [3, 4], [0, 4], [2]])
+def test_remove_keeps_exactly_the_live_rows_packed(dead_rows):
+    store = ProjectileStore(capacity=2)
+    for i in range(5):
+        spawn_row(store, i)
+    dead = np.zeros(5, dtype=bool)
+    dead[dead_rows] = True
+    store.remove(dead)
+    n = store.count
+    assert n == 5 - len(dead_rows)
+    assert store.removed == len(dead_rows)
+    survivors = sorted(i for i in range(5) if i not in dead_rows)
+    assert sorted(store.x[:n].tolist()) == survivors
+    # Every column moved with its row
+    for row in range(n):
+        i = int(store.x[row])
+        assert store.owner[row] == (PLAYER if i % 2 else ENEMY)
+        assert (store.vx[row], store.vy[row], store.w[row], store.h[row]) == (5, 0, 8, 4)
+
+def test_remove_fills_holes_from_the_end_without_reordering_the_rest():
+    store = ProjectileStore()
+    for i in range(6):
+        spawn_row(store, i)
+    store.remove(np.array([False, True, False, True, False, False]))
+    assert store.x[:4].tolist() == [0, 4, 2, 5]
+
+def test_move_drops_shots_that_leave_the_window_or_expire():
+    store = ProjectileStore()
+    store.spawn(PLAYER, (10, 10), (20, 10), 5, (8, 4))
+    store.spawn(PLAYER, (98, 10), (120, 10), 5, (8, 4))
+    store.spawn(ENEMY, (50, 50), (50, 60), 1, (8, 4), ttl=0.01)
+    store.move(1 / 60, width=100, height=100)
+    assert store.count == 1
+    assert (store.x[0], store.y[0]) == (15, 10)
+
+def test_hits_uses_the_square_hitbox_not_the_drawn_size():
+    store = ProjectileStore()
+    store.spawn(PLAYER, (0, 0), (1, 0), 1, (100, 100))
+    store.spawn(PLAYER, (30, 0), (31, 0), 1, (100, 100))
+    mask = store.hits(np.arange(2), Rect(25, 0, 10, 10))
+    assert mask.tolist() == [False, True]
@@ -0,0 +1,70 @@
+# test_scheduler.py
+import pytest
+
+from components.scheduler import TickScheduler
+
+def test_systems_run_in_registration_order():
+    scheduler = TickScheduler()
+    order = []
+    for name in ('simulation', 'sprites', 'events'):
+        scheduler.add(name, lambda dt, name=name: order.append(name))
+    scheduler.tick(1 / 60)
+    assert order == ['simulation', 'sprites', 'events']
+    assert scheduler.last_callbacks == 3
+
+def test_divisor_runs_every_nth_tick_with_summed_dt():
+    scheduler = TickScheduler()
+    every, third = [], []
+    scheduler.add('every', every.append)
+    scheduler.add('third', third.append, divisor=3)
+    for _ in range(7):
+        scheduler.tick(0.25)
+    assert every == [0.25] * 7
+    assert third == [0.75, 0.75]
+    assert scheduler.last_callbacks == 1
+    stats = scheduler.stats()
+    assert stats['every']['runs'] == 7
+    assert (stats['third']['divisor'], stats['third']['runs']) == (3, 2)
+
+def test_duplicate_name_is_rejected_and_remove_stops_a_system():
+    scheduler = TickScheduler()
+    ran = []
+    scheduler.add('animation', ran.append)
+    with pytest.raises(ValueError):
+        scheduler.add('animation', ran.append)
+    scheduler.remove('animation')
+    scheduler.tick(1 / 60)
+    assert ran == []
+    assert scheduler.stats() == {}
+
+def test_divisor_below_one_runs_every_tick():
+    scheduler = TickScheduler()
+    ran = []
+    scheduler.add('clamped', ran.append, divisor=0)
+    scheduler.tick(0.5)
+    scheduler.tick(0.5)
+    assert ran == [0.5, 0.5]
+
+@pytest.fixture(scope='module')
+def game():
+    from kivy.lang import Builder
+    Builder.load_file('dino.kv')
+    from components.game import Game
+    game = Game(seed=1, initial_player_hp=10 ** 6)
+    yield game
+    game.dispose()
+    Builder.unload_file('dino.kv')
+
+@pytest.mark.parametrize('fps', [30, 60, 144])
+def test_animation_follows_frame_duration_at_any_render_rate(game, fps):
+    from components.player import Character
+    frames = []
+    game.player.update_frame = lambda dt: frames.append(dt)
+    try:
+        for _ in range(fps * 2):
+            game.update(1 / fps)
+    finally:
+        del game.player.update_frame
+    # Two seconds of play; a step may carry over between runs
+    assert len(frames) in (19, 20, 21)
+    assert set(frames) == {Character.FRAME_DURATION}
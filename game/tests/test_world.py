@@ -0,0 +1,32 @@
+# test_world.py
+import random
+
+from components.bodies import EnemyBody
+from components.world import World
+
+def crowded_world(*positions):
+    world = World(seed=1)
+    for enemy in world.enemies[:]:
+        world.remove_enemy(enemy)
+    rng = random.Random(2)
+    for x, y in positions:
+        world.add_enemy(EnemyBody(x, y, 80, 80, rng=rng))
+    return world
+
+def test_separation_pushes_each_pair_apart_once():
+    world = crowded_world((100, 0), (150, 0), (1000, 0))
+    left, right, far = world.enemies
+    world.separate_enemies()
+    assert (left.velocity_x, right.velocity_x, far.velocity_x) == (-2, 2, 0)
+
+def test_separation_faces_the_way_the_setter_would():
+    """A push that stops an enemy turns it right, as setting velocity_x to 0 does."""
+    world = crowded_world((100, 0), (150, 0), (1000, 0))
+    left, right, far = world.enemies
+    left.velocity_x = 2
+    right.velocity_x = -2
+    far.velocity_x = -1
+    world.separate_enemies()
+    assert (left.velocity_x, right.velocity_x) == (0, 0)
+    assert left.facing_right and right.facing_right
+    assert not far.facing_right